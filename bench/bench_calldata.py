@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+calldata编码微基准 - 对比原来每个账户 contract.functions.claim(...) 全量编码
+与 ClaimCalldataTemplate 替换receiver槽位两种方式
+
+用法: python bench/bench_calldata.py --count 20000
+"""
+
+import argparse
+import json
+import os
+import time
+
+import common  # noqa: F401  把仓库根目录加入 sys.path
+from web3 import Web3
+
+from pharos_bot.calldata import ClaimCalldataTemplate, claim_args
+from pharos_bot.drops import ZENTRA_BADGE
+
+
+def main():
+    parser = argparse.ArgumentParser(description="claim calldata 编码基准")
+    parser.add_argument("--count", type=int, default=20000)
+    args = parser.parse_args()
+
+    drop = ZENTRA_BADGE
+    receivers = [Web3.to_checksum_address("0x" + os.urandom(20).hex()) for _ in range(args.count)]
+
+    # 原路径: 每个账户重建合约对象、校验地址并完整ABI编码
+    w3 = Web3()
+    start = time.perf_counter()
+    legacy = []
+    for receiver in receivers:
+        contract = w3.eth.contract(
+            address=Web3.to_checksum_address(drop.contract),
+            abi=drop.abi
+        )
+        call = contract.functions.claim(*claim_args(receiver, drop.mint_params))
+        legacy.append(call._encode_transaction_data())
+    legacy_seconds = time.perf_counter() - start
+
+    # 模板路径: 编码一次，之后只替换receiver
+    start = time.perf_counter()
+    template = ClaimCalldataTemplate(drop.abi, drop.mint_params)
+    patched = [template.encode_hex(receiver) for receiver in receivers]
+    template_seconds = time.perf_counter() - start
+
+    mismatches = sum(1 for a, b in zip(legacy, patched) if a.lower() != b.lower())
+    print(json.dumps({
+        "count": args.count,
+        "legacy_per_sec": round(args.count / legacy_seconds),
+        "template_per_sec": round(args.count / template_seconds),
+        "speedup": round(legacy_seconds / template_seconds, 1),
+        "mismatches": mismatches,
+    }))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+端到端mint压测 - 在本地模拟链上跑完整的 process_accounts
+部署 Drop 合约、给随机钱包充值，按 RPC延迟 × 出块间隔 × 并发数 的组合逐个测量:
+mints/sec、每次mint的RPC调用数、提交→确认延迟的 p50/p99
+使用本地模拟 JSON-RPC 节点，不会访问真实网络
+
+用法:
+  python bench/bench_concurrency.py --accounts 40 --concurrency 1 8 32 --latency 0.05
+  python bench/bench_concurrency.py --output report.json
+  python bench/bench_concurrency.py --baseline report.json --tolerance 0.2   (吞吐量回退超过20%时退出码为1)
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import platform
+import sys
+import time
+from datetime import datetime
+
+from common import isolate_state, load_script, percentile, quiet
+from mock_rpc import MockRPCNode, make_wallets
+
+SCRIPTS = {
+    "zentra": ("mint-nft(zentra).py", "ZentraTestnetBadgeMinter"),
+    "for": ("mint-nft(for).py", "FaroSwapBadgeMinter"),
+    "all": ("mint-nft(all).py", "AllBadgesMinter"),
+}
+
+
+async def run_once(minter_cls, node: MockRPCNode, keys, concurrency: int, mints_per_account: int = 1) -> dict:
+    minter = minter_cls()
+    minter.RPC_URLS = [node.url]
+    # 模拟链与真实测试网链ID相同，本地状态文件写到临时目录
+    isolate_state(minter)
+    if not await minter.connect_to_network():
+        raise RuntimeError("无法连接模拟节点")
+
+    try:
+        start = time.perf_counter()
+        results = await minter.process_accounts(keys, concurrency, mints_per_account)
+        elapsed = time.perf_counter() - start
+    finally:
+        await minter.close()
+
+    success = sum(1 for r in results if r["success"])
+    return {
+        "concurrency": concurrency,
+        "accounts": len(keys),
+        "drops": len(minter.drops),
+        "success": success,
+        "mints_per_account": mints_per_account,
+        "seconds": round(elapsed, 3),
+        "mints_per_sec": round(success * mints_per_account / elapsed, 2) if elapsed else 0.0,
+        # 客户端统计的各阶段RPC调用 (批量请求按其中的每个调用计数)
+        "rpc_by_phase": minter.metrics.snapshot()["phases"],
+    }
+
+
+def _ms(values, pct: float) -> float:
+    return round(percentile(values, pct) * 1000, 1)
+
+
+def run_scenario(minter_cls, drops, args, latency: float, block_time: float, concurrency: int) -> dict:
+    with MockRPCNode(latency=latency, block_time=block_time) as node:
+        for drop in drops:
+            node.chain.deploy_drop(drop.contract)
+        funding = (args.mints_per_account * len(drops) + 1) * 10 ** 18
+        keys, _ = make_wallets(args.accounts, node.chain, funding)
+        with quiet(not args.verbose):
+            row = asyncio.run(run_once(minter_cls, node, keys, concurrency, args.mints_per_account))
+        mined, confirmed = node.chain.latencies()
+
+    mints = row["success"] * row["mints_per_account"]
+    rpc_calls = sum(node.calls.values())
+    row.update(
+        latency=latency,
+        block_time=block_time,
+        rpc_calls=rpc_calls,
+        http_requests=node.http_requests,
+        rpc_calls_per_mint=round(rpc_calls / mints, 2) if mints else None,
+        http_requests_per_mint=round(node.http_requests / mints, 2) if mints else None,
+        # 提交→打包 只取决于出块间隔；提交→确认 还包含收据轮询的滞后
+        mine_p50_ms=_ms(mined, 50),
+        confirm_p50_ms=_ms(confirmed, 50),
+        confirm_p99_ms=_ms(confirmed, 99),
+        calls_by_method=dict(node.calls),
+    )
+    return row
+
+
+def scenario_key(row: dict) -> tuple:
+    return row["latency"], row["block_time"], row["concurrency"]
+
+
+def compare_baseline(rows, baseline_path: str, tolerance: float) -> list:
+    """与基线报告逐个场景对比，返回吞吐量下降或每次mint的RPC调用增加超过容忍度的场景"""
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = {scenario_key(row): row for row in json.load(f)["runs"]}
+
+    regressions = []
+    for row in rows:
+        old = baseline.get(scenario_key(row))
+        if old is None:
+            continue
+        if old["mints_per_sec"] and row["mints_per_sec"] < old["mints_per_sec"] * (1 - tolerance):
+            regressions.append((row, "mints_per_sec", old["mints_per_sec"], row["mints_per_sec"]))
+        if old.get("rpc_calls_per_mint") and row["rpc_calls_per_mint"] is not None \
+                and row["rpc_calls_per_mint"] > old["rpc_calls_per_mint"] * (1 + tolerance):
+            regressions.append((row, "rpc_calls_per_mint", old["rpc_calls_per_mint"], row["rpc_calls_per_mint"]))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="端到端mint压测")
+    parser.add_argument("--script", choices=SCRIPTS, default="zentra")
+    parser.add_argument("--accounts", type=int, default=40)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--mints-per-account", type=int, default=1)
+    parser.add_argument("--latency", type=float, nargs="+", default=[0.05], help="每个RPC请求注入的延迟(秒)")
+    parser.add_argument("--block-time", type=float, nargs="+", default=[1.0], help="出块间隔(秒)，0表示立即出块")
+    parser.add_argument("--output", help="把完整报告写成JSON文件")
+    parser.add_argument("--baseline", help="与之前 --output 写出的报告对比")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="允许的回退比例")
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    filename, class_name = SCRIPTS[args.script]
+    module = load_script(filename)
+    minter_cls = getattr(module, class_name)
+    drops = minter_cls().drops
+
+    rows = []
+    for latency, block_time, concurrency in itertools.product(args.latency, args.block_time, args.concurrency):
+        row = run_scenario(minter_cls, drops, args, latency, block_time, concurrency)
+        rows.append(row)
+        print(json.dumps(row, ensure_ascii=False))
+
+    if args.output:
+        report = {
+            "script": args.script,
+            "created_at": datetime.now().isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "runs": rows,
+        }
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    if args.baseline:
+        regressions = compare_baseline(rows, args.baseline, args.tolerance)
+        for row, metric, old, new in regressions:
+            print(f"回退: latency={row['latency']} block_time={row['block_time']} "
+                  f"concurrency={row['concurrency']} {metric} {old} -> {new}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+资金钱包补充余额压测 - 一部分钱包余额不够mint，对比有无资金钱包时 process_accounts 的结果:
+成功数、补充阶段的RPC调用数和总耗时
+使用本地模拟 JSON-RPC 节点，不会访问真实网络
+
+用法: python bench/bench_funding.py --accounts 100 --underfunded 0.5 --latency 0.05
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+from eth_account import Account
+
+from common import isolate_state, load_script, quiet
+from mock_rpc import MockRPCNode, make_wallets
+
+
+async def run_once(minter_cls, node: MockRPCNode, keys, treasury_key, args) -> dict:
+    minter = minter_cls()
+    minter.RPC_URLS = [node.url]
+    state_dir = isolate_state(minter)
+    if treasury_key:
+        (state_dir / "treasury_key.txt").write_text(treasury_key + "\n", encoding="utf-8")
+    if not await minter.connect_to_network():
+        raise RuntimeError("无法连接模拟节点")
+    try:
+        start = time.perf_counter()
+        results = await minter.process_accounts(keys, args.concurrency)
+        elapsed = time.perf_counter() - start
+        snapshot = minter.metrics.snapshot()
+    finally:
+        await minter.close()
+    funding = snapshot["phases"].get("funding", {"calls": 0})
+    return {
+        "mode": "treasury" if treasury_key else "no-treasury",
+        "accounts": len(keys),
+        "success": sum(1 for r in results if r["success"]),
+        "funding_rpc_calls": funding["calls"],
+        "total_seconds": round(elapsed, 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="资金钱包补充余额压测")
+    parser.add_argument("--accounts", type=int, default=100)
+    parser.add_argument("--underfunded", type=float, default=0.5, help="余额不足的钱包比例")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--latency", type=float, default=0.05, help="每个RPC请求注入的延迟(秒)")
+    parser.add_argument("--block-time", type=float, default=0.5)
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    minter_cls = getattr(load_script("mint-nft(zentra).py"), "ZentraTestnetBadgeMinter")
+    drops = minter_cls().drops
+    poor = int(args.accounts * args.underfunded)
+
+    for with_treasury in (False, True):
+        with MockRPCNode(latency=args.latency, block_time=args.block_time) as node:
+            for drop in drops:
+                node.chain.deploy_drop(drop.contract)
+            rich_keys, _ = make_wallets(args.accounts - poor, node.chain, 2 * 10 ** 18)
+            poor_keys, _ = make_wallets(poor, node.chain, 10 ** 17)
+            treasury = Account.create()
+            node.chain.fund(treasury.address, 10 ** 18 * (poor + 10))
+            treasury_key = "0x" + bytes(treasury.key).hex() if with_treasury else None
+            with quiet(not args.verbose):
+                row = asyncio.run(run_once(minter_cls, node, rich_keys + poor_keys, treasury_key, args))
+            row["underfunded"] = poor
+            row["rpc_calls"] = sum(node.calls.values())
+            print(json.dumps(row, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
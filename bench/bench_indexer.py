@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+持有者索引压测 - 在模拟链上生成一段claim历史，对比两种 eth_getLogs 回填方式:
+1. fixed-serial: 固定块大小、一次一个请求
+2. adaptive: 自适应块大小、并发请求 (LogBackfill 默认参数)
+节点限制单次查询的区块范围和结果数，测量请求数、被拆分的次数和耗时，
+最后用 BadgeMinter.sync_badge_index 建立索引并与链上的持有者核对，再测一次增量更新
+使用本地模拟 JSON-RPC 节点，不会访问真实网络
+
+用法: python bench/bench_indexer.py --holders 5000 --blocks 50000 --latency 0.05
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+from eth_account import Account
+from web3 import Web3
+
+from common import isolate_state, load_script, quiet
+from mock_rpc import MockRPCNode
+from pharos_bot.indexer import LogBackfill
+from pharos_bot.receipts import TOKENS_CLAIMED_TOPIC, TRANSFER_TOPIC
+
+TOPICS = [[Web3.to_hex(TRANSFER_TOPIC), Web3.to_hex(TOKENS_CLAIMED_TOPIC)]]
+
+
+async def run_backfill(minter, drop, mode: str, head: int, args) -> dict:
+    if mode == "fixed-serial":
+        backfill = LogBackfill(minter.w3, drop.contract_address, TOPICS, chunk_size=args.fixed_chunk,
+                               max_chunk_size=args.fixed_chunk, concurrency=1)
+    else:
+        backfill = LogBackfill(minter.w3, drop.contract_address, TOPICS)
+    start = time.perf_counter()
+    logs = await backfill.fetch(0, head)
+    return {
+        "mode": mode,
+        "logs": len(logs),
+        "requests": backfill.requests,
+        "splits": backfill.splits,
+        "final_chunk": backfill.chunk_size,
+        "seconds": round(time.perf_counter() - start, 3),
+    }
+
+
+async def run(minter_cls, node: MockRPCNode, args):
+    minter = minter_cls()
+    minter.RPC_URLS = [node.url]
+    isolate_state(minter)
+    with quiet(not args.verbose):
+        connected = await minter.connect_to_network()
+    if not connected:
+        raise RuntimeError("无法连接模拟节点")
+    try:
+        drop = minter.drops[0]
+        head = node.chain.head["number"]
+        for mode in ("fixed-serial", "adaptive"):
+            print(json.dumps(await run_backfill(minter, drop, mode, head, args), ensure_ascii=False))
+
+        # 通过引擎建立索引并核对
+        minter.INDEX_LOOKBACK_BLOCKS = head
+        calls_before = node.calls["eth_getLogs"]
+        start = time.perf_counter()
+        with quiet(not args.verbose):
+            await minter.sync_badge_index()
+        full_seconds = time.perf_counter() - start
+        full_requests = node.calls["eth_getLogs"] - calls_before
+
+        contract = node.chain.contracts[drop.contract_address.lower()]
+        holders = minter.badge_index.holders(drop.contract_address)
+        matches = all(len(holders.get(address, [])) == count for address, count in contract.owners.items())
+        expected_holders = len(contract.owners)
+
+        # 增量更新: 再生成一小段历史，只回填新区块
+        node.chain.seed_claims(drop.contract, [Account.create().address for _ in range(args.holders // 100)],
+                               args.blocks // 100)
+        calls_before = node.calls["eth_getLogs"]
+        start = time.perf_counter()
+        with quiet(not args.verbose):
+            await minter.sync_badge_index()
+        print(json.dumps({
+            "mode": "engine-index",
+            "holders": len(holders),
+            "expected_holders": expected_holders,
+            "matches_chain": matches,
+            "full_requests": full_requests,
+            "full_seconds": round(full_seconds, 3),
+            "incremental_requests": node.calls["eth_getLogs"] - calls_before,
+            "incremental_seconds": round(time.perf_counter() - start, 3),
+            "holders_after_incremental": len(minter.badge_index.holders(drop.contract_address)),
+            "expected_after_incremental": len(contract.owners),
+        }, ensure_ascii=False))
+    finally:
+        await minter.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="持有者索引压测")
+    parser.add_argument("--holders", type=int, default=5000)
+    parser.add_argument("--blocks", type=int, default=50000)
+    parser.add_argument("--latency", type=float, default=0.05, help="每个RPC请求注入的延迟(秒)")
+    parser.add_argument("--max-range", type=int, default=10000, help="节点允许的单次查询区块数")
+    parser.add_argument("--max-results", type=int, default=1000, help="节点允许的单次查询结果数")
+    parser.add_argument("--fixed-chunk", type=int, default=1000, help="fixed-serial 模式的块大小")
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    minter_cls = getattr(load_script("mint-nft(zentra).py"), "ZentraTestnetBadgeMinter")
+    drop = minter_cls().drops[0]
+
+    with MockRPCNode(latency=args.latency, block_time=0, logs_max_range=args.max_range,
+                     logs_max_results=args.max_results) as node:
+        node.chain.deploy_drop(drop.contract)
+        node.chain.seed_claims(drop.contract, [Account.create().address for _ in range(args.holders)], args.blocks)
+        asyncio.run(run(minter_cls, node, args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+预检压测 - 对比 Multicall3 聚合预检和纯 JSON-RPC 批量预检的RPC调用次数
+部分钱包预先持有徽章、部分钱包余额不足，验证它们在估算gas和签名之前就被筛掉
+
+用法: python bench/bench_preflight.py --accounts 2000 --owned 0.2 --underfunded 0.1
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+
+from common import isolate_state, load_script, quiet
+from mock_rpc import MockRPCNode, make_wallets
+
+SCRIPTS = {
+    "zentra": ("mint-nft(zentra).py", "ZentraTestnetBadgeMinter"),
+    "for": ("mint-nft(for).py", "FaroSwapBadgeMinter"),
+    "all": ("mint-nft(all).py", "AllBadgesMinter"),
+}
+
+
+async def run_once(minter_cls, node: MockRPCNode, addresses, use_multicall: bool) -> dict:
+    minter = minter_cls()
+    minter.RPC_URLS = [node.url]
+    isolate_state(minter)
+    if not use_multicall:
+        minter.MULTICALL_ADDRESS = None
+    if not await minter.connect_to_network():
+        raise RuntimeError("无法连接模拟节点")
+
+    try:
+        node.calls.clear()
+        node.http_requests = 0
+        start = time.perf_counter()
+        skipped = await minter.run_preflight({address: minter.drops for address in addresses})
+        elapsed = time.perf_counter() - start
+    finally:
+        await minter.close()
+
+    owned = sum(1 for ok, _ in skipped.values() if ok)
+    return {
+        "mode": "multicall" if use_multicall else "rpc-batch",
+        "accounts": len(addresses),
+        "ready": len(minter.preflight),
+        "skipped_owned": owned,
+        "skipped_underfunded": len(skipped) - owned,
+        "seconds": round(elapsed, 3),
+        "rpc_calls": sum(node.calls.values()),
+        "http_requests": node.http_requests,
+        "calls_by_method": dict(node.calls),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Multicall3 预检压测")
+    parser.add_argument("--script", choices=SCRIPTS, default="zentra")
+    parser.add_argument("--accounts", type=int, default=2000)
+    parser.add_argument("--owned", type=float, default=0.2, help="预先持有徽章的钱包比例")
+    parser.add_argument("--underfunded", type=float, default=0.1, help="余额不足的钱包比例")
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    filename, class_name = SCRIPTS[args.script]
+    module = load_script(filename)
+    minter_cls = getattr(module, class_name)
+    drops = minter_cls().drops
+    for use_multicall in (True, False):
+        # 两种模式使用相同的钱包分布
+        rng = random.Random(args.seed)
+        with MockRPCNode(latency=args.latency) as node:
+            contracts = [node.chain.deploy_drop(drop.contract) for drop in drops]
+            _, addresses = make_wallets(args.accounts, node.chain, (len(drops) + 1) * 10 ** 18)
+            for address in addresses:
+                roll = rng.random()
+                if roll < args.owned:
+                    for contract in contracts:
+                        contract.owners[address.lower()] += 1
+                elif roll < args.owned + args.underfunded:
+                    node.chain.balances[address.lower()] = 5 * 10 ** 17
+            with quiet():
+                row = asyncio.run(run_once(minter_cls, node, addresses, use_multicall))
+            print(json.dumps(row, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+预签名广播压测 - 对比开售时两种方式把全部交易送进交易池所需的时间:
+1. inline: process_accounts 按账户依次估算、取nonce、签名、发送
+2. presign: 提前 presign_accounts 签好写入文件，开售时另一个minter实例 (模拟独立的广播进程) broadcast_presigned
+使用本地模拟 JSON-RPC 节点，不会访问真实网络
+
+用法: python bench/bench_presign.py --accounts 200 --concurrency 32 --latency 0.05
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+from common import isolate_state, load_script, quiet
+from mock_rpc import MockRPCNode, make_wallets
+
+SCRIPTS = {
+    "zentra": ("mint-nft(zentra).py", "ZentraTestnetBadgeMinter"),
+    "for": ("mint-nft(for).py", "FaroSwapBadgeMinter"),
+    "all": ("mint-nft(all).py", "AllBadgesMinter"),
+}
+
+
+def submit_span(node: MockRPCNode, start: float) -> float:
+    """从开始到最后一笔交易进入交易池的秒数"""
+    submitted = node.chain.submitted_at.values()
+    return round(max(submitted) - start, 3) if submitted else 0.0
+
+
+async def connect(minter, node: MockRPCNode, state_dir=None):
+    minter.RPC_URLS = [node.url]
+    state_dir = isolate_state(minter, state_dir)
+    if not await minter.connect_to_network():
+        raise RuntimeError("无法连接模拟节点")
+    return state_dir
+
+
+async def run_inline(minter_cls, node: MockRPCNode, keys, args) -> dict:
+    minter = minter_cls()
+    await connect(minter, node)
+    try:
+        start = time.perf_counter()
+        results = await minter.process_accounts(keys, args.concurrency, args.mints_per_account)
+        elapsed = time.perf_counter() - start
+    finally:
+        await minter.close()
+    return {
+        "mode": "inline",
+        "success": sum(1 for r in results if r["success"]),
+        "submit_seconds": submit_span(node, start),
+        "total_seconds": round(elapsed, 3),
+    }
+
+
+async def run_presigned(minter_cls, node: MockRPCNode, keys, args) -> dict:
+    # 开售前: 预签名
+    minter = minter_cls()
+    state_dir = await connect(minter, node)
+    try:
+        start = time.perf_counter()
+        count = await minter.presign_accounts(keys, args.mints_per_account)
+        presign_seconds = time.perf_counter() - start
+    finally:
+        await minter.close()
+
+    # 开售时: 新的实例读取同一份状态和预签名文件广播
+    broadcaster = minter_cls()
+    await connect(broadcaster, node, state_dir)
+    try:
+        start = time.perf_counter()
+        results = await broadcaster.broadcast_presigned()
+        elapsed = time.perf_counter() - start
+    finally:
+        await broadcaster.close()
+    return {
+        "mode": "presign",
+        "presigned": count,
+        "presign_seconds": round(presign_seconds, 3),
+        "success": sum(1 for r in results if r["success"]),
+        "submit_seconds": submit_span(node, start),
+        "total_seconds": round(elapsed, 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="预签名广播压测")
+    parser.add_argument("--script", choices=SCRIPTS, default="zentra")
+    parser.add_argument("--accounts", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--mints-per-account", type=int, default=1)
+    parser.add_argument("--latency", type=float, default=0.05, help="每个RPC请求注入的延迟(秒)")
+    parser.add_argument("--block-time", type=float, default=1.0)
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    filename, class_name = SCRIPTS[args.script]
+    minter_cls = getattr(load_script(filename), class_name)
+    drops = minter_cls().drops
+
+    for runner in (run_inline, run_presigned):
+        with MockRPCNode(latency=args.latency, block_time=args.block_time) as node:
+            for drop in drops:
+                node.chain.deploy_drop(drop.contract)
+            funding = (args.mints_per_account * len(drops) + 1) * 10 ** 18
+            keys, _ = make_wallets(args.accounts, node.chain, funding)
+            with quiet(not args.verbose):
+                row = asyncio.run(runner(minter_cls, node, keys, args))
+            row.update(accounts=args.accounts, rpc_calls=sum(node.calls.values()), http_requests=node.http_requests)
+            print(json.dumps(row, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
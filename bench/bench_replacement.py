@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+卡住交易替换压测 - 模拟链上拥堵: 节点报价低于实际打包门槛，按报价发出的mint交易卡在交易池里
+对比不替换 (等到超时) 和按 ReplacementPolicy 提价替换两种情况下:
+成功数、每个钱包从第一次发送到上链的耗时 p50/p99、发出的替换交易数
+使用本地模拟 JSON-RPC 节点，不会访问真实网络
+
+用法: python bench/bench_replacement.py --accounts 50 --block-time 0.5 --min-gas-price-gwei 1.3
+"""
+
+import argparse
+import asyncio
+import json
+from collections import defaultdict
+from dataclasses import replace
+
+from common import isolate_state, load_script, percentile, quiet
+from mock_rpc import MockRPCNode, make_wallets
+from pharos_bot.gas import ReplacementPolicy
+
+
+def inclusion_latencies(node: MockRPCNode) -> list:
+    """按 (钱包, nonce) 统计第一次发送到其中某一笔上链的秒数"""
+    chain = node.chain
+    first_sent, mined = {}, {}
+    for tx_hash, sent in chain.submitted_at.items():
+        tx = chain.txs[tx_hash]
+        key = (tx["from"], tx["nonce"])
+        first_sent[key] = min(sent, first_sent.get(key, sent))
+        if tx_hash in chain.mined_at:
+            mined[key] = chain.mined_at[tx_hash]
+    return [mined[key] - first_sent[key] for key in mined]
+
+
+async def run_once(minter_cls, node: MockRPCNode, keys, policy: ReplacementPolicy, args) -> dict:
+    minter = minter_cls()
+    minter.RPC_URLS = [node.url]
+    minter.drops = [replace(drop, replacement=policy, confirm_timeout=args.confirm_timeout) for drop in minter.drops]
+    isolate_state(minter)
+    if not await minter.connect_to_network():
+        raise RuntimeError("无法连接模拟节点")
+    try:
+        results = await minter.process_accounts(keys, args.concurrency)
+    finally:
+        await minter.close()
+
+    latencies = inclusion_latencies(node)
+    sent = defaultdict(int)
+    for tx_hash in node.chain.submitted_at:
+        tx = node.chain.txs[tx_hash]
+        sent[(tx["from"], tx["nonce"])] += 1
+    return {
+        "mode": "replace" if policy.enabled else "no-replace",
+        "accounts": len(keys),
+        "success": sum(1 for r in results if r["success"]),
+        "included": len(latencies),
+        "replacements": sum(sent.values()) - len(sent),
+        "inclusion_p50_s": round(percentile(latencies, 50), 2),
+        "inclusion_p99_s": round(percentile(latencies, 99), 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="卡住交易替换压测")
+    parser.add_argument("--accounts", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.02, help="每个RPC请求注入的延迟(秒)")
+    parser.add_argument("--block-time", type=float, default=0.5)
+    parser.add_argument("--min-gas-price-gwei", type=float, default=1.3, help="出块打包门槛，节点报价固定为1 Gwei")
+    parser.add_argument("--after-blocks", type=int, default=3, help="多少个区块没被打包就替换")
+    parser.add_argument("--max-price-gwei", type=float, default=5, help="替换gas价格上限")
+    parser.add_argument("--confirm-timeout", type=float, default=20, help="等待确认的超时(秒)")
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    minter_cls = getattr(load_script("mint-nft(zentra).py"), "ZentraTestnetBadgeMinter")
+    drops = minter_cls().drops
+
+    max_price = int(args.max_price_gwei * 10 ** 9)
+    for policy in (ReplacementPolicy(after_blocks=0, max_price=max_price),
+                   ReplacementPolicy(after_blocks=args.after_blocks, max_price=max_price)):
+        with MockRPCNode(latency=args.latency, block_time=args.block_time) as node:
+            node.chain.min_gas_price = int(args.min_gas_price_gwei * 10 ** 9)
+            for drop in drops:
+                node.chain.deploy_drop(drop.contract)
+            keys, _ = make_wallets(args.accounts, node.chain, 2 * 10 ** 18)
+            with quiet(not args.verbose):
+                row = asyncio.run(run_once(minter_cls, node, keys, policy, args))
+            row["rpc_calls_by_method"] = dict(node.calls)
+            print(json.dumps(row, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
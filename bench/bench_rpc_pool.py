@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+RPC池压测 - 多个本地模拟节点注入不同延迟/错误率，验证
+1. 读请求集中到最快的健康节点
+2. 节点故障时自动切换，调用方看不到错误
+3. 节点限流 (超出速率返回429) 时，自适应限速把请求速率压到节点允许的范围内，对比关闭限速的情况
+
+用法: python bench/bench_rpc_pool.py --requests 600 --latency 0.01 0.05 0.15 --error-rate 0 0 0.3 --node-rate 100
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+from common import percentile
+from mock_rpc import MockChain, MockRPCNode
+from web3 import AsyncWeb3
+
+from pharos_bot.rpc_pool import PooledAsyncHTTPProvider
+
+ADDRESS = "0x000000000000000000000000000000000000dEaD"
+
+
+async def run_reads(w3: AsyncWeb3, count: int, concurrency: int, on_half=None) -> dict:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies, errors, done = [], 0, 0
+
+    async def one():
+        nonlocal errors, done
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                await w3.eth.get_balance(ADDRESS)
+                latencies.append(time.perf_counter() - start)
+            except Exception:
+                errors += 1
+        done += 1
+        if on_half and done == count // 2:
+            on_half()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(count)))
+    elapsed = time.perf_counter() - start
+    return {
+        "requests": count,
+        "errors": errors,
+        "seconds": round(elapsed, 3),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 1),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 1),
+    }
+
+
+async def scenario(name: str, urls, args, on_half=None, rate_limit=None) -> dict:
+    provider = PooledAsyncHTTPProvider(urls, eject_seconds=args.eject_seconds, rate_limit=rate_limit)
+    w3 = AsyncWeb3(provider)
+    try:
+        row = await run_reads(w3, args.requests, args.concurrency, on_half)
+    finally:
+        await provider.disconnect()
+    row["scenario"] = name
+    row["endpoints"] = provider.snapshot()
+    return row
+
+
+def main():
+    parser = argparse.ArgumentParser(description="多节点RPC池压测")
+    parser.add_argument("--requests", type=int, default=600)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--latency", type=float, nargs="+", default=[0.01, 0.05, 0.15])
+    parser.add_argument("--error-rate", type=float, nargs="+", default=None)
+    parser.add_argument("--eject-seconds", type=float, default=30)
+    parser.add_argument("--node-rate", type=float, default=100, help="限流场景中节点每秒允许的请求数")
+    args = parser.parse_args()
+
+    error_rates = args.error_rate or [0.0] * len(args.latency)
+    chain = MockChain()
+    nodes = [
+        MockRPCNode(chain=chain, latency=latency, miner=i == 0, error_rate=error_rate).start()
+        for i, (latency, error_rate) in enumerate(zip(args.latency, error_rates))
+    ]
+    urls = [node.url for node in nodes]
+    try:
+        # 基准: 只用列表里最慢的节点 (相当于原脚本写死一个节点)
+        slowest = max(range(len(nodes)), key=lambda i: args.latency[i])
+        print(json.dumps(asyncio.run(scenario("single-slowest", [urls[slowest]], args))))
+
+        # 节点池: 顺序故意把最慢的节点放在第一位
+        ordered = [urls[slowest]] + [u for i, u in enumerate(urls) if i != slowest]
+        print(json.dumps(asyncio.run(scenario("pool", ordered, args))))
+
+        # 故障切换: 跑到一半时让最快的节点下线
+        fastest = min(range(len(nodes)), key=lambda i: args.latency[i])
+
+        def take_down():
+            nodes[fastest].available = False
+
+        print(json.dumps(asyncio.run(scenario("pool-failover", ordered, args, take_down))))
+    finally:
+        for node in nodes:
+            node.stop()
+
+    # 限流: 单个节点超出 --node-rate 时返回429，分别关闭/开启自适应限速
+    for name, rate_limit in (("rate-limited-unshaped", {"enabled": False}), ("rate-limited-aimd", None)):
+        with MockRPCNode(chain=chain, latency=min(args.latency), rate_limit=args.node_rate) as node:
+            # 只有一个节点时没有别的节点可以重试，429直接返回给调用方
+            row = asyncio.run(scenario(name, [node.url], args, rate_limit=rate_limit))
+            row["node_429"] = node.rate_limited
+            print(json.dumps(row))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+分片运行压测 - 用 mint-headless.py 把同一批钱包分成 n 片，每片一个子进程同时运行，
+测量全部分片完成的总耗时，并用 merge 子命令合并结果、核对每个钱包恰好出现一次
+使用本地模拟 JSON-RPC 节点，不会访问真实网络 (模拟节点跑在本进程里，它的签名校验会占用一部分CPU)
+
+用法: python bench/bench_shards.py --accounts 100 --shards 1 2 4 --latency 0.05
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from common import ROOT
+from mock_rpc import MockRPCNode, make_wallets
+
+from pharos_bot.drops import ZENTRA_BADGE
+
+
+def run_shards(node: MockRPCNode, keys_file: Path, count: int, args) -> dict:
+    work_dir = Path(tempfile.mkdtemp(prefix="pharos-shards-"))
+    command = [sys.executable, str(ROOT / "mint-headless.py"), "run", "--drops", ZENTRA_BADGE.key,
+               "--keys", str(keys_file), "--concurrency", str(args.concurrency), "--rpc", node.url]
+    start = time.perf_counter()
+    processes = [
+        subprocess.Popen(command + ["--shard", f"{index}/{count}"], cwd=work_dir,
+                         stdout=subprocess.DEVNULL, stderr=None if args.verbose else subprocess.DEVNULL)
+        for index in range(count)
+    ]
+    codes = [process.wait() for process in processes]
+    elapsed = time.perf_counter() - start
+
+    merged_file = work_dir / "results" / "merged.json"
+    subprocess.run([sys.executable, str(ROOT / "mint-headless.py"), "merge", "-o", str(merged_file),
+                    *map(str, sorted((work_dir / "results").glob("results*.json")))],
+                   cwd=work_dir, stdout=subprocess.DEVNULL)
+    merged = json.loads(merged_file.read_text(encoding="utf-8"))
+    addresses = [result["address"] for result in merged["results"]]
+    return {
+        "shards": count,
+        "exit_codes": codes,
+        "results": len(addresses),
+        "unique_wallets": len(set(addresses)),
+        "success": sum(1 for result in merged["results"] if result["success"]),
+        "missing_shards": merged["missing"],
+        "seconds": round(elapsed, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="分片运行压测")
+    parser.add_argument("--accounts", type=int, default=100)
+    parser.add_argument("--shards", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--concurrency", type=int, default=16, help="每个分片的并发账户数")
+    parser.add_argument("--latency", type=float, default=0.05, help="每个RPC请求注入的延迟(秒)")
+    parser.add_argument("--block-time", type=float, default=0.5)
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    for count in args.shards:
+        with MockRPCNode(latency=args.latency, block_time=args.block_time) as node:
+            node.chain.deploy_drop(ZENTRA_BADGE.contract)
+            keys, _ = make_wallets(args.accounts, node.chain, 2 * 10 ** 18)
+            keys_file = Path(tempfile.mkdtemp(prefix="pharos-keys-")) / "private_keys.txt"
+            keys_file.write_text("\n".join(keys) + "\n", encoding="utf-8")
+            print(json.dumps(run_shards(node, keys_file, count, args), ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+签名吞吐压测 - 不同进程数下每秒可签名的claim交易数
+
+用法: python bench/bench_signing.py --count 4000 --workers 1 2 4 8
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import time
+
+import common  # noqa: F401  把仓库根目录加入 sys.path
+from eth_account import Account
+
+from pharos_bot.drops import CHAIN_ID, ZENTRA_BADGE
+from pharos_bot.signing import BatchSigner
+
+
+def build_jobs(count: int):
+    drop = ZENTRA_BADGE
+    jobs = []
+    for i in range(count):
+        account = Account.create()
+        jobs.append(({
+            "to": drop.contract_address,
+            "data": drop.claim_template.encode(account.address),
+            "value": drop.price_per_token,
+            "gas": 200000,
+            "gasPrice": 10 ** 9,
+            "nonce": 0,
+            "chainId": CHAIN_ID,
+        }, "0x" + bytes(account.key).hex()))
+    return jobs
+
+
+async def measure(jobs, workers: int, chunk_size: int, mode: str) -> dict:
+    signer = BatchSigner(workers, chunk_size=chunk_size)
+    try:
+        # 预热进程池，不计入耗时
+        await signer.sign_many(jobs[:workers * 2])
+        start = time.perf_counter()
+        if mode == "stream":
+            # 逐笔提交，模拟并发mint流程里的 sign()
+            await asyncio.gather(*(signer.sign(tx, key) for tx, key in jobs))
+        else:
+            await signer.sign_many(jobs)
+        elapsed = time.perf_counter() - start
+    finally:
+        signer.shutdown()
+    return {
+        "mode": mode,
+        "workers": workers,
+        "signatures": len(jobs),
+        "seconds": round(elapsed, 3),
+        "sigs_per_sec": round(len(jobs) / elapsed),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="进程池签名吞吐")
+    parser.add_argument("--count", type=int, default=4000)
+    parser.add_argument("--workers", type=int, nargs="+", default=sorted({1, 2, 4, os.cpu_count() or 1}))
+    parser.add_argument("--chunk-size", type=int, default=64)
+    parser.add_argument("--mode", choices=["bulk", "stream"], default="bulk")
+    args = parser.parse_args()
+
+    jobs = build_jobs(args.count)
+    print(json.dumps({"cpu_count": os.cpu_count()}))
+    for workers in args.workers:
+        print(json.dumps(asyncio.run(measure(jobs, workers, args.chunk_size, args.mode))))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+余额归集压测 - 一批钱包各留有随机的零散余额 (一部分不够付转账gas)，用 sweep_balances 归集到一个地址，
+核对归集地址实际收到的金额与汇总文件一致、没有可归集的余额留在钱包里，并统计RPC调用数和耗时
+使用本地模拟 JSON-RPC 节点，不会访问真实网络
+
+用法: python bench/bench_sweep.py --accounts 200 --dust 0.2 --latency 0.05
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+
+from eth_account import Account
+
+from common import isolate_state, load_script, quiet
+from mock_rpc import MockRPCNode, make_wallets
+
+from pharos_bot.transfers import TRANSFER_GAS
+
+
+async def run_once(minter_cls, node: MockRPCNode, keys, collector: str, args) -> dict:
+    minter = minter_cls()
+    minter.RPC_URLS = [node.url]
+    isolate_state(minter)
+    if not await minter.connect_to_network():
+        raise RuntimeError("无法连接模拟节点")
+    try:
+        start = time.perf_counter()
+        summary = await minter.sweep_balances(keys, collector)
+        elapsed = time.perf_counter() - start
+    finally:
+        await minter.close()
+    return {"summary": summary, "seconds": round(elapsed, 3)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="余额归集压测")
+    parser.add_argument("--accounts", type=int, default=200)
+    parser.add_argument("--dust", type=float, default=0.2, help="余额不够付gas的钱包比例")
+    parser.add_argument("--latency", type=float, default=0.05, help="每个RPC请求注入的延迟(秒)")
+    parser.add_argument("--block-time", type=float, default=0.5)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    minter_cls = getattr(load_script("mint-nft(zentra).py"), "ZentraTestnetBadgeMinter")
+    rng = random.Random(args.seed)
+    with MockRPCNode(latency=args.latency, block_time=args.block_time) as node:
+        gas_cost = TRANSFER_GAS * node.chain.gas_price
+        keys, addresses = make_wallets(args.accounts, node.chain, 0)
+        dust = set(rng.sample(range(args.accounts), int(args.accounts * args.dust)))
+        for i, address in enumerate(addresses):
+            amount = rng.randrange(1, gas_cost) if i in dust else rng.randrange(gas_cost * 2, 10 ** 17)
+            node.chain.fund(address, amount)
+        collector = Account.create().address
+
+        with quiet(not args.verbose):
+            row = asyncio.run(run_once(minter_cls, node, keys, collector, args))
+        summary = row["summary"]
+        received = node.chain.balances[collector.lower()]
+        sweep_cost = TRANSFER_GAS * summary["gas_price"]
+        stranded = sum(1 for address in addresses if node.chain.balances[address.lower()] > sweep_cost)
+        print(json.dumps({
+            "accounts": args.accounts,
+            "swept": summary["swept"],
+            "skipped": summary["skipped"],
+            "failed": summary["failed"],
+            "expected_skipped": len(dust),
+            "recovered": summary["recovered"],
+            "collector_received_matches": received == summary["recovered_wei"],
+            "wallets_left_sweepable": stranded,
+            "rpc_calls": sum(node.calls.values()),
+            "seconds": row["seconds"],
+        }, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+定时开始压测 - 预签名后等待目标区块/链上时间，测量:
+触发区块出块 (时间戳模式为本地时钟到达目标时间) 到第一笔交易进入交易池的延迟、全部交易发出的耗时、
+有多少交易赶上了目标区块。时间戳模式宁晚勿早，交易一般落在目标之后的区块，关键是 before_target_block 为 0
+使用本地模拟 JSON-RPC 节点，不会访问真实网络
+
+用法: python bench/bench_trigger.py --accounts 200 --block-time 0.5 --blocks-ahead 10
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from collections import Counter
+
+from common import isolate_state, load_script, quiet
+from mock_rpc import MockRPCNode, make_wallets
+
+
+async def run_once(minter_cls, node: MockRPCNode, keys, mode: str, args) -> dict:
+    minter = minter_cls()
+    minter.RPC_URLS = [node.url]
+    isolate_state(minter)
+    if not await minter.connect_to_network():
+        raise RuntimeError("无法连接模拟节点")
+    try:
+        await minter.presign_accounts(keys)
+        head = node.chain.head
+        if mode == "block":
+            target = {"start_block": head["number"] + args.blocks_ahead}
+        else:
+            target = {"start_time": head["timestamp"] + int(args.blocks_ahead * args.block_time) + 1}
+        results = await minter.broadcast_presigned(**target)
+    finally:
+        await minter.close()
+
+    chain = node.chain
+    submitted = sorted(chain.submitted_at.values())
+    included = Counter(chain.txs[h]["blockNumber"] for h in chain.submitted_at)
+    if mode == "block":
+        first_block = target["start_block"]
+        # 触发点是目标区块的前一个区块
+        trigger_at = chain.blocks[first_block - 1]["mined_at"]
+    else:
+        first_block = next(b["number"] for b in chain.blocks if b["timestamp"] >= target["start_time"])
+        trigger_at = target["start_time"] - (time.time() - time.perf_counter())
+    return {
+        "mode": mode,
+        "accounts": len(keys),
+        "success": sum(1 for r in results if r["success"]),
+        "target_block": first_block,
+        "trigger_to_first_tx_ms": round((submitted[0] - trigger_at) * 1000, 1),
+        "trigger_to_last_tx_ms": round((submitted[-1] - trigger_at) * 1000, 1),
+        "in_target_block": included.get(first_block, 0),
+        "before_target_block": sum(n for b, n in included.items() if b is not None and b < first_block),
+        "blocks_used": len(included),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="定时开始压测")
+    parser.add_argument("--accounts", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.02, help="每个RPC请求注入的延迟(秒)")
+    parser.add_argument("--block-time", type=float, default=0.5)
+    parser.add_argument("--blocks-ahead", type=int, default=10, help="目标区块离当前区块的距离")
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    minter_cls = getattr(load_script("mint-nft(zentra).py"), "ZentraTestnetBadgeMinter")
+    drops = minter_cls().drops
+
+    for mode in ("block", "timestamp"):
+        with MockRPCNode(latency=args.latency, block_time=args.block_time) as node:
+            for drop in drops:
+                node.chain.deploy_drop(drop.contract)
+            keys, _ = make_wallets(args.accounts, node.chain, 2 * 10 ** 18)
+            # 先出几个块，让触发器能估算出块间隔
+            time.sleep(args.block_time * 4)
+            with quiet(not args.verbose):
+                row = asyncio.run(run_once(minter_cls, node, keys, mode, args))
+            row["rpc_calls_by_method"] = dict(node.calls)
+            print(json.dumps(row, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
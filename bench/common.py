@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""压测脚本公用工具"""
+
+import contextlib
+import importlib.util
+import io
+import sys
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+
+def load_script(filename: str):
+    """按文件路径加载 mint-nft(xxx).py 这类无法直接 import 的脚本"""
+    path = ROOT / filename
+    name = path.stem.replace("-", "_").replace("(", "_").replace(")", "")
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@contextlib.contextmanager
+def quiet(enabled: bool = True):
+    """压测时屏蔽脚本的逐行日志输出"""
+    if not enabled:
+        yield
+        return
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+
+def percentile(values, pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+def isolate_state(minter, state_dir: Optional[Path] = None) -> Path:
+    """
+    把minter的本地状态文件 (gas缓存、地址索引等) 重定向到临时目录，避免污染真实运行数据
+
+    传入 state_dir 时与之前的minter共用同一份状态，模拟同一台机器上先后运行的两个进程
+    """
+    from pharos_bot.gas_limits import GasLimitCache
+    from pharos_bot.indexer import BadgeIndex
+    from pharos_bot.engine import wib
+    from pharos_bot.journal import RunJournal
+    from pharos_bot.keys import KeyIndex
+    from pharos_bot.logger import ConsoleSink, JsonLinesSink
+
+    state_dir = state_dir or Path(tempfile.mkdtemp(prefix="pharos-bench-"))
+    minter.gas_limits = GasLimitCache(str(state_dir / "gas_limits.json"), chain_id=minter.CHAIN_ID)
+    minter.key_index = KeyIndex(str(state_dir / "private_keys.idx"))
+    minter.journal = RunJournal(str(state_dir / "mint_journal.jsonl"))
+    minter.badge_index = BadgeIndex(str(state_dir / "badge_index.json"), chain_id=minter.CHAIN_ID)
+    minter.RPC_METRICS_FILE = str(state_dir / "rpc_metrics.json")
+    minter.PRESIGN_FILE = str(state_dir / "presigned_txs.txt")
+    minter.LOG_JSON_FILE = str(state_dir / "mint_log.jsonl")
+    # 资金钱包默认不存在，需要的压测自己写入
+    minter.TREASURY_KEY_FILE = str(state_dir / "treasury_key.txt")
+    minter.SWEEP_SUMMARY_FILE = str(state_dir / "sweep_summary.json")
+    minter.logger.sinks = [ConsoleSink(wib), JsonLinesSink(minter.LOG_JSON_FILE)]
+    return state_dir
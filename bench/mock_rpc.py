@@ -0,0 +1,638 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+本地模拟 JSON-RPC 节点 - 用于离线压测mint脚本
+在后台线程里跑一个 aiohttp 服务，模拟 Pharos 测试网的最小子集:
+余额、nonce、出块、claim() 合约执行、交易收据、事件日志 (eth_getLogs) 以及 Multicall3 (aggregate3/getEthBalance)
+"""
+
+import asyncio
+import hashlib
+import json
+import random
+import threading
+import time
+from collections import Counter
+from typing import Optional, Tuple
+
+import rlp
+from aiohttp import web
+from eth_abi import decode as abi_decode
+from eth_abi import encode as abi_encode
+from eth_account import Account
+from eth_utils import keccak
+
+# claim(address,uint256,address,uint256,(bytes32[],uint256,uint256,address),bytes)
+CLAIM_SELECTOR = bytes.fromhex("84bb1e42")
+CLAIM_TYPES = ["address", "uint256", "address", "uint256", "(bytes32[],uint256,uint256,address)", "bytes"]
+TRANSFER_TOPIC = "0x" + keccak(text="Transfer(address,address,uint256)").hex()
+TOKENS_CLAIMED_TOPIC = "0x" + keccak(text="TokensClaimed(uint256,address,address,uint256,uint256)").hex()
+NATIVE_CURRENCY = "0xeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeeee"
+
+MULTICALL3_ADDRESS = "0xca11bde05977b3631167028862be2a173976ca11"
+AGGREGATE3_SELECTOR = keccak(text="aggregate3((address,bool,bytes)[])")[:4]
+GET_ETH_BALANCE_SELECTOR = keccak(text="getEthBalance(address)")[:4]
+BALANCE_OF_SELECTOR = keccak(text="balanceOf(address)")[:4]
+
+CLAIM_GAS_USED = 142_000
+TRANSFER_GAS_USED = 21_000
+
+
+class RPCError(Exception):
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+def _hex(value: int) -> str:
+    return hex(value)
+
+
+def _word(value: int) -> str:
+    return "0x" + value.to_bytes(32, "big").hex()
+
+
+def _addr_topic(address: str) -> str:
+    return "0x" + "00" * 12 + address[2:].lower()
+
+
+class DropContract:
+    """模拟的 Drop 合约: 只实现公开 claim 和 balanceOf"""
+
+    def __init__(self, address: str, price_per_token: int):
+        self.address = address.lower()
+        self.price_per_token = price_per_token
+        self.next_token_id = 0
+        self.owners = Counter()
+
+
+class MockChain:
+    """链状态: 余额、nonce、交易池、区块和收据"""
+
+    def __init__(self, chain_id: int = 688688, gas_price: int = 10 ** 9, multicall: bool = True):
+        self.chain_id = chain_id
+        self.gas_price = gas_price
+        # 出块时只打包gas价格不低于它的交易，调高后可以模拟拥堵时低价交易卡在交易池里
+        self.min_gas_price = 0
+        self.multicall_address = MULTICALL3_ADDRESS if multicall else None
+        self.balances = Counter()
+        self.nonces = Counter()
+        self.contracts = {}
+        self.pool = []
+        self.txs = {}
+        self.receipts = {}
+        self.blocks = []
+        # 压测计时 (perf_counter): 交易首次提交、打包、以及客户端第一次拿到收据的时刻
+        self.submitted_at = {}
+        self.mined_at = {}
+        self.confirmed_at = {}
+        self.lock = threading.RLock()
+        self._new_block("0x" + "00" * 32)
+
+    # ---- 初始化 ----
+
+    def fund(self, address: str, amount_wei: int):
+        with self.lock:
+            self.balances[address.lower()] += amount_wei
+
+    def deploy_drop(self, address: str, price_per_token: int = 10 ** 18) -> DropContract:
+        with self.lock:
+            contract = DropContract(address, price_per_token)
+            self.contracts[contract.address] = contract
+            return contract
+
+    # ---- 区块 ----
+
+    @property
+    def head(self) -> dict:
+        return self.blocks[-1]
+
+    def _new_block(self, parent_hash: str, tx_hashes: Optional[list] = None) -> dict:
+        number = len(self.blocks)
+        block = {
+            "number": number,
+            "hash": "0x" + hashlib.sha256(f"block-{number}-{time.time()}".encode()).hexdigest(),
+            "parentHash": parent_hash,
+            "timestamp": int(time.time()),
+            "transactions": tx_hashes or [],
+            # 压测计时: 出块时刻 (perf_counter)
+            "mined_at": time.perf_counter(),
+        }
+        self.blocks.append(block)
+        return block
+
+    def mine(self, max_txs: int = 5000) -> dict:
+        """打包交易池里 nonce 连续的交易并出一个块"""
+        with self.lock:
+            number = len(self.blocks)
+            block_hash = "0x" + hashlib.sha256(f"block-{number}-{time.time()}".encode()).hexdigest()
+            included = []
+            progress = True
+            while progress and len(included) < max_txs:
+                progress = False
+                for tx in list(self.pool):
+                    if tx["nonce"] != self.nonces[tx["from"]] or tx["gasPrice"] < self.min_gas_price:
+                        continue
+                    self.pool.remove(tx)
+                    self._execute(tx, number, block_hash, len(included))
+                    included.append(tx["hash"])
+                    progress = True
+                    if len(included) >= max_txs:
+                        break
+            block = self._new_block(self.head["hash"], included)
+            block["hash"] = block_hash
+            for tx_hash in included:
+                self.receipts[tx_hash]["blockHash"] = block_hash
+                for log in self.receipts[tx_hash]["logs"]:
+                    log["blockHash"] = block_hash
+            return block
+
+    # ---- 交易 ----
+
+    def send_raw_transaction(self, raw_hex: str) -> str:
+        raw = bytes.fromhex(raw_hex[2:] if raw_hex.startswith("0x") else raw_hex)
+        fields = rlp.decode(raw)
+        nonce, gas_price, gas, to, value, data = (
+            int.from_bytes(fields[0], "big"),
+            int.from_bytes(fields[1], "big"),
+            int.from_bytes(fields[2], "big"),
+            ("0x" + fields[3].hex()) if fields[3] else None,
+            int.from_bytes(fields[4], "big"),
+            bytes(fields[5]),
+        )
+        sender = Account.recover_transaction(raw).lower()
+        tx_hash = "0x" + keccak(raw).hex()
+
+        with self.lock:
+            if tx_hash in self.txs:
+                return tx_hash
+            if nonce < self.nonces[sender]:
+                raise RPCError(-32000, "nonce too low")
+            if self.balances[sender] < value + gas * gas_price:
+                raise RPCError(-32000, "insufficient funds for gas * price + value")
+            for pending in self.pool:
+                if pending["from"] == sender and pending["nonce"] == nonce:
+                    if gas_price < pending["gasPrice"] * 11 // 10:
+                        raise RPCError(-32000, "replacement transaction underpriced")
+                    self.pool.remove(pending)
+                    break
+
+            tx = {
+                "hash": tx_hash, "from": sender, "to": to, "nonce": nonce, "gas": gas,
+                "gasPrice": gas_price, "value": value, "input": "0x" + data.hex(),
+                "data": data, "blockNumber": None, "blockHash": None, "transactionIndex": None,
+            }
+            self.txs[tx_hash] = tx
+            self.pool.append(tx)
+            self.submitted_at[tx_hash] = time.perf_counter()
+            return tx_hash
+
+    def _execute(self, tx: dict, number: int, block_hash: str, index: int):
+        sender, to, value = tx["from"], tx["to"], tx["value"]
+        logs = []
+        status = 1
+        gas_used = TRANSFER_GAS_USED
+
+        contract = self.contracts.get(to) if to else None
+        if contract is not None:
+            if tx["gas"] < CLAIM_GAS_USED:
+                status, gas_used = 0, tx["gas"]
+            else:
+                gas_used = CLAIM_GAS_USED
+                status, logs = self._execute_claim(contract, tx, number, block_hash, index)
+
+        fee = gas_used * tx["gasPrice"]
+        self.nonces[sender] += 1
+        self.balances[sender] -= fee
+        if status == 1:
+            self.balances[sender] -= value
+            if contract is None and to:
+                self.balances[to] += value
+
+        tx.update(blockNumber=number, blockHash=block_hash, transactionIndex=index)
+        self.mined_at[tx["hash"]] = time.perf_counter()
+        self.receipts[tx["hash"]] = {
+            "transactionHash": tx["hash"],
+            "transactionIndex": _hex(index),
+            "blockHash": block_hash,
+            "blockNumber": _hex(number),
+            "from": sender,
+            "to": to,
+            "cumulativeGasUsed": _hex(gas_used),
+            "gasUsed": _hex(gas_used),
+            "effectiveGasPrice": _hex(tx["gasPrice"]),
+            "contractAddress": None,
+            "logs": logs,
+            "logsBloom": "0x" + "00" * 256,
+            "status": _hex(status),
+            "type": "0x0",
+        }
+
+    def _execute_claim(self, contract: DropContract, tx: dict, number: int, block_hash: str, index: int):
+        data = tx["data"]
+        if data[:4] != CLAIM_SELECTOR:
+            return 0, []
+        try:
+            receiver, quantity, currency, price, _proof, _data = abi_decode(CLAIM_TYPES, data[4:])
+        except Exception:
+            return 0, []
+        if currency.lower() != NATIVE_CURRENCY or price != contract.price_per_token:
+            return 0, []
+        if tx["value"] != price * quantity or quantity == 0:
+            return 0, []
+
+        return 1, self._claim_logs(contract, tx["hash"], tx["from"], receiver, quantity, number, block_hash, index)
+
+    @staticmethod
+    def _claim_logs(contract: DropContract, tx_hash: str, sender: str, receiver: str, quantity: int,
+                    number: int, block_hash: str, index: int) -> list:
+        """铸造 quantity 个token，返回 Transfer + TokensClaimed 日志"""
+        receiver = receiver.lower()
+        start_token_id = contract.next_token_id
+        contract.next_token_id += quantity
+        contract.owners[receiver] += quantity
+
+        def make_log(topics, data_hex, offset):
+            return {
+                "address": contract.address, "topics": topics, "data": data_hex,
+                "blockNumber": _hex(number), "blockHash": block_hash,
+                "transactionHash": tx_hash, "transactionIndex": _hex(index),
+                "logIndex": _hex(offset), "removed": False,
+            }
+
+        logs = []
+        for token_id in range(start_token_id, start_token_id + quantity):
+            logs.append(make_log(
+                [TRANSFER_TOPIC, _addr_topic("0x" + "00" * 20), _addr_topic(receiver), _word(token_id)],
+                "0x", len(logs)
+            ))
+        logs.append(make_log(
+            [TOKENS_CLAIMED_TOPIC, _word(0), _addr_topic(sender), _addr_topic(receiver)],
+            _word(start_token_id) + _word(quantity)[2:], len(logs)
+        ))
+        return logs
+
+    def seed_claims(self, contract_address: str, receivers: list, blocks: int):
+        """
+        不经过交易直接生成历史: 出 blocks 个区块，receivers 的claim均匀分布在其中
+        (每个receiver一笔只有日志的伪交易，不执行签名验证)，用于压测日志索引
+        """
+        with self.lock:
+            contract = self.contracts[contract_address.lower()]
+            per_block = {}
+            for i, receiver in enumerate(receivers):
+                per_block.setdefault(i * blocks // max(1, len(receivers)), []).append(receiver)
+            for offset in range(blocks):
+                number = len(self.blocks)
+                block_hash = "0x" + hashlib.sha256(f"block-{number}-seed".encode()).hexdigest()
+                included = []
+                for index, receiver in enumerate(per_block.get(offset, [])):
+                    tx_hash = "0x" + hashlib.sha256(f"seed-{number}-{index}".encode()).hexdigest()
+                    logs = self._claim_logs(contract, tx_hash, receiver, receiver, 1, number, block_hash, index)
+                    self.receipts[tx_hash] = {"transactionHash": tx_hash, "blockNumber": _hex(number), "logs": logs}
+                    included.append(tx_hash)
+                block = self._new_block(self.head["hash"], included)
+                block["hash"] = block_hash
+
+    # ---- 查询 ----
+
+    def receipt(self, tx_hash: str) -> Optional[dict]:
+        """返回收据，并记下客户端第一次拿到该收据的时刻"""
+        tx_hash = tx_hash.lower()
+        receipt = self.receipts.get(tx_hash)
+        if receipt is not None and tx_hash not in self.confirmed_at:
+            self.confirmed_at[tx_hash] = time.perf_counter()
+        return receipt
+
+    def latencies(self) -> Tuple[list, list]:
+        """(提交→打包, 提交→客户端确认) 的耗时列表，单位秒"""
+        with self.lock:
+            mined = [self.mined_at[h] - t for h, t in self.submitted_at.items() if h in self.mined_at]
+            confirmed = [self.confirmed_at[h] - t for h, t in self.submitted_at.items() if h in self.confirmed_at]
+        return mined, confirmed
+
+    def get_logs(self, address: str, from_block: int, to_block: int, topics: Optional[list] = None) -> list:
+        """按合约地址和 topic0 (可以是列表) 过滤 [from_block, to_block] 里的日志"""
+        address = address.lower()
+        wanted = (topics or [None])[0]
+        if isinstance(wanted, str):
+            wanted = [wanted]
+        logs = []
+        with self.lock:
+            for block in self.blocks[from_block:to_block + 1]:
+                for tx_hash in block["transactions"]:
+                    for log in self.receipts[tx_hash]["logs"]:
+                        if log["address"] == address and (not wanted or log["topics"][0] in wanted):
+                            logs.append(log)
+        return logs
+
+    def pending_nonce(self, address: str) -> int:
+        address = address.lower()
+        nonce = self.nonces[address]
+        pending = {tx["nonce"] for tx in self.pool if tx["from"] == address}
+        while nonce in pending:
+            nonce += 1
+        return nonce
+
+    def estimate_gas(self, call: dict) -> int:
+        to = (call.get("to") or "").lower()
+        contract = self.contracts.get(to)
+        if contract is None:
+            return TRANSFER_GAS_USED
+        data = bytes.fromhex((call.get("data") or call.get("input") or "0x")[2:])
+        value = int(call.get("value", "0x0"), 16)
+        if data[:4] != CLAIM_SELECTOR:
+            raise RPCError(3, "execution reverted")
+        _receiver, quantity, _currency, price, _proof, _data = abi_decode(CLAIM_TYPES, data[4:])
+        if value != price * quantity or price != contract.price_per_token:
+            raise RPCError(3, "execution reverted: !PriceOrCurrency")
+        return CLAIM_GAS_USED
+
+    def call(self, call: dict) -> bytes:
+        """只读调用: Multicall3 的 aggregate3/getEthBalance 和 Drop 合约的 balanceOf"""
+        to = (call.get("to") or "").lower()
+        data = bytes.fromhex((call.get("data") or call.get("input") or "0x")[2:])
+        with self.lock:
+            if to and to == self.multicall_address:
+                if data[:4] == AGGREGATE3_SELECTOR:
+                    (calls,) = abi_decode(["(address,bool,bytes)[]"], data[4:])
+                    results = []
+                    for target, allow_failure, call_data in calls:
+                        try:
+                            results.append((True, self.call({"to": target, "data": "0x" + call_data.hex()})))
+                        except RPCError:
+                            if not allow_failure:
+                                raise
+                            results.append((False, b""))
+                    return abi_encode(["(bool,bytes)[]"], [results])
+                if data[:4] == GET_ETH_BALANCE_SELECTOR:
+                    (address,) = abi_decode(["address"], data[4:])
+                    return abi_encode(["uint256"], [self.balances[address.lower()]])
+                raise RPCError(3, "execution reverted")
+
+            contract = self.contracts.get(to)
+            if contract is None:
+                return b""
+            if data[:4] == BALANCE_OF_SELECTOR:
+                (owner,) = abi_decode(["address"], data[4:])
+                return abi_encode(["uint256"], [contract.owners[owner.lower()]])
+            raise RPCError(3, "execution reverted")
+
+    def format_block(self, block: dict) -> dict:
+        return {
+            "number": _hex(block["number"]),
+            "hash": block["hash"],
+            "parentHash": block["parentHash"],
+            "timestamp": _hex(block["timestamp"]),
+            "transactions": list(block["transactions"]),
+            "gasLimit": _hex(30_000_000),
+            "gasUsed": "0x0",
+            "miner": "0x" + "00" * 20,
+            "extraData": "0x",
+            "nonce": "0x" + "00" * 8,
+            "difficulty": "0x0",
+            "size": "0x0",
+            "logsBloom": "0x" + "00" * 256,
+            "sha3Uncles": "0x" + "00" * 32,
+            "stateRoot": "0x" + "00" * 32,
+            "receiptsRoot": "0x" + "00" * 32,
+            "transactionsRoot": "0x" + "00" * 32,
+            "uncles": [],
+        }
+
+    def format_tx(self, tx: dict) -> dict:
+        return {
+            "hash": tx["hash"], "from": tx["from"], "to": tx["to"],
+            "nonce": _hex(tx["nonce"]), "gas": _hex(tx["gas"]), "gasPrice": _hex(tx["gasPrice"]),
+            "value": _hex(tx["value"]), "input": tx["input"],
+            "blockNumber": _hex(tx["blockNumber"]) if tx["blockNumber"] is not None else None,
+            "blockHash": tx["blockHash"],
+            "transactionIndex": _hex(tx["transactionIndex"]) if tx["transactionIndex"] is not None else None,
+            "v": "0x0", "r": "0x0", "s": "0x0", "type": "0x0",
+        }
+
+
+class MockRPCNode:
+    """
+    模拟节点: 在后台线程中运行 HTTP JSON-RPC 服务
+
+    latency: 每个HTTP请求注入的延迟(秒)，可以是 (最小, 最大) 区间
+    block_time: 出块间隔(秒)，0 表示每笔交易立即出块
+    miner: 多个节点共享同一条 MockChain 时只让一个节点出块
+    error_rate: 按比例返回 HTTP 503，模拟不稳定节点；available=False 时全部返回 503
+    rate_limit: 每秒最多处理的HTTP请求数 (令牌桶，可以攒1秒的量)，超出的返回 HTTP 429；0 表示不限
+    logs_max_range / logs_max_results: eth_getLogs 的区块范围和结果数上限，超出时返回错误；0 表示不限
+    """
+
+    def __init__(self, chain: Optional[MockChain] = None, latency=0.0, block_time: float = 1.0,
+                 host: str = "127.0.0.1", port: int = 0, miner: bool = True, error_rate: float = 0.0,
+                 rate_limit: float = 0.0, logs_max_range: int = 0, logs_max_results: int = 0):
+        self.chain = chain or MockChain()
+        self.latency = latency
+        self.block_time = block_time
+        self.miner = miner
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit
+        self.rate_limited = 0
+        self.logs_max_range = logs_max_range
+        self.logs_max_results = logs_max_results
+        self._tokens = rate_limit
+        self._tokens_at = time.monotonic()
+        self.available = True
+        self.host = host
+        self.port = port
+        self.calls = Counter()
+        self.http_requests = 0
+
+        self._loop = None
+        self._thread = None
+        self._runner = None
+        self._ready = threading.Event()
+        self._stop = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    # ---- 生命周期 ----
+
+    def start(self) -> "MockRPCNode":
+        self._thread = threading.Thread(target=self._run, name="mock-rpc", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        return self
+
+    def stop(self):
+        if self._loop and self._stop:
+            self._loop.call_soon_threadsafe(self._stop.set)
+            self._thread.join(timeout=5)
+
+    def __enter__(self) -> "MockRPCNode":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _run(self):
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_until_complete(self._serve())
+
+    async def _serve(self):
+        self._stop = asyncio.Event()
+        app = web.Application(client_max_size=64 * 1024 * 1024)
+        app.router.add_post("/", self._handle_http)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+
+        miner = asyncio.create_task(self._mine_loop()) if self.miner and self.block_time > 0 else None
+        self._ready.set()
+        await self._stop.wait()
+        if miner:
+            miner.cancel()
+        await self._runner.cleanup()
+
+    async def _mine_loop(self):
+        while True:
+            await asyncio.sleep(self.block_time)
+            self.chain.mine()
+
+    # ---- HTTP ----
+
+    def _latency(self) -> float:
+        if isinstance(self.latency, (tuple, list)):
+            return random.uniform(*self.latency)
+        return self.latency
+
+    def _take_token(self) -> bool:
+        now = time.monotonic()
+        self._tokens = min(self.rate_limit, self._tokens + (now - self._tokens_at) * self.rate_limit)
+        self._tokens_at = now
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    async def _handle_http(self, request: web.Request) -> web.Response:
+        self.http_requests += 1
+        if self.rate_limit and not self._take_token():
+            self.rate_limited += 1
+            return web.Response(status=429, text="too many requests")
+        delay = self._latency()
+        if delay:
+            await asyncio.sleep(delay)
+        if not self.available or (self.error_rate and random.random() < self.error_rate):
+            return web.Response(status=503, text="service unavailable")
+
+        payload = await request.json()
+        if isinstance(payload, list):
+            body = [self._dispatch(item) for item in payload]
+        else:
+            body = self._dispatch(payload)
+        return web.Response(text=json.dumps(body), content_type="application/json")
+
+    def _dispatch(self, request: dict) -> dict:
+        method = request.get("method")
+        params = request.get("params") or []
+        self.calls[method] += 1
+        response = {"jsonrpc": "2.0", "id": request.get("id")}
+        try:
+            handler = getattr(self, "rpc_" + method, None)
+            if handler is None:
+                raise RPCError(-32601, f"method {method} not found")
+            response["result"] = handler(*params)
+        except RPCError as e:
+            response["error"] = {"code": e.code, "message": e.message}
+        except Exception as e:
+            response["error"] = {"code": -32603, "message": str(e)}
+        return response
+
+    # ---- JSON-RPC 方法 ----
+
+    def rpc_eth_chainId(self):
+        return _hex(self.chain.chain_id)
+
+    def rpc_net_version(self):
+        return str(self.chain.chain_id)
+
+    def rpc_eth_blockNumber(self):
+        return _hex(self.chain.head["number"])
+
+    def rpc_eth_gasPrice(self):
+        return _hex(self.chain.gas_price)
+
+    def rpc_eth_getBalance(self, address, block="latest"):
+        return _hex(self.chain.balances[address.lower()])
+
+    def rpc_eth_getTransactionCount(self, address, block="latest"):
+        if block == "pending":
+            return _hex(self.chain.pending_nonce(address))
+        return _hex(self.chain.nonces[address.lower()])
+
+    def rpc_eth_getCode(self, address, block="latest"):
+        address = address.lower()
+        if address in self.chain.contracts or address == self.chain.multicall_address:
+            return "0x6080604052"
+        return "0x"
+
+    def rpc_eth_call(self, call, block="latest"):
+        return "0x" + self.chain.call(call).hex()
+
+    def rpc_eth_estimateGas(self, call, block="latest"):
+        return _hex(self.chain.estimate_gas(call))
+
+    def rpc_eth_sendRawTransaction(self, raw):
+        tx_hash = self.chain.send_raw_transaction(raw)
+        if self.block_time == 0:
+            self.chain.mine()
+        return tx_hash
+
+    def rpc_eth_getTransactionReceipt(self, tx_hash):
+        return self.chain.receipt(tx_hash)
+
+    def rpc_eth_getLogs(self, filter_params):
+        head = self.chain.head["number"]
+
+        def block_number(value):
+            return head if value in (None, "latest", "pending", "safe", "finalized") else int(value, 16)
+
+        from_block = block_number(filter_params.get("fromBlock"))
+        to_block = block_number(filter_params.get("toBlock"))
+        if self.logs_max_range and to_block - from_block + 1 > self.logs_max_range:
+            raise RPCError(-32000, f"block range is too wide (max {self.logs_max_range})")
+        logs = self.chain.get_logs(filter_params["address"], from_block, to_block, filter_params.get("topics"))
+        if self.logs_max_results and len(logs) > self.logs_max_results:
+            raise RPCError(-32005, f"query returned more than {self.logs_max_results} results")
+        return logs
+
+    def rpc_eth_getTransactionByHash(self, tx_hash):
+        tx = self.chain.txs.get(tx_hash.lower())
+        return self.chain.format_tx(tx) if tx else None
+
+    def rpc_eth_getBlockByNumber(self, number, full=False):
+        blocks = self.chain.blocks
+        if number in ("latest", "pending", "safe", "finalized"):
+            block = blocks[-1]
+        elif number == "earliest":
+            block = blocks[0]
+        else:
+            index = int(number, 16)
+            if index >= len(blocks):
+                return None
+            block = blocks[index]
+        return self.chain.format_block(block)
+
+
+def make_wallets(count: int, chain: MockChain, amount_wei: int = 2 * 10 ** 18) -> Tuple[list, list]:
+    """生成 count 个随机钱包并在模拟链上充值，返回 (私钥列表, 地址列表)"""
+    keys, addresses = [], []
+    for _ in range(count):
+        account = Account.create()
+        keys.append("0x" + bytes(account.key).hex())
+        addresses.append(account.address)
+        chain.fund(account.address, amount_wei)
+    return keys, addresses
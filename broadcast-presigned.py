@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+预签名交易广播脚本
+开售前用任一mint脚本选择 "只预签名" 生成 presigned_txs.txt，开售时运行本脚本:
+不再估算gas、查nonce或签名，直接把全部原始交易按批并发发出，然后等待确认
+
+用法: python broadcast-presigned.py [预签名文件] [--no-confirm] [--start 区块号/时间戳/本地时间]
+"""
+
+import argparse
+import asyncio
+
+from colorama import *
+
+from pharos_bot.drops import DROPS
+from pharos_bot.engine import BadgeMinter
+from pharos_bot.trigger import parse_start_target
+
+# 初始化colorama
+init()
+
+
+class PresignedBroadcaster(BadgeMinter):
+    """预签名交易广播器 - 认识 pharos_bot/drops.py 里的全部drop"""
+
+    TITLE = "预签名交易广播"
+
+    def __init__(self):
+        super().__init__(list(DROPS.values()))
+
+
+async def run(path: str, confirm: bool, start: str):
+    broadcaster = PresignedBroadcaster()
+    try:
+        if not await broadcaster.connect_to_network():
+            return
+        start_block, start_time = parse_start_target(start)
+        results = await broadcaster.broadcast_presigned(path, confirm=confirm, start_block=start_block, start_time=start_time)
+        if confirm:
+            broadcaster.print_final_report(results)
+    finally:
+        await broadcaster.close()
+
+
+# 程序入口
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="广播预签名的mint交易")
+    parser.add_argument("path", nargs="?", default="presigned_txs.txt", help="预签名文件")
+    parser.add_argument("--no-confirm", action="store_true", help="只广播，不等待确认")
+    parser.add_argument("--start", default="",
+                        help="到这个区块号 / Unix时间戳 / 本地时间 (如 '2026-10-20 20:00') 再广播，默认立即广播")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(run(args.path, not args.no_confirm, args.start))
+    except KeyboardInterrupt:
+        print(f"\n{Fore.YELLOW + Style.BRIGHT}⚠️ 用户中断程序{Style.RESET_ALL}")
+    except Exception as e:
+        print(f"\n{Fore.RED + Style.BRIGHT}💥 程序异常退出: {e}{Style.RESET_ALL}")
+        import traceback
+
+        traceback.print_exc()
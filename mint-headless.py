@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+非交互 / 分片 Mint脚本
+参数全部来自命令行或JSON配置文件，不等待任何输入，适合放在定时任务或多台机器上运行。
+--shard i/n 按地址哈希只处理第 i 片私钥 (i 从0开始)，本地状态文件和结果文件都按分片分开，
+全部分片跑完后用 merge 子命令合并结果; --mode sweep 把各钱包剩余的余额归集到 --collector
+
+用法:
+  python mint-headless.py run --shard 0/4 --concurrency 16 --results-dir results
+  python mint-headless.py run --config run.json --shard 1/4
+  python mint-headless.py merge results/*.json -o results/merged.json
+  python mint-headless.py run --mode sweep --collector 0x... --shard 0/4
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+from colorama import *
+
+from pharos_bot.drops import DROPS
+from pharos_bot.engine import BadgeMinter
+from pharos_bot.shards import merge_shard_results, parse_shard, shard_suffix, write_shard_results
+
+# 初始化colorama
+init()
+
+# 配置文件和命令行都没有给出时使用的值
+DEFAULTS = {
+    "drops": list(DROPS),
+    "keys": "private_keys.txt",
+    "concurrency": 8,
+    "mints_per_account": 1,
+    "mode": "mint",
+    "collector": None,
+    "start": "",
+    "shard": "0/1",
+    "results_dir": "results",
+    "rpc": None,
+}
+
+
+class HeadlessMinter(BadgeMinter):
+    """按 drop 名称组合的非交互Mint机器人"""
+
+    TITLE = "Pharos Badge Headless Mint"
+
+    def __init__(self, drop_keys):
+        unknown = [key for key in drop_keys if key not in DROPS]
+        if unknown:
+            raise ValueError(f"未知的drop: {', '.join(unknown)} (可选: {', '.join(DROPS)})")
+        super().__init__([DROPS[key] for key in drop_keys])
+
+
+def load_options(args) -> dict:
+    """配置文件 < 命令行参数 (命令行没有给出的项不覆盖配置文件)"""
+    options = dict(DEFAULTS)
+    if args.config:
+        options.update(json.loads(Path(args.config).read_text(encoding="utf-8")))
+    options.update({key: value for key, value in vars(args).items() if value is not None and key in DEFAULTS})
+    return options
+
+
+async def run(options: dict) -> int:
+    index, count = parse_shard(options["shard"])
+    minter = HeadlessMinter(options["drops"])
+    if options["rpc"]:
+        minter.RPC_URLS = list(options["rpc"])
+    minter.use_shard(index, count)
+    sweep = options["mode"] == "sweep"
+    if sweep and not options["collector"]:
+        raise SystemExit("--mode sweep 需要 --collector")
+
+    started = time.time()
+    results = await minter.run_headless(
+        options["keys"], options["concurrency"], options["mints_per_account"],
+        presign=options["mode"] == "presign", start=options["start"], shard=(index, count),
+        collector=options["collector"] if sweep else None,
+    )
+    if results is None:
+        # 连接网络或验证合约失败，原因已经打印过
+        return 2
+    if sweep:
+        # 归集汇总已写入 SWEEP_SUMMARY_FILE，有钱包归集失败 (余额查询失败、转账被拒绝或超时) 时退出码为1
+        return 1 if results["failed"] else 0
+    if options["mode"] == "presign":
+        # 结果是签好的交易数
+        return 0
+
+    path = Path(options["results_dir"]) / f"results{shard_suffix(index, count)}.json"
+    write_shard_results(
+        path, index, count, results,
+        drops=options["drops"], seconds=round(time.time() - started, 1),
+    )
+    print(f"{Fore.GREEN + Style.BRIGHT}💾 分片结果已写入: {path}{Style.RESET_ALL}")
+    return 0 if all(result["success"] for result in results) else 1
+
+
+def merge(paths, output: str) -> int:
+    merged = merge_shard_results(paths)
+    Path(output).parent.mkdir(parents=True, exist_ok=True)
+    Path(output).write_text(json.dumps(merged, ensure_ascii=False, indent=1), encoding="utf-8")
+
+    print(f"{Fore.CYAN + Style.BRIGHT}📊 合并 {merged['shards'] - len(merged['missing'])}/{merged['shards']} 个分片, "
+          f"{len(merged['results'])} 条结果, 最慢分片 {merged['seconds']} 秒{Style.RESET_ALL}")
+    for drop, stats in merged["summary"].items():
+        print(f"  {drop}: {stats['success']}/{stats['total']} 成功")
+    if merged["missing"]:
+        print(f"{Fore.RED + Style.BRIGHT}❌ 缺少分片: {', '.join(map(str, merged['missing']))}{Style.RESET_ALL}")
+    print(f"  合并结果: {output}")
+    if merged["missing"]:
+        return 1
+    return 0 if all(result["success"] for result in merged["results"]) else 1
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="非交互 / 分片 Mint")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="运行一个分片")
+    run_parser.add_argument("--config", help="JSON配置文件, 键与下面的参数同名 (下划线)")
+    run_parser.add_argument("--drops", nargs="+", help=f"要mint的drop, 默认全部: {' '.join(DROPS)}")
+    run_parser.add_argument("--keys", help="私钥文件, 默认 private_keys.txt")
+    run_parser.add_argument("--concurrency", type=int, help="并发账户数, 默认8")
+    run_parser.add_argument("--mints-per-account", type=int, help="每个钱包mint次数, 默认1")
+    run_parser.add_argument("--mode", choices=("mint", "presign", "sweep"),
+                            help="mint=立即mint, presign=只预签名, sweep=把剩余余额归集到 --collector")
+    run_parser.add_argument("--collector", help="归集地址 (--mode sweep)")
+    run_parser.add_argument("--start", help="定时开始: 区块号 / Unix时间戳 / 本地时间")
+    run_parser.add_argument("--shard", help="分片 i/n, 默认 0/1 (不分片)")
+    run_parser.add_argument("--results-dir", help="分片结果目录, 默认 results")
+    run_parser.add_argument("--rpc", nargs="+", help="覆盖RPC节点列表 (每台机器可以用自己的节点)")
+
+    merge_parser = commands.add_parser("merge", help="合并各分片的结果文件")
+    merge_parser.add_argument("paths", nargs="+", help="分片结果文件")
+    merge_parser.add_argument("-o", "--output", default="results/merged.json")
+
+    args = parser.parse_args()
+    if args.command == "merge":
+        return merge(args.paths, args.output)
+    return asyncio.run(run(load_options(args)))
+
+
+# 程序入口
+if __name__ == "__main__":
+    try:
+        sys.exit(main())
+    except KeyboardInterrupt:
+        print(f"\n{Fore.YELLOW + Style.BRIGHT}⚠️ 用户中断程序{Style.RESET_ALL}")
+        sys.exit(130)
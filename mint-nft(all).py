@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Pharos 测试网全部徽章 NFT Mint脚本
+一个进程、一遍私钥文件同时mint所有drop，共用RPC连接、nonce和地址索引
+
+用法: python "mint-nft(all).py" [drop ...]   (不指定时mint pharos_bot/drops.py 里的全部drop)
+"""
+
+import asyncio
+import sys
+
+from colorama import *
+
+from pharos_bot.drops import DROPS
+from pharos_bot.engine import BadgeMinter
+
+# 初始化colorama
+init()
+
+
+class AllBadgesMinter(BadgeMinter):
+    """多drop徽章NFT Mint机器人"""
+
+    TITLE = "Pharos Testnet Badge NFT Mint (多drop)"
+
+    def __init__(self, keys=None):
+        super().__init__([DROPS[key] for key in (keys or DROPS)])
+
+
+# 程序入口
+if __name__ == "__main__":
+    try:
+        unknown = [key for key in sys.argv[1:] if key not in DROPS]
+        if unknown:
+            print(f"{Fore.RED + Style.BRIGHT}未知的drop: {', '.join(unknown)} (可选: {', '.join(DROPS)}){Style.RESET_ALL}")
+            sys.exit(1)
+
+        minter = AllBadgesMinter(sys.argv[1:])
+        asyncio.run(minter.main())
+
+    except KeyboardInterrupt:
+        print(f"\n{Fore.YELLOW + Style.BRIGHT}⚠️ 用户中断程序{Style.RESET_ALL}")
+        print(f"{Fore.RED + Style.BRIGHT}[ EXIT ] Pharos Badge NFT Minter{Style.RESET_ALL}")
+    except Exception as e:
+        print(f"\n{Fore.RED + Style.BRIGHT}💥 程序异常退出: {e}{Style.RESET_ALL}")
+        import traceback
+
+        traceback.print_exc()
+    finally:
+        print(f"\n{Fore.GREEN + Style.BRIGHT}✨ 感谢使用 Pharos Badge NFT Mint脚本!{Style.RESET_ALL}")
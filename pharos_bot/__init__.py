@@ -0,0 +1,5 @@
+# -*- coding: utf-8 -*-
+"""
+pharos-bot 公共组件
+两个mint脚本共用的RPC批处理、交易构建等工具
+"""
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""
+claim() 调用数据模板
+同一个drop的所有账户只有 _receiver 不同，因此整段calldata只ABI编码一次，
+之后每个账户只替换 selector 后第一个32字节槽位里的地址
+"""
+
+from eth_abi import encode as abi_encode
+from eth_utils.abi import function_abi_to_4byte_selector, get_abi_input_types
+from web3 import Web3
+
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+# _receiver 是第一个静态参数: 4字节selector + 12字节左填充，地址占随后的20字节
+RECEIVER_START = 4 + 12
+RECEIVER_END = 4 + 32
+
+
+def claim_args(receiver: str, mint_params: dict) -> tuple:
+    """按 MINT_PARAMS 组装 claim(...) 的参数元组"""
+    allowlist = mint_params["allowlist_proof"]
+    return (
+        Web3.to_checksum_address(receiver),
+        mint_params["quantity"],
+        Web3.to_checksum_address(mint_params["currency"]),
+        mint_params["price_per_token"],
+        (
+            allowlist["proof"],
+            allowlist["quantityLimitPerWallet"],
+            allowlist["pricePerToken"],
+            Web3.to_checksum_address(allowlist["currency"])
+        ),
+        bytes.fromhex(mint_params["data"][2:]) if mint_params["data"] != "0x" else b""
+    )
+
+
+class ClaimCalldataTemplate:
+    """预编码的 claim() calldata，encode(receiver) 只做字节拼接"""
+
+    def __init__(self, contract_abi: list, mint_params: dict, function_name: str = "claim"):
+        function_abi = next(
+            item for item in contract_abi
+            if item.get("type") == "function" and item.get("name") == function_name
+        )
+        selector = function_abi_to_4byte_selector(function_abi)
+        types = get_abi_input_types(function_abi)
+        if types[0] != "address":
+            raise ValueError(f"{function_name} 的第一个参数不是address，无法使用receiver模板")
+
+        encoded = selector + abi_encode(types, claim_args(ZERO_ADDRESS, mint_params))
+        self.selector = selector
+        self._prefix = encoded[:RECEIVER_START]
+        self._suffix = encoded[RECEIVER_END:]
+
+    def encode(self, receiver: str) -> bytes:
+        """返回receiver对应的完整calldata"""
+        address = bytes.fromhex(receiver[2:] if receiver.startswith("0x") else receiver)
+        if len(address) != 20:
+            raise ValueError(f"无效的receiver地址: {receiver}")
+        return self._prefix + address + self._suffix
+
+    def encode_hex(self, receiver: str) -> str:
+        return "0x" + self.encode(receiver).hex()
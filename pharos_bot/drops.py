@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+"""
+Drop定义
+每个徽章drop只需要声明合约、ABI片段、mint参数和收据解析规则，
+由 engine.BadgeMinter 在同一个进程里共用节点池、nonce状态和地址索引统一调度
+"""
+
+from dataclasses import dataclass, field
+from typing import Callable, Optional, Tuple
+
+from web3 import Web3
+from web3.datastructures import AttributeDict
+
+from pharos_bot.calldata import ClaimCalldataTemplate
+from pharos_bot.gas import GasPolicy, ReplacementPolicy
+from pharos_bot.receipts import tokens_claimed_token_id, transfer_token_id
+
+# Pharos 测试网
+CHAIN_ID = 688688
+RPC_URLS = [
+    "https://api.zan.top/node/v1/pharos/testnet/0511efd49b7d435599fb3fb2bebb58b7",
+    "https://testnet.dplabs-internal.com",
+]
+EXPLORER_URL = "https://testnet.pharosscan.xyz"
+
+# thirdweb Drop 合约的 claim() 和 TokensClaimed 事件
+DROP_ABI = [
+    {
+        "inputs": [
+            {"internalType": "address", "name": "_receiver", "type": "address"},
+            {"internalType": "uint256", "name": "_quantity", "type": "uint256"},
+            {"internalType": "address", "name": "_currency", "type": "address"},
+            {"internalType": "uint256", "name": "_pricePerToken", "type": "uint256"},
+            {
+                "components": [
+                    {"internalType": "bytes32[]", "name": "proof", "type": "bytes32[]"},
+                    {"internalType": "uint256", "name": "quantityLimitPerWallet", "type": "uint256"},
+                    {"internalType": "uint256", "name": "pricePerToken", "type": "uint256"},
+                    {"internalType": "address", "name": "currency", "type": "address"}
+                ],
+                "internalType": "struct IDrop.AllowlistProof",
+                "name": "_allowlistProof",
+                "type": "tuple"
+            },
+            {"internalType": "bytes", "name": "_data", "type": "bytes"}
+        ],
+        "name": "claim",
+        "outputs": [],
+        "stateMutability": "payable",
+        "type": "function"
+    },
+    {
+        "anonymous": False,
+        "inputs": [
+            {"indexed": True, "internalType": "uint256", "name": "claimConditionIndex", "type": "uint256"},
+            {"indexed": True, "internalType": "address", "name": "claimer", "type": "address"},
+            {"indexed": True, "internalType": "address", "name": "receiver", "type": "address"},
+            {"indexed": False, "internalType": "uint256", "name": "startTokenId", "type": "uint256"},
+            {"indexed": False, "internalType": "uint256", "name": "quantityClaimed", "type": "uint256"}
+        ],
+        "name": "TokensClaimed",
+        "type": "event"
+    }
+]
+
+# 公开mint参数: 1 PHRS 原生币购买1个，空allowlist证明
+PUBLIC_MINT_PARAMS = {
+    "quantity": 1,  # 每次mint数量
+    "currency": "0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE",  # ETH/PHRS原生代币
+    "price_per_token": 1000000000000000000,  # 1 PHRS (1 * 10^18 wei)
+    "allowlist_proof": {
+        "proof": [],  # 空数组，表示公开mint
+        "quantityLimitPerWallet": 0,  # 无限制
+        "pricePerToken": 0xffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff,  # 最大值
+        "currency": "0x0000000000000000000000000000000000000000"  # 零地址
+    },
+    "data": "0x"  # 空bytes
+}
+
+# (收据, receiver, 合约地址) -> tokenId
+ReceiptParser = Callable[[AttributeDict, str, str], Optional[int]]
+
+
+@dataclass
+class DropConfig:
+    """一个徽章drop的声明式配置"""
+    key: str  # 短名称，用于命令行选择和结果记录
+    name: str  # NFT名称
+    contract: str
+    abi: list
+    mint_params: dict
+    receipt_parser: ReceiptParser
+    function_name: str = "claim"
+    # 在估算的gas上额外增加的比例
+    gas_buffer: float = 0.2
+    gas_policy: GasPolicy = field(default_factory=GasPolicy)
+    # 交易卡住时提价替换的策略，需要设置 max_price 才会启用
+    replacement: ReplacementPolicy = field(default_factory=ReplacementPolicy)
+    # 等待确认的最长时间(秒)
+    confirm_timeout: float = 300
+    # 合约部署区块: 持有者索引从这里开始回填日志，不知道时只回填最近的 INDEX_LOOKBACK_BLOCKS 个区块
+    deploy_block: Optional[int] = None
+    # 发送前打印交易参数
+    debug: bool = False
+    # 开始前展示给用户的提醒
+    notes: Tuple[str, ...] = ()
+
+    def __post_init__(self):
+        self.contract_address = Web3.to_checksum_address(self.contract)
+        # 预编码的claim() calldata，每个账户只替换receiver槽位
+        self.claim_template = ClaimCalldataTemplate(self.abi, self.mint_params, self.function_name)
+
+    @property
+    def price_per_token(self) -> int:
+        return self.mint_params["price_per_token"]
+
+    @property
+    def quantity(self) -> int:
+        return self.mint_params["quantity"]
+
+    @property
+    def short_contract(self) -> str:
+        return f"{self.contract[:8]}...{self.contract[-8:]}"
+
+
+ZENTRA_BADGE = DropConfig(
+    key="zentra",
+    name="Zentra Testnet Badge",
+    contract="0xe71188df7be6321ffd5aaa6e52e6c96375e62793",
+    abi=DROP_ABI,
+    mint_params=PUBLIC_MINT_PARAMS,
+    receipt_parser=tokens_claimed_token_id,
+    # 直接使用节点报价
+    gas_policy=GasPolicy(),
+    # 卡住的交易替换时最高出到5 Gwei
+    replacement=ReplacementPolicy(max_price=Web3.to_wei(5, "gwei")),
+    confirm_timeout=300,
+)
+
+FAROSWAP_BADGE = DropConfig(
+    key="faroswap",
+    name="FaroSwap Testnet Badge",
+    contract="0x2a469a4073480596b9deb19f52aa89891ccff5ce",
+    abi=DROP_ABI,
+    mint_params=PUBLIC_MINT_PARAMS,
+    receipt_parser=transfer_token_id,
+    gas_buffer=0.3,
+    # 节点报价提高50%以确保快速确认，最高5 Gwei，取价失败时用2 Gwei
+    gas_policy=GasPolicy(
+        multiplier=1.5,
+        max_price=Web3.to_wei(5, "gwei"),
+        fallback_price=Web3.to_wei(2, "gwei"),
+    ),
+    # 卡住的交易替换时最高出到10 Gwei
+    replacement=ReplacementPolicy(max_price=Web3.to_wei(10, "gwei")),
+    confirm_timeout=600,
+    debug=True,
+    notes=(
+        "如果此脚本仍然无法正确mint NFT，",
+        "说明我们可能仍未找到正确的NFT合约地址。",
+        "请提供您手动mint成功交易的完整 'To' 地址。",
+    ),
+)
+
+DROPS = {drop.key: drop for drop in (ZENTRA_BADGE, FAROSWAP_BADGE)}
@@ -0,0 +1,1432 @@
+# -*- coding: utf-8 -*-
+"""
+徽章Mint引擎
+一个进程里按 DropConfig 列表调度所有drop: 共用RPC节点池、gas价格、nonce状态、
+地址索引和收据监听器，读一遍私钥文件就覆盖全部drop
+"""
+
+import asyncio
+import json
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+import pytz
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
+from colorama import Fore, Style, init
+from eth_account import Account
+from web3 import AsyncWeb3, Web3
+from web3.datastructures import AttributeDict
+
+from pharos_bot.drops import CHAIN_ID, EXPLORER_URL, RPC_URLS, DropConfig
+from pharos_bot.gas import GasOracle
+from pharos_bot.gas_limits import GasLimitCache
+from pharos_bot.indexer import BadgeIndex, LogBackfill
+from pharos_bot.journal import BROADCAST, CONFIRMED, FAILED, IN_FLIGHT, PREFLIGHT, SIGNED, RunJournal
+from pharos_bot.keys import KeyIndex, iter_private_keys
+from pharos_bot.logger import DEBUG, ERROR, INFO, WARNING, AsyncLogger, ConsoleSink, JsonLinesSink
+from pharos_bot.metrics import RPCMetrics, rpc_context
+from pharos_bot.multicall import MULTICALL3_ADDRESS, multicall_holdings
+from pharos_bot.nonces import NonceManager, is_nonce_error
+from pharos_bot.preflight import batch_preflight
+from pharos_bot.presign import PresignedTx, read_presigned, write_presigned
+from pharos_bot.receipts import TOKENS_CLAIMED_TOPIC, TRANSFER_TOPIC, ReceiptWatcher
+from pharos_bot.rpc_pool import PooledAsyncHTTPProvider
+from pharos_bot.shards import select_shard, shard_suffix, with_suffix
+from pharos_bot.signing import BatchSigner, decode_transaction
+from pharos_bot.transfers import ACCEPTED, NONCE_USED, TRANSFER_GAS, Transfer, broadcast_outcome, send_transfers
+from pharos_bot.trigger import StartTrigger, parse_start_target
+
+# 初始化colorama
+init()
+
+# 时区设置
+wib = pytz.timezone('Asia/Jakarta')
+
+
+class BadgeMinter:
+    """Drop徽章NFT Mint机器人 - 可同时处理多个drop"""
+
+    # 报告标题
+    TITLE = "Pharos Testnet Badge NFT Mint"
+    # 日志级别; 子类不设置时, 有drop开启debug就输出调试信息, 否则从INFO开始
+    LOG_LEVEL: Optional[int] = None
+
+    def __init__(self, drops: List[DropConfig]):
+        self.drops = list(drops)
+
+        # 网络配置 - 多个RPC节点，按延迟和错误率自动选择，故障时切换
+        self.RPC_URLS = list(RPC_URLS)
+        self.CHAIN_ID = CHAIN_ID
+
+        # 异步连接池上限 - 同一进程内可同时在途的HTTP请求数
+        self.MAX_CONNECTIONS = 200
+
+        # 每个RPC节点的自适应限速 (AIMD令牌桶) 参数，例如 {"rate": 20, "max_rate": 100}；{"enabled": False} 关闭
+        self.RPC_RATE_LIMIT = {}
+
+        # Gas价格缓存时间 - 这段时间内的mint共用同一个节点报价，加价策略见各drop的 gas_policy
+        self.GAS_PRICE_TTL = 5
+
+        # Gas上限缓存 - 同一合约/函数/数量只估算一次，跨次运行保存在本地文件
+        self.GAS_LIMIT_CACHE_FILE = "gas_limits.json"
+        self.gas_limits = GasLimitCache(self.GAS_LIMIT_CACHE_FILE, chain_id=self.CHAIN_ID)
+
+        # 签名进程数 - 交易签名攒批后交给进程池，1 表示在主进程内签名
+        self.SIGNING_WORKERS = os.cpu_count() or 1
+        self.signer = BatchSigner(self.SIGNING_WORKERS)
+
+        # 地址索引 - 私钥指纹到地址的本地缓存，不保存明文私钥
+        self.KEY_INDEX_FILE = "private_keys.idx"
+        self.key_index = KeyIndex(self.KEY_INDEX_FILE)
+
+        # 断点续跑日志 - 记录每次mint的状态变化，中断后重新运行时跳过已完成的钱包
+        self.JOURNAL_FILE = "mint_journal.jsonl"
+        self.journal = RunJournal(self.JOURNAL_FILE)
+
+        # 预签名模式: 签好的交易写入这个文件，由 broadcast-presigned.py 在开售时广播
+        self.PRESIGN_FILE = "presigned_txs.txt"
+        # 广播时每个JSON-RPC批量请求包含的交易数
+        self.BROADCAST_BATCH_SIZE = 100
+
+        # 定时开始: 预计触发前多少秒预热，预热时给每个RPC节点建立多少条连接
+        self.PREWARM_SECONDS = 5
+        self.PREWARM_CONNECTIONS = 8
+
+        # 持有者索引 - 回填各drop的 Transfer/TokensClaimed 日志，记录哪些钱包已持有徽章，预检前直接跳过
+        self.BADGE_INDEX_FILE = "badge_index.json"
+        self.badge_index = BadgeIndex(self.BADGE_INDEX_FILE, chain_id=self.CHAIN_ID)
+        # 没有设置drop.deploy_block时，首次建立索引往前回填多少个区块；None 表示不建立索引
+        self.INDEX_LOOKBACK_BLOCKS = 200_000
+        # 每个 eth_getLogs 请求的初始区块数 (按节点反馈自动缩放) 和同时进行的请求数
+        self.INDEX_CHUNK_BLOCKS = 2000
+        self.INDEX_CONCURRENCY = 4
+
+        # 资金钱包: 私钥文件 (一行) 存在时，预检发现余额不足的钱包由它批量转账补足后再mint
+        self.TREASURY_KEY_FILE = "treasury_key.txt"
+        # 每个钱包在缺口之外多转的金额，以及等待补充交易确认的最长时间(秒)
+        self.FUNDING_MARGIN = Web3.to_wei(0.01, "ether")
+        self.FUNDING_TIMEOUT = 120
+
+        # 归集模式: 把各钱包剩余的余额 (扣掉转账gas) 转到指定地址，结果汇总写入这个文件
+        self.SWEEP_SUMMARY_FILE = "sweep_summary.json"
+
+        # 批量预检: 每个HTTP请求覆盖的地址数
+        self.PREFLIGHT_BATCH_SIZE = 200
+
+        # Multicall3预检: 一次eth_call取回一批地址的余额和徽章持有数，设为None或链上未部署时回退到逐个查询余额
+        self.MULTICALL_ADDRESS = MULTICALL3_ADDRESS
+        self.MULTICALL_BATCH_SIZE = 500
+
+        # RPC调用统计 - 按方法/阶段/账户记录次数、延迟和错误码，退出时写入汇总文件
+        self.RPC_METRICS_FILE = "rpc_metrics.json"
+        # 批量mint期间每隔多少秒打印一次RPC概况，0 表示不打印
+        self.RPC_METRICS_INTERVAL = 30
+        self.metrics = RPCMetrics()
+
+        self.w3 = None
+        self.session = None
+        self.receipt_watcher = None
+        self.nonce_manager = None
+        self.gas_oracle = None
+
+        # 预检结果 {地址: AccountPreflight}，以及余额不够全部mint的钱包还差多少wei
+        self.preflight = {}
+        self.shortfalls = {}
+
+        # 日志 - 批量mint期间由后台任务成批输出
+        if self.LOG_LEVEL is None:
+            self.LOG_LEVEL = DEBUG if any(drop.debug for drop in self.drops) else INFO
+        # 去掉颜色的 JSON lines 日志，设为None时不写
+        self.LOG_JSON_FILE = "mint_log.jsonl"
+        sinks = [ConsoleSink(wib)] + ([JsonLinesSink(self.LOG_JSON_FILE)] if self.LOG_JSON_FILE else [])
+        self.logger = AsyncLogger(sinks, level=self.LOG_LEVEL)
+
+    def use_shard(self, index: int, count: int):
+        """分片运行: 本地状态文件名加上分片后缀，同一台机器上的多个分片进程互不干扰"""
+        if count == 1:
+            return
+        suffix = shard_suffix(index, count)
+        for name in ("GAS_LIMIT_CACHE_FILE", "KEY_INDEX_FILE", "JOURNAL_FILE", "BADGE_INDEX_FILE",
+                     "PRESIGN_FILE", "RPC_METRICS_FILE", "LOG_JSON_FILE", "SWEEP_SUMMARY_FILE"):
+            if getattr(self, name):
+                setattr(self, name, with_suffix(getattr(self, name), suffix))
+        self.gas_limits = GasLimitCache(self.GAS_LIMIT_CACHE_FILE, chain_id=self.CHAIN_ID)
+        self.key_index = KeyIndex(self.KEY_INDEX_FILE)
+        self.journal.close()
+        self.journal = RunJournal(self.JOURNAL_FILE)
+        self.badge_index = BadgeIndex(self.BADGE_INDEX_FILE, chain_id=self.CHAIN_ID)
+        self.logger.sinks = [ConsoleSink(wib)] + ([JsonLinesSink(self.LOG_JSON_FILE)] if self.LOG_JSON_FILE else [])
+
+    def gas_limit_key(self, drop: DropConfig) -> str:
+        return self.gas_limits.key(drop.contract_address, drop.claim_template.selector, drop.quantity)
+
+    def clear_terminal(self):
+        os.system('cls' if os.name == 'nt' else 'clear')
+
+    def log(self, message, *args, level: int = INFO):
+        """message 可以带 %s 占位符，低于 LOG_LEVEL 的日志不会格式化参数"""
+        self.logger.log(message, *args, level=level)
+
+    def welcome(self):
+        print(Fore.LIGHTGREEN_EX + Style.BRIGHT + "\n" + "═" * 70)
+        print(Fore.GREEN + Style.BRIGHT + f"    🎨 {self.TITLE} 🎨")
+        print(Fore.CYAN + Style.BRIGHT + "    ──────────────────────────────────────")
+        for drop in self.drops:
+            price = Web3.from_wei(drop.price_per_token, 'ether')
+            print(Fore.YELLOW + Style.BRIGHT + f"    🏷️  {drop.name}: {drop.short_contract} ({price} PHRS)")
+        print(Fore.WHITE + Style.BRIGHT + f"    🌐 链ID: {self.CHAIN_ID}")
+        print(Fore.WHITE + Style.BRIGHT + "    📝 方法: claim() - Public mint")
+        print(Fore.LIGHTGREEN_EX + Style.BRIGHT + "═" * 70 + "\n")
+
+    async def connect_to_network(self) -> bool:
+        """连接到区块链网络"""
+        try:
+            # 所有请求共用一个aiohttp会话，复用TCP连接
+            self.session = ClientSession(
+                connector=TCPConnector(limit=self.MAX_CONNECTIONS),
+                timeout=ClientTimeout(total=60)
+            )
+            provider = PooledAsyncHTTPProvider(
+                self.RPC_URLS, session=self.session, metrics=self.metrics, rate_limit=self.RPC_RATE_LIMIT
+            )
+            self.w3 = AsyncWeb3(provider)
+
+            # 测试连接
+            with rpc_context(phase="connect"):
+                block_number = await self.w3.eth.block_number
+                chain_id = await self.w3.eth.chain_id
+
+            if chain_id != self.CHAIN_ID:
+                self.log(f"{Fore.RED + Style.BRIGHT}链ID不匹配: 期望 {self.CHAIN_ID}, 实际 {chain_id}{Style.RESET_ALL}", level=ERROR)
+                return False
+
+            # 本地nonce分配，同一钱包可以连续发送多笔交易
+            self.nonce_manager = NonceManager(self.w3)
+
+            # 共享gas价格预言机，后台按TTL刷新
+            self.gas_oracle = GasOracle(self.w3, ttl=self.GAS_PRICE_TTL)
+            with rpc_context(phase="gas_price"):
+                await self.gas_oracle.start()
+
+            # 所有待确认交易共用一个按区块轮询的收据监听器
+            self.receipt_watcher = ReceiptWatcher(self.w3)
+            with rpc_context(phase="receipts"):
+                await self.receipt_watcher.start()
+
+            self.log(f"{Fore.GREEN + Style.BRIGHT}✅ 网络连接成功{Style.RESET_ALL}")
+            self.log(f"{Fore.CYAN + Style.BRIGHT}   链ID: {chain_id}, 当前区块: {block_number}{Style.RESET_ALL}")
+            self.log(f"{Fore.CYAN + Style.BRIGHT}   RPC节点: {len(self.RPC_URLS)} 个{Style.RESET_ALL}")
+            return True
+
+        except Exception as e:
+            self.log(f"{Fore.RED + Style.BRIGHT}❌ 网络连接失败: {str(e)}{Style.RESET_ALL}", level=ERROR)
+            return False
+
+    async def close(self):
+        """停止后台任务并关闭共享的HTTP会话"""
+        if self.receipt_watcher:
+            await self.receipt_watcher.stop()
+        if self.gas_oracle:
+            await self.gas_oracle.stop()
+        self.gas_limits.save()
+        self.signer.shutdown()
+        self.journal.close()
+        self.logger.close()
+        if self.metrics.total_calls:
+            self.metrics.write_summary(self.RPC_METRICS_FILE)
+        if self.session and not self.session.closed:
+            await self.session.close()
+
+    async def check_balance(self, address: str) -> float:
+        """检查账户PHRS余额"""
+        try:
+            balance_wei = await self.w3.eth.get_balance(address)
+            balance_phrs = self.w3.from_wei(balance_wei, 'ether')
+            return float(balance_phrs)
+        except Exception as e:
+            self.log(f"{Fore.RED + Style.BRIGHT}❌ 获取余额失败: {str(e)}{Style.RESET_ALL}", level=ERROR)
+            return 0.0
+
+    async def verify_contract_addresses(self) -> bool:
+        """验证各drop的合约地址，去掉没有合约代码的drop"""
+        valid = []
+        for drop in self.drops:
+            try:
+                with rpc_context(phase="verify"):
+                    code = await self.w3.eth.get_code(drop.contract_address)
+            except Exception as e:
+                self.log(f"{Fore.RED + Style.BRIGHT}❌ 验证合约地址失败: {drop.name} {str(e)}{Style.RESET_ALL}", level=ERROR)
+                continue
+            if code == b'':
+                self.log(f"{Fore.RED + Style.BRIGHT}❌ 合约地址无效: {drop.name} {drop.contract}{Style.RESET_ALL}", level=ERROR)
+                continue
+            self.log(f"{Fore.GREEN + Style.BRIGHT}✅ 合约地址有效: {drop.name} {drop.contract}{Style.RESET_ALL}")
+            valid.append(drop)
+        self.drops = valid
+        return bool(valid)
+
+    async def sync_badge_index(self) -> bool:
+        """把各drop的持有者索引增量更新到最新区块，INDEX_LOOKBACK_BLOCKS 为None时不建立索引"""
+        if self.INDEX_LOOKBACK_BLOCKS is None:
+            return False
+        try:
+            head = await self.w3.eth.block_number
+        except Exception as e:
+            self.log(f"{Fore.YELLOW + Style.BRIGHT}⚠️ 持有者索引更新失败, 本次不使用索引: {str(e)}{Style.RESET_ALL}", level=WARNING)
+            return False
+        for drop in self.drops:
+            synced = self.badge_index.synced_to(drop.contract_address)
+            if synced is not None:
+                from_block = synced + 1
+            elif drop.deploy_block is not None:
+                from_block = drop.deploy_block
+            else:
+                from_block = max(0, head - self.INDEX_LOOKBACK_BLOCKS)
+            if from_block > head:
+                continue
+
+            start_time = time.time()
+            backfill = LogBackfill(
+                self.w3, drop.contract_address, [[Web3.to_hex(TRANSFER_TOPIC), Web3.to_hex(TOKENS_CLAIMED_TOPIC)]],
+                chunk_size=self.INDEX_CHUNK_BLOCKS, concurrency=self.INDEX_CONCURRENCY
+            )
+            try:
+                logs = await backfill.fetch(from_block, head)
+            except Exception as e:
+                self.log(f"{Fore.YELLOW + Style.BRIGHT}⚠️ 持有者索引更新失败: {drop.name} {str(e)}{Style.RESET_ALL}", level=WARNING)
+                continue
+            self.badge_index.apply(drop.contract_address, logs, from_block, head)
+            self.log(f"{Fore.GREEN + Style.BRIGHT}🗂️ 持有者索引: {drop.name} 区块 {from_block}-{head}, {len(logs)} 条日志, "
+                     f"{len(self.badge_index.holders(drop.contract_address))} 个持有者, "
+                     f"{backfill.requests} 次请求, 耗时 {time.time() - start_time:.2f} 秒{Style.RESET_ALL}")
+        self.badge_index.save()
+        return True
+
+    async def reconcile_with_index(self, results: List[dict], mints_per_account: int = 1) -> int:
+        """
+        用持有者索引核对失败的结果: 链上已经持有徽章的钱包 (例如确认超时其实已经上链) 改记为成功，
+        并在运行日志里记为已确认，下次运行不再重发或重新核对; 一次增量回填代替逐个钱包查收据，返回改正的条数
+        """
+        failed = [r for r in results if r is not None and not r["success"] and r["address"] != "unknown"]
+        if not failed:
+            return 0
+        with rpc_context(phase="index"):
+            if not await self.sync_badge_index():
+                return 0
+
+        drops = {drop.key: drop for drop in self.drops}
+        fixed, records = 0, []
+        for result in failed:
+            contract = drops[result["drop"]].contract_address
+            tokens = self.badge_index.tokens_of(contract, result["address"])
+            if len(tokens) >= mints_per_account:
+                result["success"] = True
+                result["result"] = f"核对索引: 已持有徽章 {', '.join(f'#{token_id}' for token_id in tokens)} ({result['result']})"
+                fixed += 1
+                # 不知道是哪笔交易上的链，交易哈希记为索引里对应的tokenId
+                for slot in range(mints_per_account):
+                    entry = self.journal.get(contract, result["address"], slot)
+                    if entry is None or entry.state != CONFIRMED:
+                        records.append((contract, result["address"], slot, CONFIRMED,
+                                        {"tx_hash": f"index:#{tokens[slot]}"}))
+        self.journal.record_many(records)
+        if fixed:
+            self.log(f"{Fore.GREEN + Style.BRIGHT}🗂️ 对照持有者索引改正 {fixed} 条失败结果{Style.RESET_ALL}")
+        return fixed
+
+    async def run_preflight(self, wallets: Dict[str, List[DropConfig]],
+                            mints_per_account: int = 1) -> Dict[Tuple[str, str], Tuple[bool, str]]:
+        """
+        批量预检所有钱包的余额和nonce，结果供mint_nft直接使用
+
+        wallets 是 {地址: 还需要mint的drop列表}。先通过Multicall3取余额和各徽章的持有数，
+        已持有徽章或余额不够的 (钱包, drop) 不再估算gas和签名，
+        返回这些被跳过的组合 {(地址, drop.key): (是否成功, 原因)}
+        """
+        start_time = time.time()
+
+        # 持有者索引里已经持有足够徽章的 (钱包, drop) 不再查链上状态
+        skipped = {}
+        with rpc_context(phase="index"):
+            await self.sync_badge_index()
+        unindexed = {}
+        for address, drops in wallets.items():
+            for drop in drops:
+                tokens = self.badge_index.tokens_of(drop.contract_address, address)
+                if len(tokens) >= mints_per_account:
+                    ids = ", ".join(f"#{token_id}" for token_id in tokens)
+                    skipped[(address, drop.key)] = (True, f"索引: 已持有徽章 {ids}, 跳过")
+                else:
+                    unindexed.setdefault(address, []).append(drop)
+
+        addresses = list(unindexed)
+        holdings = {}
+        if self.MULTICALL_ADDRESS:
+            holdings = await multicall_holdings(
+                self.w3, addresses, [drop.contract_address for drop in self.drops],
+                batch_size=self.MULTICALL_BATCH_SIZE, multicall=self.MULTICALL_ADDRESS
+            )
+
+        # 每次mint至少需要 NFT价格 + 已知的gas费用 (gas上限未缓存时只按NFT价格筛选)；
+        # 补充余额时按交易的gas上限 (含buffer，未缓存时按保守的20万gas) 计算，保证节点接受交易
+        mint_costs, funding_costs = {}, {}
+        for drop in self.drops:
+            try:
+                gas_price = await self.gas_oracle.gas_price(drop.gas_policy)
+            except Exception as e:
+                # 取不到报价时只按NFT价格筛选和补充，gas费用由补充余额的余量兜底，mint时再重新取价
+                self.log(f"{Fore.YELLOW + Style.BRIGHT}⚠️ 获取gas价格失败, 预检只按NFT价格计算: {drop.name} {str(e)}"
+                         f"{Style.RESET_ALL}", level=WARNING)
+                gas_price = 0
+            known_gas = self.gas_limits.get(self.gas_limit_key(drop)) or 0
+            mint_costs[drop.key] = drop.price_per_token + known_gas * gas_price
+            funding_costs[drop.key] = drop.price_per_token + int((known_gas or 200000) * (1 + drop.gas_buffer)) * gas_price
+
+        # 按drop顺序给每个钱包分配余额，不够的drop跳过
+        remaining = []
+        for address, drops in unindexed.items():
+            holding = holdings.get(address)
+            if holding is None:
+                remaining.append(address)
+                continue
+            budget = holding.balance_wei
+            for drop in drops:
+                owned = holding.token_balances.get(drop.contract_address, 0)
+                cost = mint_costs[drop.key] * mints_per_account
+                if owned >= mints_per_account:
+                    skipped[(address, drop.key)] = (True, f"已持有 {owned} 个徽章, 跳过")
+                elif budget < cost:
+                    balance = self.w3.from_wei(holding.balance_wei, 'ether')
+                    skipped[(address, drop.key)] = (False, f"余额不足: 当前 {balance:.6f} PHRS")
+                else:
+                    budget -= cost
+            if any((address, drop.key) not in skipped for drop in drops):
+                remaining.append(address)
+
+        # 剩下的钱包批量取pending nonce，Multicall3已经取到的余额不再重复查询
+        preflight, gas_price = await batch_preflight(
+            self.w3, remaining, batch_size=self.PREFLIGHT_BATCH_SIZE,
+            balances={address: holding.balance_wei for address, holding in holdings.items()},
+            with_gas_price=not self.gas_oracle.is_fresh
+        )
+        self.preflight.update(preflight)
+        if gas_price:
+            self.gas_oracle.seed(gas_price)
+        for address, state in preflight.items():
+            self.nonce_manager.seed(address, state.nonce)
+
+        # 余额缺口: 还没持有徽章的drop全部mint完所需的金额减去当前余额，供资金钱包补充
+        self.shortfalls = {}
+        for address, drops in unindexed.items():
+            if address in holdings:
+                balance = holdings[address].balance_wei
+            elif address in preflight:
+                balance = preflight[address].balance_wei
+            else:
+                continue
+            need = sum(funding_costs[drop.key] * mints_per_account for drop in drops
+                       if not skipped.get((address, drop.key), (False,))[0])
+            if need > balance:
+                self.shortfalls[address] = need - balance
+
+        minted = sum(1 for ok, _ in skipped.values() if ok)
+        self.log(
+            f"{Fore.GREEN + Style.BRIGHT}🔍 批量预检完成: {len(preflight)}/{len(wallets)} 个地址, "
+            f"已持有徽章 {minted} 个, 余额不足 {len(skipped) - minted} 个, "
+            f"耗时 {time.time() - start_time:.2f} 秒{Style.RESET_ALL}")
+        return skipped
+
+    def load_treasury_key(self) -> Optional[str]:
+        """读取资金钱包私钥，没有配置时返回None"""
+        if not self.TREASURY_KEY_FILE or not Path(self.TREASURY_KEY_FILE).exists():
+            return None
+        return next(iter_private_keys(self.TREASURY_KEY_FILE), None)
+
+    async def fund_wallets(self, shortfalls: Dict[str, int]) -> List[str]:
+        """
+        资金钱包按缺口 (+ FUNDING_MARGIN) 批量转账，返回补充成功的地址
+
+        资金钱包的nonce在本地连续分配，全部转账一次签好、按批广播，再由共享的收据监听器等待确认;
+        资金钱包余额不够时按顺序补到用完为止
+        """
+        treasury_key = self.load_treasury_key()
+        if treasury_key is None or not shortfalls:
+            return []
+        treasury = Account.from_key(treasury_key).address
+        start_time = time.time()
+
+        gas_price = await self.gas_oracle.gas_price()
+        available = await self.w3.eth.get_balance(treasury)
+        transfers = []
+        for address, shortfall in shortfalls.items():
+            amount = shortfall + self.FUNDING_MARGIN
+            if available < amount + TRANSFER_GAS * gas_price:
+                break
+            available -= amount + TRANSFER_GAS * gas_price
+            transfers.append(Transfer(treasury, treasury_key, address, amount))
+        if len(transfers) < len(shortfalls):
+            self.log(f"{Fore.YELLOW + Style.BRIGHT}⚠️ 资金钱包余额不足, 只能补充 {len(transfers)}/{len(shortfalls)} 个钱包"
+                     f"{Style.RESET_ALL}", level=WARNING)
+        if not transfers:
+            return []
+
+        total = self.w3.from_wei(sum(transfer.value for transfer in transfers), 'ether')
+        self.log(f"{Fore.YELLOW + Style.BRIGHT}💧 资金钱包 {treasury} 向 {len(transfers)} 个钱包补充 {total:.4f} PHRS{Style.RESET_ALL}")
+        await send_transfers(
+            self.w3, self.signer, self.nonce_manager, self.receipt_watcher, transfers, gas_price, self.CHAIN_ID,
+            batch_size=self.BROADCAST_BATCH_SIZE, timeout=self.FUNDING_TIMEOUT
+        )
+        for transfer in transfers:
+            if transfer.error:
+                self.log(f"{Fore.RED + Style.BRIGHT}❌ 补充余额失败: {transfer.to} {transfer.error}{Style.RESET_ALL}", level=ERROR)
+
+        funded = [transfer.to for transfer in transfers if transfer.confirmed]
+        self.log(f"{Fore.GREEN + Style.BRIGHT}💧 补充余额完成: {len(funded)}/{len(transfers)} 个钱包, "
+                 f"耗时 {time.time() - start_time:.2f} 秒{Style.RESET_ALL}")
+        return funded
+
+    async def preflight_and_fund(self, wallets: Dict[str, List[DropConfig]],
+                                 mints_per_account: int = 1) -> Dict[Tuple[str, str], Tuple[bool, str]]:
+        """批量预检; 配置了资金钱包时补足余额不够的钱包，再对它们重新预检，返回仍需跳过的组合"""
+        with rpc_context(phase="preflight"):
+            skipped = await self.run_preflight(wallets, mints_per_account)
+        if not self.shortfalls:
+            return skipped
+
+        with rpc_context(phase="funding"):
+            funded = await self.fund_wallets(self.shortfalls)
+        if funded:
+            funded_wallets = {address: wallets[address] for address in funded}
+            skipped = {key: value for key, value in skipped.items() if key[0] not in funded_wallets}
+            with rpc_context(phase="preflight"):
+                skipped.update(await self.run_preflight(funded_wallets, mints_per_account))
+        return skipped
+
+    async def estimate_gas_and_cost(self, drop: DropConfig, address: str) -> Tuple[int, float]:
+        """估算gas消耗和总成本"""
+        try:
+            # 估算gas - 命中缓存时不再请求 eth_estimateGas
+            estimated_gas = await self.gas_limits.get_or_estimate(
+                self.gas_limit_key(drop),
+                lambda: self.w3.eth.estimate_gas({
+                    "from": address,
+                    "to": drop.contract_address,
+                    "data": drop.claim_template.encode(address),
+                    "value": drop.price_per_token  # NFT价格
+                })
+            )
+
+            # 计算总成本 (NFT价格 + Gas费用)
+            gas_price = await self.gas_oracle.gas_price(drop.gas_policy)
+            gas_cost = estimated_gas * gas_price
+            nft_cost = drop.price_per_token
+            total_cost_wei = nft_cost + gas_cost
+            total_cost_phrs = self.w3.from_wei(total_cost_wei, 'ether')
+
+            return estimated_gas, float(total_cost_phrs)
+
+        except Exception as e:
+            self.log(f"{Fore.YELLOW + Style.BRIGHT}⚠️ Gas估算失败: {str(e)}{Style.RESET_ALL}", level=WARNING)
+            # 返回保守估算值
+            return 200000, 1.01  # 大约1.01 PHRS
+
+    async def sign_and_send(self, drop: DropConfig, private_key: str, address: str, transaction: dict,
+                            slot: int = 0):
+        """分配nonce、签名并广播，nonce与链上不一致时重新同步后重试一次"""
+        for attempt in range(2):
+            transaction["nonce"] = await self.nonce_manager.allocate(address)
+            raw_transaction = await self.signer.sign(transaction, private_key)
+
+            # 广播前先把签好的交易写入日志，发送途中被中断也能在下次运行时原样重发
+            self.journal.record(
+                drop.contract_address, address, slot, SIGNED,
+                tx_hash=self.w3.to_hex(Web3.keccak(raw_transaction)),
+                raw_tx=self.w3.to_hex(raw_transaction),
+                nonce=transaction["nonce"]
+            )
+            try:
+                tx_hash = await self.w3.eth.send_raw_transaction(raw_transaction)
+                self.journal.record(drop.contract_address, address, slot, BROADCAST)
+                return tx_hash
+            except Exception as e:
+                if attempt == 0 and is_nonce_error(e):
+                    self.log(f"{Fore.YELLOW + Style.BRIGHT}⚠️ nonce冲突, 重新同步: {str(e)}{Style.RESET_ALL}", level=WARNING)
+                    await self.nonce_manager.resync(address)
+                    continue
+                # nonce会被释放给后续交易使用，这笔已签名的交易随之作废
+                self.journal.record(drop.contract_address, address, slot, FAILED, error=str(e))
+                self.nonce_manager.release(address, transaction["nonce"])
+                raise
+
+    async def resume_transaction(self, drop: DropConfig, address: str, slot: int, entry) -> Optional[bytes]:
+        """
+        重新挂上上次运行未完成的交易: 原样重发已签名的交易 (同一nonce，不会重复mint)，返回原交易哈希;
+        nonce已被使用而被替换掉的旧交易已经上链时返回那笔旧交易的哈希
+        """
+        self.log(f"{Fore.YELLOW + Style.BRIGHT}🔁 恢复未完成的交易: {entry.tx_hash}{Style.RESET_ALL}")
+        try:
+            await self.w3.eth.send_raw_transaction(entry.raw_tx)
+        except Exception as e:
+            if is_nonce_error(e):
+                # nonce已被使用: 这笔交易和被它替换的旧交易都查不到收据，说明nonce被其他交易占用，需要重新mint
+                for tx_hash in [entry.tx_hash] + (entry.replaced or []):
+                    try:
+                        await self.w3.eth.get_transaction_receipt(tx_hash)
+                        return Web3.to_bytes(hexstr=tx_hash)
+                    except Exception:
+                        continue
+                self.journal.record(drop.contract_address, address, slot, FAILED, error=str(e))
+                return None
+            # 其他错误 (如 already known) 说明节点已经有这笔交易，继续等待即可
+        if entry.state == SIGNED:
+            self.journal.record(drop.contract_address, address, slot, BROADCAST)
+        return Web3.to_bytes(hexstr=entry.tx_hash)
+
+    def resume_resign(self, entry, private_key: str, address: str) -> Optional[Tuple[str, dict]]:
+        """从日志里最后签名的交易还原 (私钥, 交易)，恢复的交易卡住时同样可以提价替换; 解析不了时只等待不替换"""
+        try:
+            transaction = decode_transaction(entry.raw_tx)
+        except Exception as e:
+            self.log(f"{Fore.YELLOW + Style.BRIGHT}⚠️ 无法解析恢复的交易, 只等待不替换: {str(e)}{Style.RESET_ALL}",
+                     level=WARNING)
+            return None
+        transaction["from"] = address
+        return private_key, transaction
+
+    async def mint_nft(self, drop: DropConfig, private_key: str, address: str, slot: int = 0) -> Tuple[bool, str]:
+        """执行NFT mint"""
+        try:
+            # 断点续跑: 已确认的直接跳过，上次运行已签名/已广播的交易重新挂上原哈希
+            entry = self.journal.get(drop.contract_address, address, slot)
+            if entry is not None and entry.state == CONFIRMED:
+                # 旧日志里可能有没有交易哈希的已确认记录
+                tx_hash = entry.tx_hash or "已确认"
+                self.log(f"{Fore.GREEN + Style.BRIGHT}⏭️ 之前的运行中已确认, 跳过: {tx_hash}{Style.RESET_ALL}")
+                return True, tx_hash
+            if entry is not None and entry.state in IN_FLIGHT:
+                with rpc_context(phase="resume"):
+                    tx_hash = await self.resume_transaction(drop, address, slot, entry)
+                if tx_hash is not None:
+                    return await self.confirm_mint(drop, address, slot, tx_hash, replaced=entry.replaced,
+                                                   resign=self.resume_resign(entry, private_key, address))
+
+            # 检查余额 - 优先使用批量预检结果
+            preflight = self.preflight.get(address)
+            if preflight is not None:
+                balance = float(self.w3.from_wei(preflight.balance_wei, 'ether'))
+            else:
+                with rpc_context(phase="balance"):
+                    balance = await self.check_balance(address)
+            with rpc_context(phase="estimate"):
+                estimated_gas, total_cost = await self.estimate_gas_and_cost(drop, address)
+
+            self.log(f"{Fore.CYAN + Style.BRIGHT}💰 账户余额: {balance:.6f} PHRS{Style.RESET_ALL}")
+            self.log(f"{Fore.CYAN + Style.BRIGHT}⛽ 预估Gas: {estimated_gas:,}{Style.RESET_ALL}")
+            self.log(f"{Fore.CYAN + Style.BRIGHT}💸 预估总成本: {total_cost:.6f} PHRS{Style.RESET_ALL}")
+
+            if balance < total_cost:
+                error_msg = f"余额不足: 需要 {total_cost:.6f} PHRS, 当前 {balance:.6f} PHRS"
+                self.log(f"{Fore.RED + Style.BRIGHT}❌ {error_msg}{Style.RESET_ALL}", level=ERROR)
+                self.journal.record(drop.contract_address, address, slot, FAILED, error=error_msg)
+                return False, error_msg
+
+            self.journal.record(drop.contract_address, address, slot, PREFLIGHT)
+
+            # 获取gas价格 (nonce在发送时由本地nonce管理器分配)
+            with rpc_context(phase="gas_price"):
+                gas_price = await self.gas_oracle.gas_price(drop.gas_policy)
+
+            # 构建交易
+            transaction = {
+                "from": address,
+                "to": drop.contract_address,
+                "data": drop.claim_template.encode(address),
+                "value": drop.price_per_token,  # NFT价格
+                "gas": int(estimated_gas * (1 + drop.gas_buffer)),  # 增加gas buffer
+                "gasPrice": gas_price,
+                "chainId": self.CHAIN_ID
+            }
+
+            # 打印调试信息 - 日志级别高于DEBUG时整段跳过
+            if drop.debug and self.logger.enabled(DEBUG):
+                self.log(f"{Fore.YELLOW + Style.BRIGHT}🔍 调试信息:{Style.RESET_ALL}", level=DEBUG)
+                self.log("   ⛽ Gas价格: %.2f Gwei", self.w3.from_wei(gas_price, 'gwei'), level=DEBUG)
+                self.log("   合约地址: %s", drop.contract, level=DEBUG)
+                self.log("   接收者: %s", address, level=DEBUG)
+                self.log("   数量: %s", drop.quantity, level=DEBUG)
+                self.log("   价格: %s wei", drop.price_per_token, level=DEBUG)
+                self.log("   allowlist.pricePerToken: %#x", drop.mint_params['allowlist_proof']['pricePerToken'],
+                         level=DEBUG)
+
+            # 分配nonce、签名并发送交易
+            self.log(f"{Fore.YELLOW + Style.BRIGHT}📤 发送mint交易: {drop.name}{Style.RESET_ALL}")
+            with rpc_context(phase="send"):
+                tx_hash = await self.sign_and_send(drop, private_key, address, transaction, slot)
+            return await self.confirm_mint(drop, address, slot, tx_hash, resign=(private_key, transaction))
+
+        except Exception as e:
+            error_msg = f"Mint异常: {str(e)}"
+            self.log(f"{Fore.RED + Style.BRIGHT}❌ {error_msg}{Style.RESET_ALL}", level=ERROR)
+            self.journal.fail(drop.contract_address, address, slot, error_msg)
+            return False, error_msg
+
+    async def replace_transaction(self, drop: DropConfig, address: str, slot: int, private_key: str,
+                                  transaction: dict, gas_price: int, replaced: List[str]) -> Optional[str]:
+        """用同一nonce、更高的gas价格重新签名并发送，返回新交易哈希; 节点拒绝时返回None"""
+        transaction = dict(transaction, gasPrice=gas_price)
+        raw_transaction = await self.signer.sign(transaction, private_key)
+        tx_hash = self.w3.to_hex(Web3.keccak(raw_transaction))
+
+        # 和首次发送一样先写日志; replaced 保存之前发出的全部哈希，恢复时任何一笔上链都算完成
+        self.journal.record(
+            drop.contract_address, address, slot, SIGNED,
+            tx_hash=tx_hash, raw_tx=self.w3.to_hex(raw_transaction), nonce=transaction["nonce"], replaced=list(replaced)
+        )
+        try:
+            await self.w3.eth.send_raw_transaction(raw_transaction)
+        except Exception as e:
+            outcome, message = broadcast_outcome(e)
+            if outcome != ACCEPTED:
+                # 多半是旧交易已经上链 (nonce too low)，继续等待旧交易的收据
+                self.log(f"{Fore.YELLOW + Style.BRIGHT}⚠️ 替换交易被拒绝: {message}{Style.RESET_ALL}", level=WARNING)
+                return None
+        self.journal.record(drop.contract_address, address, slot, BROADCAST)
+        return tx_hash
+
+    async def wait_for_receipt(self, drop: DropConfig, address: str, slot: int, hashes: List[str],
+                               resign: Optional[Tuple[str, dict]] = None) -> Tuple[str, AttributeDict]:
+        """
+        同时等待 hashes 里所有交易的收据，任何一笔上链即返回 (交易哈希, 收据)，超时抛出 asyncio.TimeoutError
+
+        提供 resign=(私钥, 交易) 且drop开启替换策略时，连续 after_blocks 个区块没被打包就提价替换，
+        新哈希追加到 hashes 里一起等待; 预签名广播没有私钥，只等待不替换
+        """
+        policy = drop.replacement
+        watcher = self.receipt_watcher
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + drop.confirm_timeout
+        futures = {tx_hash: watcher.watch(tx_hash) for tx_hash in hashes}
+        can_replace = resign is not None and policy.enabled
+        sent_at = watcher.head
+        try:
+            while True:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    raise asyncio.TimeoutError()
+                await asyncio.wait(futures.values(), timeout=min(remaining, watcher.poll_interval),
+                                   return_when=asyncio.FIRST_COMPLETED)
+                for tx_hash, future in futures.items():
+                    if future.done() and not future.cancelled():
+                        return tx_hash, future.result()
+
+                if not can_replace or watcher.head - sent_at < policy.after_blocks:
+                    continue
+
+                private_key, transaction = resign
+                with rpc_context(phase="gas_price"):
+                    market_price = await self.gas_oracle.gas_price(drop.gas_policy)
+                gas_price = policy.next_price(transaction["gasPrice"], market_price)
+                if gas_price is None:
+                    self.log(f"{Fore.YELLOW + Style.BRIGHT}⚠️ 已到替换gas价格上限, 继续等待已发出的交易{Style.RESET_ALL}",
+                             level=WARNING)
+                    can_replace = False
+                    continue
+
+                replacements = len(hashes)
+                self.log(f"{Fore.YELLOW + Style.BRIGHT}⛽ {watcher.head - sent_at} 个区块未被打包, "
+                         f"gas价格提高到 {self.w3.from_wei(gas_price, 'gwei'):.2f} Gwei 重新发送 "
+                         f"(第 {replacements} 次替换){Style.RESET_ALL}")
+                with rpc_context(phase="replace"):
+                    tx_hash = await self.replace_transaction(drop, address, slot, private_key, transaction,
+                                                             gas_price, hashes)
+                if tx_hash is None:
+                    can_replace = False
+                    continue
+                resign = (private_key, dict(transaction, gasPrice=gas_price))
+                hashes.append(tx_hash)
+                futures[tx_hash] = watcher.watch(tx_hash)
+                sent_at = watcher.head
+                can_replace = replacements < policy.max_replacements
+        finally:
+            for tx_hash in futures:
+                watcher.forget(tx_hash)
+
+    async def confirm_mint(self, drop: DropConfig, address: str, slot: int, tx_hash,
+                           replaced: Optional[List[str]] = None,
+                           resign: Optional[Tuple[str, dict]] = None) -> Tuple[bool, str]:
+        """
+        等待mint交易确认并按drop的规则解析结果; 超时的交易保留在日志里，下次运行继续等待
+
+        replaced 是这笔交易替换掉的旧交易哈希 (一起等待)；resign=(私钥, 交易) 时卡住的交易按drop的替换策略提价重发
+        """
+        hashes = list(replaced or []) + [self.w3.to_hex(tx_hash)]
+
+        self.log(f"{Fore.CYAN + Style.BRIGHT}⏳ 等待交易确认: {hashes[-1]}{Style.RESET_ALL}")
+
+        # 等待交易确认 - 由收据监听器在交易被打包的区块里直接取回收据 (轮询的调用记在 receipts 阶段)
+        try:
+            tx_hash_hex, receipt = await self.wait_for_receipt(drop, address, slot, hashes, resign)
+        except asyncio.TimeoutError:
+            self.log(f"{Fore.RED + Style.BRIGHT}❌ 交易确认超时: {drop.confirm_timeout:.0f} 秒内未被打包{Style.RESET_ALL}", level=ERROR)
+            self.log(f"{Fore.YELLOW + Style.BRIGHT}🌐 浏览器: {EXPLORER_URL}/tx/{hashes[-1]}{Style.RESET_ALL}")
+
+            # 尝试再次检查交易状态 (包括被替换掉的旧交易)
+            receipt = None
+            for tx_hash_hex in reversed(hashes):
+                try:
+                    with rpc_context(phase="confirm"):
+                        receipt = await self.w3.eth.get_transaction_receipt(tx_hash_hex)
+                    break
+                except Exception:
+                    continue
+            if receipt is None:
+                return False, f"交易确认超时: {hashes[-1]}"
+            self.log(f"{Fore.GREEN + Style.BRIGHT}✅ 找到交易收据!{Style.RESET_ALL}")
+
+        if receipt.status == 1:
+            # 用实际消耗校正gas上限缓存
+            self.gas_limits.observe(self.gas_limit_key(drop), receipt.gasUsed)
+
+            # 按drop的规则从事件日志里解析tokenId
+            token_id = drop.receipt_parser(receipt, address, drop.contract_address)
+
+            success_msg = f"Mint成功! {drop.name} TX: {tx_hash_hex}"
+            if token_id is not None:
+                success_msg += f", Token ID: #{token_id}"
+                self.log(f"{Fore.GREEN + Style.BRIGHT}✅ {success_msg}{Style.RESET_ALL}")
+            else:
+                self.log(f"{Fore.YELLOW + Style.BRIGHT}⚠️ {success_msg}{Style.RESET_ALL}", level=WARNING)
+                self.log(f"{Fore.YELLOW + Style.BRIGHT}⚠️ 未检测到NFT mint事件，请手动查看{Style.RESET_ALL}", level=WARNING)
+
+            self.journal.record(drop.contract_address, address, slot, CONFIRMED, tx_hash=tx_hash_hex)
+            return True, tx_hash_hex
+        else:
+            error_msg = f"交易失败: {tx_hash_hex}"
+            self.log(f"{Fore.RED + Style.BRIGHT}❌ {error_msg}{Style.RESET_ALL}", level=ERROR)
+            self.journal.record(drop.contract_address, address, slot, FAILED, tx_hash=tx_hash_hex, error=error_msg)
+            return False, error_msg
+
+    def _result(self, address: str, drop: DropConfig, success: bool, result: str) -> dict:
+        return {
+            "address": address,
+            "drop": drop.key,
+            "success": success,
+            "result": result,
+            "timestamp": datetime.now().isoformat()
+        }
+
+    async def process_single_account(self, private_key: str, mints_per_account: int = 1,
+                                     drops: Optional[List[DropConfig]] = None) -> List[dict]:
+        """处理单个账户的mint - 所有drop、所有次数使用连续nonce并行发送，每个drop返回一条结果"""
+        drops = drops or self.drops
+        try:
+            # 优先从地址索引读取，索引里没有时再推导
+            address = self.key_index.lookup(private_key) or Account.from_key(private_key).address
+
+            self.log(f"{Fore.BLUE + Style.BRIGHT}🔄 处理账户: {address}{Style.RESET_ALL}")
+
+            # 执行mint
+            jobs = [(drop, slot) for drop in drops for slot in range(mints_per_account)]
+            with rpc_context(account=address):
+                if len(jobs) == 1:
+                    outcomes = [await self.mint_nft(drops[0], private_key, address)]
+                else:
+                    outcomes = await asyncio.gather(
+                        *(self.mint_nft(drop, private_key, address, slot) for drop, slot in jobs)
+                    )
+
+            results = []
+            for j, drop in enumerate(drops):
+                drop_outcomes = outcomes[j * mints_per_account:(j + 1) * mints_per_account]
+                success = all(ok for ok, _ in drop_outcomes)
+                result = "; ".join(message for _, message in drop_outcomes)
+                results.append(self._result(address, drop, success, result))
+            return results
+
+        except Exception as e:
+            return [self._result("unknown", drop, False, f"账户处理异常: {str(e)}") for drop in drops]
+
+    async def process_accounts(self, private_keys: List[str], concurrency: int = 1, mints_per_account: int = 1):
+        """
+        批量处理账户mint - concurrency 个账户同时进行，请求速率由RPC池按节点的实际承受能力自动调节
+
+        每个私钥的每个drop一条结果，按 (私钥顺序, drop顺序) 返回
+        """
+        total_accounts = len(private_keys)
+        drop_count = len(self.drops)
+        results: List[Optional[dict]] = [None] * (total_accounts * drop_count)
+
+        positions = {drop.key: j for j, drop in enumerate(self.drops)}
+
+        def slot_of(i: int, drop: DropConfig) -> int:
+            return (i - 1) * drop_count + positions[drop.key]
+
+        # 地址索引: 首次运行并行推导地址并写入本地索引，之后直接查表
+        addresses = await self.key_index.resolve(private_keys, executor=self.signer.pool)
+
+        # 断点续跑: 之前的运行中已全部确认的 (钱包, drop) 直接使用日志里的结果
+        pending = []
+        for i, (private_key, address) in enumerate(zip(private_keys, addresses), 1):
+            todo = []
+            for drop in self.drops:
+                tx_hashes = self.journal.confirmed(drop.contract_address, address, mints_per_account) if address else None
+                if tx_hashes is None:
+                    todo.append(drop)
+                else:
+                    results[slot_of(i, drop)] = self._result(
+                        address, drop, True, "; ".join(tx_hash or "已确认" for tx_hash in tx_hashes)
+                    )
+            if todo:
+                pending.append((i, private_key, address, todo))
+        if len(pending) < total_accounts:
+            self.log(f"{Fore.GREEN + Style.BRIGHT}⏭️ 跳过已完成的钱包: {total_accounts - len(pending)} 个{Style.RESET_ALL}")
+
+        # 批量预检，替代每个账户单独的余额/nonce/gas价格查询，并筛掉已持有徽章或余额不足的钱包
+        skipped = await self.preflight_and_fund(
+            {address: todo for _, _, address, todo in pending if address}, mints_per_account
+        )
+
+        queue = asyncio.Queue()
+        for i, private_key, address, todo in pending:
+            drops = []
+            for drop in todo:
+                if (address, drop.key) in skipped:
+                    success, reason = skipped[(address, drop.key)]
+                    results[slot_of(i, drop)] = self._result(address, drop, success, reason)
+                else:
+                    drops.append(drop)
+            if drops:
+                queue.put_nowait((i, private_key, drops))
+        concurrency = max(1, min(concurrency, queue.qsize()))
+
+        self.log(f"{Fore.GREEN + Style.BRIGHT}🚀 开始批量mint: {queue.qsize()} 个账户, {drop_count} 个drop, "
+                 f"并发: {concurrency}{Style.RESET_ALL}")
+
+        async def worker():
+            while not queue.empty():
+                i, private_key, drops = queue.get_nowait()
+                self.log(f"{Fore.CYAN + Style.BRIGHT}📋 进度: {i}/{total_accounts}{Style.RESET_ALL}")
+
+                # 处理账户
+                for drop, result in zip(drops, await self.process_single_account(private_key, mints_per_account, drops)):
+                    results[slot_of(i, drop)] = result
+
+        # 并发期间日志由后台任务成批输出，结束后恢复同步输出，保证后面的报告顺序正确
+        await self.logger.start()
+        reporter = asyncio.create_task(self.report_rpc_metrics()) if self.RPC_METRICS_INTERVAL else None
+        try:
+            await asyncio.gather(*(worker() for _ in range(concurrency)))
+        finally:
+            if reporter:
+                reporter.cancel()
+            await self.logger.stop()
+        await self.reconcile_with_index(results, mints_per_account)
+        return results
+
+    async def report_rpc_metrics(self):
+        """批量mint期间定时打印RPC调用概况"""
+        while True:
+            await asyncio.sleep(self.RPC_METRICS_INTERVAL)
+            self.log(f"{Fore.MAGENTA + Style.BRIGHT}📡 RPC: {self.metrics.summary_line()}{Style.RESET_ALL}")
+
+    def print_rpc_summary(self):
+        """按方法和阶段打印RPC调用统计"""
+        snapshot = self.metrics.snapshot()
+        print(f"\n{Fore.CYAN + Style.BRIGHT}📡 RPC调用统计: {self.metrics.summary_line()}{Style.RESET_ALL}")
+        for method, stats in snapshot["methods"].items():
+            errors = sum(stats["errors"].values())
+            print(f"  {method:<28} {stats['count']:>6} 次  p50 {stats['p50_ms']:>7.1f}ms  "
+                  f"p99 {stats['p99_ms']:>7.1f}ms" + (f"  错误 {errors} {stats['errors']}" if errors else ""))
+        print(f"  按阶段: " + ", ".join(
+            f"{phase} {usage['calls']}次/{usage['seconds']:.1f}秒" for phase, usage in snapshot["phases"].items()
+        ))
+        print(f"  完整统计: {self.RPC_METRICS_FILE}")
+
+    async def presign_accounts(self, private_keys: List[str], mints_per_account: int = 1,
+                               path: Optional[str] = None) -> int:
+        """
+        预签名模式: 批量预检后给每个 (钱包, drop, 次数) 分配nonce、确定gas和gas价格并签好claim交易，
+        写入预签名文件，返回交易数
+
+        签好的交易同时以 SIGNED 状态写入运行日志: 之后不论由广播脚本还是普通mint发送，都是这同一笔交易，
+        不会用同一个nonce再签一笔; 重复预签名时上次还没确认的交易原样保留
+        """
+        path = path or self.PRESIGN_FILE
+        start_time = time.time()
+        addresses = await self.key_index.resolve(private_keys, executor=self.signer.pool)
+
+        wallets, keys = {}, {}
+        for private_key, address in zip(private_keys, addresses):
+            if not address:
+                continue
+            todo = [drop for drop in self.drops
+                    if self.journal.confirmed(drop.contract_address, address, mints_per_account) is None]
+            if todo:
+                wallets[address] = todo
+                keys[address] = private_key
+
+        skipped = await self.preflight_and_fund(wallets, mints_per_account)
+
+        presigned, jobs = [], []
+        for address, drops in wallets.items():
+            for drop in drops:
+                if (address, drop.key) in skipped:
+                    continue
+                for slot in range(mints_per_account):
+                    entry = self.journal.get(drop.contract_address, address, slot)
+                    if entry is not None and entry.state == CONFIRMED:
+                        continue
+                    if entry is not None and entry.state in IN_FLIGHT:
+                        # 上次签好还没确认的交易原样保留，它占用的nonce不再分配
+                        self.nonce_manager.reserve(address, entry.nonce)
+                        presigned.append(PresignedTx(drop.contract_address, address, slot, entry.nonce, entry.raw_tx))
+                    else:
+                        jobs.append((address, drop, slot))
+
+        # 同一drop的claim消耗的gas相同，每个drop只估算一次gas、取一次gas价格
+        gas_limits, gas_prices = {}, {}
+        for address, drop, _ in jobs:
+            if drop.key in gas_limits:
+                continue
+            with rpc_context(phase="estimate"):
+                estimated_gas, _ = await self.estimate_gas_and_cost(drop, address)
+            gas_limits[drop.key] = int(estimated_gas * (1 + drop.gas_buffer))
+            with rpc_context(phase="gas_price"):
+                gas_prices[drop.key] = await self.gas_oracle.gas_price(drop.gas_policy)
+
+        transactions = []
+        for address, drop, _ in jobs:
+            transaction = {
+                "from": address,
+                "to": drop.contract_address,
+                "data": drop.claim_template.encode(address),
+                "value": drop.price_per_token,
+                "gas": gas_limits[drop.key],
+                "gasPrice": gas_prices[drop.key],
+                "chainId": self.CHAIN_ID,
+                "nonce": await self.nonce_manager.allocate(address),
+            }
+            transactions.append((transaction, keys[address]))
+        raw_transactions = await self.signer.sign_many(transactions)
+
+        records = []
+        for (address, drop, slot), (transaction, _), raw_transaction in zip(jobs, transactions, raw_transactions):
+            tx = PresignedTx(drop.contract_address, address, slot, transaction["nonce"], self.w3.to_hex(raw_transaction))
+            presigned.append(tx)
+            records.append((drop.contract_address, address, slot, PREFLIGHT, {}))
+            records.append((drop.contract_address, address, slot, SIGNED,
+                            {"tx_hash": tx.tx_hash, "raw_tx": tx.raw_tx, "nonce": tx.nonce}))
+        self.journal.record_many(records)
+
+        count = write_presigned(path, self.CHAIN_ID, presigned)
+        self.log(f"{Fore.GREEN + Style.BRIGHT}✍️ 预签名完成: {count} 笔交易 (新签 {len(jobs)} 笔) 已写入 {path}, "
+                 f"耗时 {time.time() - start_time:.2f} 秒{Style.RESET_ALL}")
+        return count
+
+    async def sweep_balances(self, private_keys: List[str], collector: str, path: Optional[str] = None) -> dict:
+        """
+        归集模式: 把每个钱包的 余额 - 转账gas 转到 collector，返回汇总并写入 SWEEP_SUMMARY_FILE
+
+        余额和nonce用批量预检一次取回，gas价格与mint使用的相同 (取各drop出价策略里最高的)，
+        全部转账先签好再批量广播、统一等待确认; 余额不够付gas的钱包跳过
+        """
+        path = path or self.SWEEP_SUMMARY_FILE
+        collector = Web3.to_checksum_address(collector)
+        started = datetime.now()
+        start_time = time.time()
+
+        addresses = await self.key_index.resolve(private_keys, executor=self.signer.pool)
+        keys = {address: private_key for private_key, address in zip(private_keys, addresses)
+                if address and address.lower() != collector.lower()}
+        with rpc_context(phase="preflight"):
+            accounts, _ = await batch_preflight(self.w3, list(keys), batch_size=self.PREFLIGHT_BATCH_SIZE,
+                                                with_gas_price=False)
+            gas_price = max([await self.gas_oracle.gas_price(drop.gas_policy) for drop in self.drops])
+        gas_cost = TRANSFER_GAS * gas_price
+
+        wallets, transfers = [], []
+        for address in keys:
+            account = accounts.get(address)
+            if account is None:
+                wallets.append({"address": address, "status": "failed", "error": "余额查询失败"})
+                continue
+            entry = {"address": address, "balance": account.balance_wei}
+            wallets.append(entry)
+            if account.balance_wei <= gas_cost:
+                entry["status"] = "skipped"
+                continue
+            self.nonce_manager.seed(address, account.nonce)
+            transfers.append((entry, Transfer(address, keys[address], collector, account.balance_wei - gas_cost)))
+
+        self.log(f"{Fore.YELLOW + Style.BRIGHT}🧹 归集到 {collector}: {len(transfers)}/{len(keys)} 个钱包, "
+                 f"gas价格 {self.w3.from_wei(gas_price, 'gwei'):.2f} Gwei{Style.RESET_ALL}")
+        if transfers:
+            with rpc_context(phase="sweep"):
+                await send_transfers(
+                    self.w3, self.signer, self.nonce_manager, self.receipt_watcher,
+                    [transfer for _, transfer in transfers], gas_price, self.CHAIN_ID,
+                    batch_size=self.BROADCAST_BATCH_SIZE, timeout=self.FUNDING_TIMEOUT
+                )
+        for entry, transfer in transfers:
+            entry.update(amount=transfer.value, tx_hash=transfer.tx_hash,
+                         status="swept" if transfer.confirmed else "failed")
+            if transfer.error:
+                entry["error"] = transfer.error
+
+        swept = [entry for entry in wallets if entry["status"] == "swept"]
+        recovered = sum(entry["amount"] for entry in swept)
+        summary = {
+            "collector": collector,
+            "chain_id": self.CHAIN_ID,
+            "started_at": started.isoformat(),
+            "seconds": round(time.time() - start_time, 1),
+            "gas_price": gas_price,
+            "wallets": len(wallets),
+            "swept": len(swept),
+            "skipped": sum(1 for entry in wallets if entry["status"] == "skipped"),
+            "failed": sum(1 for entry in wallets if entry["status"] == "failed"),
+            "recovered_wei": recovered,
+            "recovered": float(self.w3.from_wei(recovered, 'ether')),
+            "gas_spent_wei": len(swept) * gas_cost,
+            "details": wallets,
+        }
+        tmp_path = Path(path).with_name(Path(path).name + ".tmp")
+        tmp_path.write_text(json.dumps(summary, ensure_ascii=False, indent=1), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+        self.log(f"{Fore.GREEN + Style.BRIGHT}🧹 归集完成: {summary['swept']} 个钱包共 {summary['recovered']:.6f} PHRS, "
+                 f"跳过 {summary['skipped']} 个 (余额不够gas), 失败 {summary['failed']} 个, "
+                 f"耗时 {summary['seconds']} 秒, 汇总: {path}{Style.RESET_ALL}")
+        return summary
+
+    async def prewarm(self):
+        """开售前预热: 给每个RPC节点建立多条连接并刷新延迟数据，触发时不必再做TCP/TLS握手"""
+        start_time = time.perf_counter()
+        with rpc_context(phase="prewarm"):
+            await self.w3.provider.warm_up(self.PREWARM_CONNECTIONS)
+        self.log(f"{Fore.MAGENTA + Style.BRIGHT}🔥 预热完成: {len(self.RPC_URLS)} 个节点 × {self.PREWARM_CONNECTIONS} 条连接, "
+                 f"耗时 {time.perf_counter() - start_time:.2f} 秒{Style.RESET_ALL}")
+
+    async def wait_for_start(self, start_block: Optional[int] = None, start_time: Optional[int] = None) -> int:
+        """等到目标区块/链上时间 (下一个区块就满足条件) 为止，途中预热，返回触发时的区块号"""
+        trigger = StartTrigger(self.w3, block=start_block, timestamp=start_time, prewarm_seconds=self.PREWARM_SECONDS)
+        if start_block is not None:
+            target = f"区块 {start_block}"
+        else:
+            target = f"链上时间 {datetime.fromtimestamp(start_time, wib).strftime('%x %X %Z')}"
+        self.log(f"{Fore.CYAN + Style.BRIGHT}⏰ 等待开始: {target}{Style.RESET_ALL}")
+
+        def progress(number: int, remaining: float):
+            self.log(f"{Fore.CYAN + Style.BRIGHT}⏳ 当前区块 {number}, 预计还有 {remaining:.0f} 秒{Style.RESET_ALL}")
+
+        with rpc_context(phase="trigger"):
+            return await trigger.wait(self.prewarm, progress)
+
+    async def broadcast_presigned(self, path: Optional[str] = None, confirm: bool = True,
+                                  start_block: Optional[int] = None, start_time: Optional[int] = None) -> List[dict]:
+        """
+        广播预签名文件里的全部交易: 每 BROADCAST_BATCH_SIZE 笔打包成一个JSON-RPC批量请求并发发出，
+        然后 (confirm=True 时) 等待确认并按drop规则解析结果，每笔交易返回一条结果
+
+        指定 start_block/start_time 时先读好文件、组好请求，等到触发点再发，触发后不做任何其他工作。
+        运行日志里已确认的交易跳过; 节点已经有这笔交易时照常等待收据
+        """
+        path = path or self.PRESIGN_FILE
+        header, txs = read_presigned(path)
+        if header["chain_id"] != self.CHAIN_ID:
+            raise ValueError(f"预签名文件的链ID {header['chain_id']} 与当前网络 {self.CHAIN_ID} 不一致")
+
+        drops = {drop.contract_address.lower(): drop for drop in self.drops}
+        results, pending = [], []
+        for tx in txs:
+            drop = drops.get(tx.contract.lower())
+            if drop is None:
+                self.log(f"{Fore.YELLOW + Style.BRIGHT}⚠️ 跳过未知合约的交易: {tx.contract}{Style.RESET_ALL}", level=WARNING)
+                continue
+            entry = self.journal.get(drop.contract_address, tx.address, tx.slot)
+            if entry is not None and entry.state == CONFIRMED:
+                results.append(self._result(tx.address, drop, True, entry.tx_hash or "已确认"))
+            else:
+                pending.append((drop, tx))
+
+        batches = [pending[i:i + self.BROADCAST_BATCH_SIZE] for i in range(0, len(pending), self.BROADCAST_BATCH_SIZE)]
+        requests = [[("eth_sendRawTransaction", [tx.raw_tx]) for _, tx in batch] for batch in batches]
+        self.log(f"{Fore.YELLOW + Style.BRIGHT}🚀 准备广播: {len(pending)} 笔预签名交易{Style.RESET_ALL}")
+        trigger_block = None
+        if start_block is not None or start_time is not None:
+            trigger_block = await self.wait_for_start(start_block, start_time)
+
+        await self.logger.start()
+        try:
+            broadcast_start = time.perf_counter()
+            with rpc_context(phase="broadcast"):
+                responses = await asyncio.gather(*(
+                    self.w3.provider.make_batch_request(batch) for batch in requests
+                ), return_exceptions=True)
+            elapsed = time.perf_counter() - broadcast_start
+            if trigger_block is not None:
+                self.log(f"{Fore.GREEN + Style.BRIGHT}🚦 已在区块 {trigger_block} 触发{Style.RESET_ALL}")
+
+            accepted, records, nonce_used = [], [], []
+            for batch, response in zip(batches, responses):
+                if isinstance(response, BaseException) or not isinstance(response, list):
+                    # 整批请求失败: 交易是否到达节点未知，保留 SIGNED 状态，下次运行会原样重发
+                    error = str(response) if isinstance(response, BaseException) else str(response.get("error"))
+                    for drop, tx in batch:
+                        results.append(self._result(tx.address, drop, False, f"广播失败: {error}"))
+                    continue
+                for (drop, tx), item in zip(batch, response):
+                    outcome, message = broadcast_outcome(item.get("error"))
+                    if outcome == NONCE_USED:
+                        # 可能就是这笔交易已经上链，广播完统一查一次收据
+                        nonce_used.append((drop, tx, message))
+                        continue
+                    if outcome != ACCEPTED:
+                        records.append((drop.contract_address, tx.address, tx.slot, FAILED, {"error": message}))
+                        results.append(self._result(tx.address, drop, False, f"广播失败: {message}"))
+                        continue
+                    records.append((drop.contract_address, tx.address, tx.slot, BROADCAST, {}))
+                    accepted.append((drop, tx))
+
+            # 查不到收据说明nonce被其他交易占用，这笔预签名交易永远不会上链，直接记为失败，不必等到确认超时
+            with rpc_context(phase="confirm"):
+                landed = await self.receipts_exist([tx.tx_hash for _, tx, _ in nonce_used])
+            for drop, tx, message in nonce_used:
+                if landed.get(tx.tx_hash) is False:
+                    error_msg = f"nonce已被其他交易使用: {message}"
+                    records.append((drop.contract_address, tx.address, tx.slot, FAILED, {"error": error_msg}))
+                    results.append(self._result(tx.address, drop, False, error_msg))
+                else:
+                    records.append((drop.contract_address, tx.address, tx.slot, BROADCAST, {}))
+                    accepted.append((drop, tx))
+            self.journal.record_many(records)
+
+            rate = len(accepted) / elapsed if elapsed else 0.0
+            self.log(f"{Fore.GREEN + Style.BRIGHT}📤 广播完成: {len(accepted)}/{len(pending)} 笔被节点接受, "
+                     f"耗时 {elapsed:.2f} 秒 ({rate:.0f} 笔/秒){Style.RESET_ALL}")
+
+            if confirm:
+                outcomes = await asyncio.gather(*(
+                    self.confirm_mint(drop, tx.address, tx.slot, Web3.to_bytes(hexstr=tx.tx_hash))
+                    for drop, tx in accepted
+                ))
+                for (drop, tx), (success, result) in zip(accepted, outcomes):
+                    results.append(self._result(tx.address, drop, success, result))
+                await self.reconcile_with_index(results, max(tx.slot for tx in txs) + 1 if txs else 1)
+        finally:
+            await self.logger.stop()
+        return results
+
+    async def receipts_exist(self, tx_hashes: List[str]) -> Dict[str, Optional[bool]]:
+        """批量查询交易是否已经上链: {交易哈希: 是否有收据}，查询失败的批次为None"""
+        batches = [tx_hashes[i:i + self.BROADCAST_BATCH_SIZE] for i in range(0, len(tx_hashes), self.BROADCAST_BATCH_SIZE)]
+        responses = await asyncio.gather(*(
+            self.w3.provider.make_batch_request([("eth_getTransactionReceipt", [tx_hash]) for tx_hash in batch])
+            for batch in batches
+        ), return_exceptions=True)
+        found: Dict[str, Optional[bool]] = {}
+        for batch, response in zip(batches, responses):
+            for index, tx_hash in enumerate(batch):
+                item = response[index] if isinstance(response, list) and index < len(response) else {}
+                found[tx_hash] = None if "error" in item or "result" not in item else item["result"] is not None
+        return found
+
+    def print_final_report(self, results: List[dict]):
+        """打印最终报告"""
+        print(f"\n{Fore.LIGHTGREEN_EX + Style.BRIGHT}{'=' * 80}")
+        print(f"{Fore.GREEN + Style.BRIGHT}📊 {self.TITLE} 报告")
+        print(f"{Fore.LIGHTGREEN_EX + Style.BRIGHT}{'=' * 80}{Style.RESET_ALL}")
+
+        drops = {drop.key: drop for drop in self.drops}
+        total_accounts = len(results)
+        successful_mints = sum(1 for r in results if r["success"])
+        failed_mints = total_accounts - successful_mints
+        success_rate = (successful_mints / total_accounts * 100) if total_accounts > 0 else 0
+
+        print(f"{Fore.CYAN + Style.BRIGHT}📈 总体统计:{Style.RESET_ALL}")
+        print(f"  总账户数: {total_accounts // max(1, len(drops))}")
+        print(f"  成功Mint: {successful_mints}")
+        print(f"  失败Mint: {failed_mints}")
+        print(f"  成功率: {success_rate:.1f}%")
+        if len(drops) > 1:
+            for drop in drops.values():
+                drop_results = [r for r in results if r["drop"] == drop.key]
+                drop_success = sum(1 for r in drop_results if r["success"])
+                print(f"  {drop.name}: {drop_success}/{len(drop_results)}")
+
+        print(f"\n{Fore.CYAN + Style.BRIGHT}📋 详细结果:{Style.RESET_ALL}")
+        for i, result in enumerate(results, 1):
+            status = "✅" if result["success"] else "❌"
+            label = f" [{drops[result['drop']].name}]" if len(drops) > 1 else ""
+            print(f"  {i:2d}. {result['address'][:10]}...{result['address'][-8:]}{label} - {status}")
+            if result["success"]:
+                print(f"       交易: {result['result']}")
+            else:
+                print(f"       错误: {result['result']}")
+
+        print(f"\n{Fore.GREEN + Style.BRIGHT}🎨 NFT合约信息:{Style.RESET_ALL}")
+        for drop in drops.values():
+            print(f"  合约地址: {drop.contract}")
+            print(f"  NFT名称: {drop.name}")
+            print(f"  Mint价格: {Web3.from_wei(drop.price_per_token, 'ether')} PHRS")
+        print(f"  网络: Pharos Testnet (ChainID: {self.CHAIN_ID})")
+
+        if successful_mints > 0:
+            names = " / ".join(drop.name for drop in drops.values())
+            print(f"\n{Fore.GREEN + Style.BRIGHT}🎉 恭喜! 成功mint了 {successful_mints} 个 {names} NFT!{Style.RESET_ALL}")
+            print(f"\n{Fore.CYAN + Style.BRIGHT}🔍 请在以下位置查看您的NFT:{Style.RESET_ALL}")
+            print(f"  1. 区块链浏览器: {EXPLORER_URL}")
+            print(f"  2. 搜索您的地址，查看NFT标签页")
+            print(f"  3. 或在钱包中查看NFT收藏")
+
+    async def execute(self, private_keys: List[str], concurrency: int = 8, mints_per_account: int = 1,
+                      presign: bool = False, start_block: Optional[int] = None,
+                      start_time: Optional[int] = None,
+                      collector: Optional[str] = None) -> Union[List[dict], dict, int]:
+        """按选定的模式执行并打印报告，返回mint结果; 只预签名时返回签好的交易数，归集时返回归集汇总"""
+        if collector:
+            return await self.sweep_balances(private_keys, collector)
+        if presign:
+            count = await self.presign_accounts(private_keys, mints_per_account)
+            self.log(f"{Fore.CYAN + Style.BRIGHT}👉 开售时运行: python broadcast-presigned.py {self.PRESIGN_FILE}{Style.RESET_ALL}")
+            return count
+
+        # 开始mint
+        started = time.time()
+        if start_block is not None or start_time is not None:
+            # 定时开始: 先把全部交易签好，到点后一次性广播
+            await self.presign_accounts(private_keys, mints_per_account)
+            results = await self.broadcast_presigned(start_block=start_block, start_time=start_time)
+        else:
+            results = await self.process_accounts(private_keys, concurrency, mints_per_account)
+        end_time = time.time()
+
+        # 生成报告
+        self.print_final_report(results)
+        self.print_rpc_summary()
+
+        self.log(f"{Fore.GREEN + Style.BRIGHT}⏱️ 总耗时: {end_time - started:.1f} 秒{Style.RESET_ALL}")
+        return results
+
+    async def run_headless(self, accounts_file: str = "private_keys.txt", concurrency: int = 8,
+                           mints_per_account: int = 1, presign: bool = False, start: str = "",
+                           shard: Tuple[int, int] = (0, 1),
+                           collector: Optional[str] = None) -> Optional[Union[List[dict], dict, int]]:
+        """
+        非交互运行: 参数全部由调用方给出，不清屏、不询问确认，只处理 shard=(i, n) 指定的那一片私钥
+
+        返回 execute 的结果; 连接网络或验证合约失败时返回None (原因已经打印)，调用方据此设置非0退出码
+        """
+        index, count = shard
+        try:
+            if not await self.connect_to_network():
+                return None
+            if not await self.verify_contract_addresses():
+                return None
+
+            private_keys = list(iter_private_keys(accounts_file))
+            if count > 1:
+                addresses = await self.key_index.resolve(private_keys, executor=self.signer.pool)
+                private_keys = select_shard(private_keys, addresses, index, count)
+            self.log(f"{Fore.GREEN + Style.BRIGHT}📝 加载私钥: {len(private_keys)} 个 (分片 {index}/{count}){Style.RESET_ALL}")
+            if not private_keys and not collector:
+                return []
+
+            start_block, start_time = parse_start_target(start)
+            return await self.execute(private_keys, concurrency, mints_per_account, presign, start_block, start_time,
+                                      collector)
+        finally:
+            await self.close()
+
+    async def main(self):
+        """主函数"""
+        try:
+            self.clear_terminal()
+            self.welcome()
+
+            # 连接网络
+            if not await self.connect_to_network():
+                return
+
+            # 验证合约地址
+            if not await self.verify_contract_addresses():
+                return
+
+            # 加载私钥
+            accounts_file = 'private_keys.txt'
+            if not Path(accounts_file).exists():
+                self.log(f"{Fore.RED}File '{accounts_file}' Not Found.{Style.RESET_ALL}", level=ERROR)
+                return
+
+            private_keys = list(iter_private_keys(accounts_file))
+
+            if not private_keys:
+                self.log(f"{Fore.RED}No private keys found in {accounts_file}{Style.RESET_ALL}", level=ERROR)
+                return
+
+            self.log(f"{Fore.GREEN + Style.BRIGHT}📝 加载私钥: {len(private_keys)} 个{Style.RESET_ALL}")
+
+            # 获取并发设置 - 不再需要账户间延迟，RPC池按节点的429/超时/延迟自动限速
+            print(f"\n{Fore.YELLOW + Style.BRIGHT}⏱️ 并发设置 (RPC请求速率自动调节):{Style.RESET_ALL}")
+            concurrency = int(
+                input(f"{Fore.BLUE + Style.BRIGHT}并发账户数 (默认8): {Style.RESET_ALL}").strip() or "8")
+            mints_per_account = int(
+                input(f"{Fore.BLUE + Style.BRIGHT}每个钱包mint次数 (默认1): {Style.RESET_ALL}").strip() or "1")
+            mode = input(
+                f"{Fore.BLUE + Style.BRIGHT}运行模式 (1=立即mint, 2=只预签名, 开售时用 broadcast-presigned.py 广播, "
+                f"3=把剩余余额归集到一个地址; 默认1): {Style.RESET_ALL}").strip()
+            presign = mode == "2"
+            collector = None
+            if mode == "3":
+                collector = Web3.to_checksum_address(
+                    input(f"{Fore.BLUE + Style.BRIGHT}归集地址: {Style.RESET_ALL}").strip())
+            start_block, start_time = None, None
+            if mode not in ("2", "3"):
+                start_block, start_time = parse_start_target(input(
+                    f"{Fore.BLUE + Style.BRIGHT}定时开始 (区块号 / Unix时间戳 / 本地时间如 2026-10-20 20:00, "
+                    f"留空=确认后立即开始): {Style.RESET_ALL}"))
+
+            print(f"\n{Fore.CYAN + Style.BRIGHT}🎯 Mint配置:{Style.RESET_ALL}")
+            for drop in self.drops:
+                print(f"  NFT名称: {drop.name}")
+                print(f"    NFT数量: {drop.quantity} per address")
+                print(f"    NFT价格: {Web3.from_wei(drop.price_per_token, 'ether')} PHRS")
+                print(f"    目标合约: {drop.contract}")
+                if drop.debug:
+                    print(f"    调试模式: 启用")
+            print(f"  并发账户: {concurrency}")
+            print(f"  每个钱包: {mints_per_account} 次mint")
+            if presign:
+                print(f"  运行模式: 只预签名, 写入 {self.PRESIGN_FILE}")
+            if collector:
+                print(f"  运行模式: 归集剩余余额到 {collector}, 汇总写入 {self.SWEEP_SUMMARY_FILE}")
+            if start_block is not None:
+                print(f"  定时开始: 区块 {start_block}")
+            elif start_time is not None:
+                print(f"  定时开始: {datetime.fromtimestamp(start_time, wib).strftime('%x %X %Z')}")
+
+            # 重要警告
+            notes = [note for drop in self.drops for note in drop.notes]
+            if notes:
+                print(f"\n{Fore.RED + Style.BRIGHT}⚠️ 重要提醒:{Style.RESET_ALL}")
+                for note in notes:
+                    print(f"  {note}")
+
+            confirm = input(f"\n{Fore.BLUE + Style.BRIGHT}确认开始mint? (y/n): {Style.RESET_ALL}").lower()
+            if confirm != 'y':
+                self.log("已取消执行")
+                return
+
+            await self.execute(private_keys, concurrency, mints_per_account, presign, start_block, start_time, collector)
+
+        except FileNotFoundError:
+            self.log(f"{Fore.RED}File 'private_keys.txt' Not Found.{Style.RESET_ALL}", level=ERROR)
+        except Exception as e:
+            self.log(f"{Fore.RED + Style.BRIGHT}Error: {e}{Style.RESET_ALL}", level=ERROR)
+            import traceback
+            traceback.print_exc()
+        finally:
+            await self.close()
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""
+共享gas价格预言机
+后台按TTL刷新 eth_gasPrice，所有待发送的mint读取同一个缓存价格，
+加价倍数、价格上限和备用价格按 GasPolicy 统一处理，不同drop可以使用不同策略;
+卡住的交易按 ReplacementPolicy 用同一nonce提价替换
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from web3 import AsyncWeb3
+
+# 节点接受同一nonce替换交易所要求的最小加价比例 (geth txpool.pricebump 默认10%)
+MIN_REPLACEMENT_BUMP = 0.1
+
+
+@dataclass(frozen=True)
+class GasPolicy:
+    """出价策略: 节点报价乘以 multiplier，不超过 max_price，取价失败时使用 fallback_price"""
+    multiplier: float = 1.0
+    max_price: Optional[int] = None
+    fallback_price: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class ReplacementPolicy:
+    """
+    替换策略: 交易发出后连续 after_blocks 个区块没被打包，就用同一nonce、gas价格乘以 multiplier
+    (且不低于当前报价) 重新签名发送，价格不超过 max_price，最多替换 max_replacements 次;
+    after_blocks=0 或没有设置 max_price 时关闭 (不允许无上限地加价)
+    """
+    after_blocks: int = 10
+    multiplier: float = 1.125
+    max_price: Optional[int] = None
+    max_replacements: int = 5
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_price is not None and self.after_blocks > 0 and self.max_replacements > 0
+
+    def next_price(self, price: int, market_price: int = 0) -> Optional[int]:
+        """下一次替换的gas价格; 受上限限制加价不到节点要求的幅度时返回None"""
+        bumped = min(max(int(price * self.multiplier), market_price), self.max_price)
+        if bumped < price * (1 + MIN_REPLACEMENT_BUMP):
+            return None
+        return bumped
+
+
+class GasOracle:
+    """TTL缓存的gas价格"""
+
+    def __init__(self, w3: AsyncWeb3, ttl: float = 5.0, multiplier: float = 1.0,
+                 max_price: Optional[int] = None, fallback_price: Optional[int] = None):
+        self.w3 = w3
+        self.ttl = ttl
+        # 调用方没有指定策略时使用的默认策略
+        self.policy = GasPolicy(multiplier, max_price, fallback_price)
+
+        self._price: Optional[int] = None
+        self._updated_at = 0.0
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    def seed(self, price: int):
+        """用批量预检里取到的gas价格初始化缓存"""
+        self._price = price
+        self._updated_at = time.monotonic()
+
+    @property
+    def is_fresh(self) -> bool:
+        return self._price is not None and time.monotonic() - self._updated_at < self.ttl
+
+    async def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        while True:
+            try:
+                await self.refresh()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                # 刷新失败时继续使用旧价格，下个周期重试
+                pass
+            await asyncio.sleep(self.ttl)
+
+    async def refresh(self) -> int:
+        price = await self.w3.eth.gas_price
+        self.seed(price)
+        return price
+
+    async def base_price(self) -> int:
+        """节点报价，缓存过期时由第一个调用者刷新，其他调用者共享结果"""
+        if self.is_fresh:
+            return self._price
+        async with self._lock:
+            if self.is_fresh:
+                return self._price
+            try:
+                return await self.refresh()
+            except Exception:
+                if self._price is not None:
+                    return self._price
+                raise
+
+    async def gas_price(self, policy: Optional[GasPolicy] = None) -> int:
+        """应用加价倍数和上限后的实际出价"""
+        policy = policy or self.policy
+        try:
+            price = int(await self.base_price() * policy.multiplier)
+        except Exception:
+            if policy.fallback_price is None:
+                raise
+            return policy.fallback_price
+        if policy.max_price is not None:
+            price = min(price, policy.max_price)
+        return price
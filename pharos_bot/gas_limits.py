@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""
+gas上限记忆
+公开drop的 claim() 对每个receiver消耗的gas基本相同，因此按
+(链ID, 合约, 函数selector, 数量) 只做一次 eth_estimateGas，
+结果写入本地JSON文件跨次运行复用，并用收据里的实际 gasUsed 持续校正
+"""
+
+import asyncio
+import json
+import os
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, Optional
+
+
+class GasLimitCache:
+    """按调用形状缓存的gas用量 (不含安全余量，余量由调用方按原逻辑追加)"""
+
+    def __init__(self, path: str = "gas_limits.json", chain_id: Optional[int] = None, decay: float = 0.1):
+        self.path = Path(path)
+        self.chain_id = chain_id
+        # 实际gasUsed低于缓存值时，每次向实际值回落的比例
+        self.decay = decay
+
+        self._values: Dict[str, int] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._dirty = False
+        self.load()
+
+    def key(self, contract: str, selector: bytes, quantity: int) -> str:
+        return f"{self.chain_id}:{contract.lower()}:{selector.hex()}:{quantity}"
+
+    def load(self):
+        if not self.path.exists():
+            return
+        try:
+            self._values = {k: int(v) for k, v in json.loads(self.path.read_text(encoding="utf-8")).items()}
+        except (ValueError, OSError):
+            # 缓存文件损坏时直接忽略，重新估算
+            self._values = {}
+
+    def save(self):
+        if not self._dirty:
+            return
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        tmp_path.write_text(json.dumps(self._values, indent=2, sort_keys=True), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+    def get(self, key: str) -> Optional[int]:
+        return self._values.get(key)
+
+    def learn(self, key: str, gas: int):
+        if self._values.get(key) != gas:
+            self._values[key] = gas
+            self._dirty = True
+
+    def observe(self, key: str, gas_used: int):
+        """用收据里的实际gasUsed校正: 高于缓存立即上调，低于缓存则缓慢回落"""
+        current = self._values.get(key)
+        if current is None or gas_used > current:
+            self.learn(key, gas_used)
+        else:
+            self.learn(key, max(gas_used, int(current - (current - gas_used) * self.decay)))
+
+    async def get_or_estimate(self, key: str, estimate: Callable[[], Awaitable[int]]) -> int:
+        """命中缓存直接返回，否则只让第一个调用者估算，其余调用者等待同一结果"""
+        cached = self._values.get(key)
+        if cached is not None:
+            return cached
+
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = self._locks[key] = asyncio.Lock()
+        async with lock:
+            cached = self._values.get(key)
+            if cached is not None:
+                return cached
+            gas = await estimate()
+            self.learn(key, gas)
+            self.save()
+            return gas
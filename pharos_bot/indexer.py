@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+"""
+徽章持有者索引
+按区块范围回填 Drop 合约的 Transfer / TokensClaimed 日志，在本地维护 tokenId -> 持有者 的索引:
+运行前直接跳过已经持有徽章的钱包，运行后对照索引核对结果，不必逐个钱包查收据。
+
+回填时把区块范围切成块并发 eth_getLogs; 节点报范围过大或结果过多时把这一块对半拆开重试，
+并缩小之后的块，请求顺利且日志不多时逐步放大块; 节点限流时等待后原样重试，不缩小块
+"""
+
+import asyncio
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from web3 import AsyncWeb3, Web3
+
+from pharos_bot.receipts import TOKENS_CLAIMED_TOPIC, TRANSFER_TOPIC
+from pharos_bot.rpc_pool import OVERLOAD_MARKERS, is_overload_error
+
+# 节点因为区块范围或结果数超限拒绝 eth_getLogs 时的错误信息 (各家节点措辞不同)
+RANGE_ERROR_MARKERS = (
+    "block range",
+    "range is too",
+    "range too",
+    "query returned more than",
+    "limit exceeded",
+    "response size",
+)
+# 节点限流的错误信息，优先于上面的判断 (如 "daily request limit exceeded")
+THROTTLE_ERROR_MARKERS = OVERLOAD_MARKERS + ("request limit",)
+
+_TRANSFER = Web3.to_hex(TRANSFER_TOPIC)
+_TOKENS_CLAIMED = Web3.to_hex(TOKENS_CLAIMED_TOPIC)
+_ZERO_ADDRESS = "0x" + "00" * 20
+
+
+def is_range_error(error: dict) -> bool:
+    """区块范围或结果数超限: 把范围对半拆开重试"""
+    message = str(error.get("message", "")).lower()
+    return (any(marker in message for marker in RANGE_ERROR_MARKERS)
+            and not any(marker in message for marker in THROTTLE_ERROR_MARKERS))
+
+
+def is_throttle_error(error: dict) -> bool:
+    """限流 (-32005/429 没有范围说明，或错误信息表明限流): 等待后原样重试，不缩小块"""
+    message = str(error.get("message", "")).lower()
+    if is_range_error(error):
+        return False
+    return is_overload_error(error) or any(marker in message for marker in THROTTLE_ERROR_MARKERS)
+
+
+def _topic_address(topic: str) -> str:
+    return "0x" + topic[-40:].lower()
+
+
+class LogBackfill:
+    """
+    分块并发拉取一个合约在区块范围内的日志
+
+    concurrency 个任务依次领取 [cursor, cursor + chunk_size) 的区块范围，块大小由所有任务共享并随节点反馈调整
+    """
+
+    def __init__(self, w3: AsyncWeb3, address: str, topics: list, chunk_size: int = 2000,
+                 min_chunk_size: int = 1, max_chunk_size: int = 100_000, concurrency: int = 4,
+                 grow_below: int = 1000, retries: int = 5, backoff: float = 0.5):
+        self.w3 = w3
+        self.address = address
+        self.topics = topics
+        self.chunk_size = chunk_size
+        self.min_chunk_size = min_chunk_size
+        self.max_chunk_size = max_chunk_size
+        self.concurrency = concurrency
+        # 一块返回的日志少于这个数时放大下一块
+        self.grow_below = grow_below
+        # 限流时同一块最多重试 retries 次，等待时间从 backoff 秒起每次翻倍
+        self.retries = retries
+        self.backoff = backoff
+
+        self.requests = 0
+        self.splits = 0
+        self.throttled = 0
+
+    async def _get_logs(self, from_block: int, to_block: int) -> List[dict]:
+        """拉取一段区块的日志，范围过大时对半拆开，限流时等待后重试"""
+        for attempt in range(self.retries + 1):
+            self.requests += 1
+            response = await self.w3.provider.make_request("eth_getLogs", [{
+                "address": self.address,
+                "fromBlock": hex(from_block),
+                "toBlock": hex(to_block),
+                "topics": self.topics,
+            }])
+            error = response.get("error")
+            if not (isinstance(error, dict) and is_throttle_error(error)) or attempt == self.retries:
+                break
+            self.throttled += 1
+            await asyncio.sleep(self.backoff * 2 ** attempt)
+        if error is None:
+            logs = response.get("result") or []
+            if len(logs) < self.grow_below and to_block - from_block + 1 >= self.chunk_size:
+                self.chunk_size = min(self.max_chunk_size, self.chunk_size * 2)
+            return logs
+
+        if not isinstance(error, dict) or not is_range_error(error) or to_block - from_block < self.min_chunk_size:
+            raise ValueError(f"eth_getLogs 失败 [{from_block}, {to_block}]: {error}")
+        self.splits += 1
+        middle = (from_block + to_block) // 2
+        self.chunk_size = max(self.min_chunk_size, min(self.chunk_size, middle - from_block + 1))
+        return await self._get_logs(from_block, middle) + await self._get_logs(middle + 1, to_block)
+
+    async def fetch(self, from_block: int, to_block: int) -> List[dict]:
+        """拉取 [from_block, to_block] 的全部日志，按 (区块号, 日志序号) 排序返回"""
+        cursor = from_block
+        logs: List[dict] = []
+
+        async def worker():
+            nonlocal cursor
+            while cursor <= to_block:
+                start = cursor
+                end = min(to_block, start + self.chunk_size - 1)
+                cursor = end + 1
+                logs.extend(await self._get_logs(start, end))
+
+        # 一个任务失败时取消其他任务，不让它们在 fetch 已经抛出异常之后继续请求
+        tasks = [asyncio.ensure_future(worker()) for _ in range(self.concurrency)]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        logs.sort(key=lambda log: (int(log["blockNumber"], 16), int(log["logIndex"], 16)))
+        return logs
+
+
+class BadgeIndex:
+    """
+    持有者索引文件
+
+    每个合约记录已经索引过的区块范围和 tokenId -> 持有者; Transfer 事件决定持有者，
+    不发 Transfer 的合约用 TokensClaimed 的 receiver 和 tokenId 区间补上
+    """
+
+    def __init__(self, path: str = "badge_index.json", chain_id: Optional[int] = None):
+        self.path = Path(path)
+        self.chain_id = chain_id
+
+        self._contracts: Dict[str, dict] = {}
+        self._holders: Dict[str, Dict[str, List[int]]] = {}
+        self._dirty = False
+        self.load()
+
+    def load(self):
+        if not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (ValueError, OSError):
+            # 索引文件损坏时重新回填
+            return
+        if data.get("chain_id") == self.chain_id:
+            self._contracts = data.get("contracts", {})
+
+    def save(self):
+        if not self._dirty:
+            return
+        data = {"chain_id": self.chain_id, "contracts": self._contracts}
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        tmp_path.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+    def synced_to(self, contract: str) -> Optional[int]:
+        """已经索引到的最后一个区块，没有索引过返回None"""
+        state = self._contracts.get(contract.lower())
+        return state["to_block"] if state else None
+
+    def apply(self, contract: str, logs: List[dict], from_block: int, to_block: int):
+        """合并 [from_block, to_block] 的日志 (需按区块和日志序号排序)"""
+        key = contract.lower()
+        state = self._contracts.setdefault(key, {"from_block": from_block, "to_block": to_block, "owners": {}})
+        owners = state["owners"]
+        for log in logs:
+            topics = log.get("topics") or []
+            if len(topics) == 4 and topics[0] == _TRANSFER:
+                owners[str(int(topics[3], 16))] = _topic_address(topics[2])
+            elif len(topics) == 4 and topics[0] == _TOKENS_CLAIMED:
+                data = log.get("data", "0x")[2:]
+                if len(data) < 128:
+                    continue
+                start, quantity = int(data[:64], 16), int(data[64:128], 16)
+                receiver = _topic_address(topics[3])
+                for token_id in range(start, start + quantity):
+                    owners.setdefault(str(token_id), receiver)
+        state["from_block"] = min(state["from_block"], from_block)
+        state["to_block"] = max(state["to_block"], to_block)
+        self._holders.pop(key, None)
+        self._dirty = True
+
+    def holders(self, contract: str) -> Dict[str, List[int]]:
+        """{钱包地址(小写): [tokenId, ...]}，转给零地址 (销毁) 的不算"""
+        key = contract.lower()
+        holders = self._holders.get(key)
+        if holders is None:
+            holders = {}
+            for token_id, owner in self._contracts.get(key, {}).get("owners", {}).items():
+                if owner != _ZERO_ADDRESS:
+                    holders.setdefault(owner, []).append(int(token_id))
+            for tokens in holders.values():
+                tokens.sort()
+            self._holders[key] = holders
+        return holders
+
+    def tokens_of(self, contract: str, address: str) -> List[int]:
+        return self.holders(contract).get(address.lower(), [])
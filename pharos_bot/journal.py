@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""
+断点续跑日志
+每次mint的状态变化 (预检 -> 已签名 -> 已广播 -> 已确认/失败) 以JSON行追加写入本地文件，
+进程被中断后重新运行时: 已确认的钱包直接跳过，已签名/已广播的交易用原哈希重新挂上，
+不会重新签一笔新交易导致重复mint
+"""
+
+import json
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+PREFLIGHT = "preflight"
+SIGNED = "signed"
+BROADCAST = "broadcast"
+CONFIRMED = "confirmed"
+FAILED = "failed"
+
+# 交易可能已经在链上或交易池里的状态，恢复时不能重新签名
+IN_FLIGHT = (SIGNED, BROADCAST)
+
+
+@dataclass
+class JournalEntry:
+    """某个钱包某一次mint (slot) 的最新状态"""
+    contract: str
+    address: str
+    slot: int
+    state: str
+    tx_hash: Optional[str] = None
+    raw_tx: Optional[str] = None
+    nonce: Optional[int] = None
+    # 被提价替换掉的旧交易哈希，其中任何一笔上链都说明这次mint已完成
+    replaced: Optional[List[str]] = None
+    error: Optional[str] = None
+    ts: float = 0.0
+
+
+class RunJournal:
+    """
+    只追加写入的JSONL状态日志
+
+    每行只记录变化的字段，加载时按顺序合并; 末尾写了一半的行 (崩溃) 直接忽略。
+    SIGNED/BROADCAST 记录写入后立即fsync，保证签好的交易在断电后也能找回
+    """
+
+    def __init__(self, path: str = "mint_journal.jsonl", durable_states: Tuple[str, ...] = IN_FLIGHT):
+        self.path = Path(path)
+        self.durable_states = durable_states
+
+        self._entries: Dict[Tuple[str, str, int], JournalEntry] = {}
+        self._file = None
+        self.load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _key(contract: str, address: str, slot: int) -> Tuple[str, str, int]:
+        return contract.lower(), address.lower(), slot
+
+    def load(self):
+        if not self.path.exists():
+            return
+        with open(self.path, "r", encoding="utf-8") as file:
+            for line in file:
+                try:
+                    record = json.loads(line)
+                    self._apply(record)
+                except (ValueError, KeyError, TypeError):
+                    continue
+
+    def _apply(self, record: dict) -> JournalEntry:
+        key = self._key(record["contract"], record["address"], record["slot"])
+        entry = self._entries.get(key)
+        # 新一轮预检表示重新开始这次mint，丢弃上一次的交易信息
+        if entry is None or record["state"] == PREFLIGHT:
+            entry = self._entries[key] = JournalEntry(
+                contract=record["contract"], address=record["address"], slot=record["slot"], state=record["state"]
+            )
+        for field, value in record.items():
+            setattr(entry, field, value)
+        return entry
+
+    def get(self, contract: str, address: str, slot: int = 0) -> Optional[JournalEntry]:
+        return self._entries.get(self._key(contract, address, slot))
+
+    def confirmed(self, contract: str, address: str, slots: int = 1) -> Optional[List[str]]:
+        """钱包的前 slots 次mint全部已确认时返回各自的交易哈希，否则返回None"""
+        hashes = []
+        for slot in range(slots):
+            entry = self.get(contract, address, slot)
+            if entry is None or entry.state != CONFIRMED:
+                return None
+            hashes.append(entry.tx_hash)
+        return hashes
+
+    def record(self, contract: str, address: str, slot: int, state: str, **fields) -> JournalEntry:
+        """追加一条状态变化，fields 只需包含本次新增或变化的字段"""
+        record = {"ts": round(time.time(), 3), "contract": contract, "address": address, "slot": slot, "state": state}
+        record.update({field: value for field, value in fields.items() if value is not None})
+
+        if self._file is None:
+            self._file = open(self.path, "a", encoding="utf-8")
+        self._file.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self._file.flush()
+        if state in self.durable_states:
+            os.fsync(self._file.fileno())
+        return self._apply(record)
+
+    def record_many(self, records: Iterable[Tuple[str, str, int, str, dict]]) -> int:
+        """批量追加 (合约, 地址, 槽位, 状态, 字段) 记录，整批只fsync一次，返回记录数"""
+        batch = []
+        for contract, address, slot, state, fields in records:
+            record = {"ts": round(time.time(), 3), "contract": contract, "address": address, "slot": slot, "state": state}
+            record.update({field: value for field, value in fields.items() if value is not None})
+            batch.append(record)
+        if not batch:
+            return 0
+
+        if self._file is None:
+            self._file = open(self.path, "a", encoding="utf-8")
+        self._file.write("".join(json.dumps(record, separators=(",", ":")) + "\n" for record in batch))
+        self._file.flush()
+        if any(record["state"] in self.durable_states for record in batch):
+            os.fsync(self._file.fileno())
+        for record in batch:
+            self._apply(record)
+        return len(batch)
+
+    def fail(self, contract: str, address: str, slot: int, error: str) -> Optional[JournalEntry]:
+        """记录失败; 交易可能已经广播时保留原状态，下次运行重新挂上原哈希"""
+        entry = self.get(contract, address, slot)
+        if entry is not None and entry.state in IN_FLIGHT:
+            return None
+        return self.record(contract, address, slot, FAILED, error=error)
+
+    def summary(self) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for entry in self._entries.values():
+            counts[entry.state] = counts.get(entry.state, 0) + 1
+        return counts
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""
+私钥文件流式读取 + 本地地址索引
+首次运行时并行推导每个私钥的地址，把 "私钥指纹 -> 地址" 写入紧凑的二进制索引，
+之后的运行直接查表，不再做椭圆曲线运算。索引里不保存任何明文私钥
+"""
+
+import asyncio
+import hashlib
+from concurrent.futures import Executor
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from eth_account import Account
+from web3 import Web3
+
+# 每条记录: 16字节指纹 + 20字节地址
+FINGERPRINT_SIZE = 16
+RECORD_SIZE = FINGERPRINT_SIZE + 20
+INDEX_MAGIC = b"PHKIDX1\n"
+
+
+def iter_private_keys(path: str) -> Iterator[str]:
+    """逐行读取私钥文件，跳过空行和 # 注释"""
+    with open(path, "r") as file:
+        for line in file:
+            key = line.strip()
+            if key and not key.startswith("#"):
+                yield key
+
+
+def _key_bytes(private_key: str) -> bytes:
+    key = private_key[2:] if private_key.lower().startswith("0x") else private_key
+    return bytes.fromhex(key)
+
+
+def key_fingerprint(private_key: str) -> bytes:
+    """私钥的单向指纹，用于在索引里定位记录"""
+    return hashlib.sha256(b"pharos-bot/key-index/" + _key_bytes(private_key)).digest()[:FINGERPRINT_SIZE]
+
+
+def derive_addresses(private_keys: List[str]) -> List[Optional[str]]:
+    """推导一批私钥对应的地址，无效私钥返回None (模块级函数，供进程池调用)"""
+    addresses = []
+    for private_key in private_keys:
+        try:
+            addresses.append(Account.from_key(private_key).address)
+        except Exception:
+            addresses.append(None)
+    return addresses
+
+
+class KeyIndex:
+    """私钥指纹到地址的持久化索引 (只追加写入)"""
+
+    def __init__(self, path: str = "private_keys.idx"):
+        self.path = Path(path)
+        self._addresses: Dict[bytes, str] = {}
+        self.load()
+
+    def __len__(self) -> int:
+        return len(self._addresses)
+
+    def load(self):
+        if not self.path.exists():
+            return
+        data = self.path.read_bytes()
+        if not data.startswith(INDEX_MAGIC):
+            return
+        body = data[len(INDEX_MAGIC):]
+        # 末尾不完整的记录 (写入中途崩溃) 直接忽略
+        for offset in range(0, len(body) - RECORD_SIZE + 1, RECORD_SIZE):
+            record = body[offset:offset + RECORD_SIZE]
+            self._addresses[record[:FINGERPRINT_SIZE]] = Web3.to_checksum_address(record[FINGERPRINT_SIZE:])
+
+    def _append(self, records: List[bytes]):
+        new_file = not self.path.exists() or self.path.stat().st_size == 0
+        with open(self.path, "ab") as file:
+            if new_file:
+                file.write(INDEX_MAGIC)
+            file.write(b"".join(records))
+
+    def lookup(self, private_key: str) -> Optional[str]:
+        try:
+            return self._addresses.get(key_fingerprint(private_key))
+        except ValueError:
+            return None
+
+    async def resolve(self, private_keys: List[str], executor: Optional[Executor] = None, chunk_size: int = 256,
+                      parallel_threshold: int = 1024) -> List[Optional[str]]:
+        """
+        返回与 private_keys 一一对应的地址列表，无效私钥为None
+
+        索引里没有的私钥才需要推导，数量超过 parallel_threshold 且给出了 executor (通常是签名器的进程池，
+        不必再启动一个) 时分块交给它并行推导
+        """
+        fingerprints: List[Optional[bytes]] = []
+        missing: Dict[bytes, str] = {}
+        for private_key in private_keys:
+            try:
+                fingerprint = key_fingerprint(private_key)
+            except ValueError:
+                fingerprints.append(None)
+                continue
+            fingerprints.append(fingerprint)
+            if fingerprint not in self._addresses:
+                missing[fingerprint] = private_key
+
+        if missing:
+            keys = list(missing.values())
+            if executor is not None and len(keys) >= parallel_threshold:
+                chunks = [keys[i:i + chunk_size] for i in range(0, len(keys), chunk_size)]
+                loop = asyncio.get_running_loop()
+                results = await asyncio.gather(
+                    *(loop.run_in_executor(executor, derive_addresses, chunk) for chunk in chunks)
+                )
+                derived = [address for chunk in results for address in chunk]
+            else:
+                derived = derive_addresses(keys)
+
+            records = []
+            for fingerprint, address in zip(missing, derived):
+                if address is None:
+                    continue
+                self._addresses[fingerprint] = address
+                records.append(fingerprint + bytes.fromhex(address[2:]))
+            if records:
+                self._append(records)
+
+        return [self._addresses.get(fingerprint) if fingerprint else None for fingerprint in fingerprints]
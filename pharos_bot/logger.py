@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+"""
+异步缓冲日志
+log() 只把 (时间, 级别, 消息, 参数) 放进队列，时间戳格式化、%参数替换和输出都由后台任务成批完成，
+控制台每批只写一次、flush一次；同时可以写一份去掉颜色的 JSON lines 文件供程序解析。
+低于当前级别的日志在 log() 里直接丢弃，参数不会被格式化
+"""
+
+import asyncio
+import json
+import re
+import sys
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Deque, List, Optional, TextIO, Tuple
+
+from colorama import Fore, Style
+
+from pharos_bot.metrics import rpc_account
+
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+
+LEVEL_NAMES = {DEBUG: "DEBUG", INFO: "INFO", WARNING: "WARNING", ERROR: "ERROR"}
+
+ANSI_PATTERN = re.compile(r"\x1b\[[0-9;]*m")
+
+# (时间戳, 级别, 消息, %参数, 当前账户)
+LogRecord = Tuple[float, int, str, tuple, Optional[str]]
+
+
+def render(record: LogRecord) -> str:
+    _, _, message, args, _ = record
+    if args:
+        try:
+            return message % args
+        except (TypeError, ValueError):
+            return f"{message} {args}"
+    return message
+
+
+class ConsoleSink:
+    """彩色控制台输出，沿用原来的 [ 时间 ] | 消息 格式"""
+
+    def __init__(self, tz, color: bool = True, stream: Optional[TextIO] = None):
+        self.tz = tz
+        self.color = color
+        # 默认在写入时才取 sys.stdout，重定向输出时同样生效
+        self.stream = stream
+        self._second = None
+        self._prefix = ""
+
+    def _format_prefix(self, ts: float) -> str:
+        # 同一秒内的日志共用格式化好的时间前缀
+        second = int(ts)
+        if second != self._second:
+            stamp = datetime.fromtimestamp(second, self.tz).strftime('%x %X %Z')
+            if self.color:
+                self._prefix = f"{Fore.CYAN + Style.BRIGHT}[ {stamp} ]{Style.RESET_ALL}{Fore.WHITE + Style.BRIGHT} | {Style.RESET_ALL}"
+            else:
+                self._prefix = f"[ {stamp} ] | "
+            self._second = second
+        return self._prefix
+
+    def write(self, records: List[LogRecord]):
+        lines = []
+        for record in records:
+            message = render(record)
+            if not self.color:
+                message = ANSI_PATTERN.sub("", message)
+            lines.append(self._format_prefix(record[0]) + message + "\n")
+        stream = self.stream or sys.stdout
+        stream.write("".join(lines))
+        stream.flush()
+
+    def close(self):
+        pass
+
+
+class JsonLinesSink:
+    """每条日志一行JSON: 时间、级别、去掉颜色的消息和当前账户"""
+
+    def __init__(self, path: str):
+        self.path = path
+        # 第一次写入时才创建文件
+        self._file = None
+
+    def write(self, records: List[LogRecord]):
+        lines = []
+        for record in records:
+            ts, level, _, _, account = record
+            entry = {
+                "ts": round(ts, 3),
+                "level": LEVEL_NAMES.get(level, str(level)),
+                "msg": ANSI_PATTERN.sub("", render(record)).strip(),
+            }
+            if account is not None:
+                entry["account"] = account
+            lines.append(json.dumps(entry, ensure_ascii=False) + "\n")
+        if self._file is None:
+            self._file = open(self.path, "a", encoding="utf-8")
+        self._file.write("".join(lines))
+        self._file.flush()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class AsyncLogger:
+    """
+    带缓冲的日志器
+
+    start() 之后日志由后台任务每 flush_interval 秒成批写出；没有启动 (或已 stop) 时同步写出，
+    保证交互式提示和报告前后的日志顺序不乱
+    """
+
+    def __init__(self, sinks: List[Any], level: int = INFO, flush_interval: float = 0.1):
+        self.sinks = list(sinks)
+        self.level = level
+        self.flush_interval = flush_interval
+
+        self._records: Deque[LogRecord] = deque()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def enabled(self, level: int) -> bool:
+        return level >= self.level
+
+    def log(self, message: str, *args, level: int = INFO):
+        """记录一条日志，message 可以带 %s 占位符，参数在写出时才替换"""
+        if level < self.level:
+            return
+        self._records.append((time.time(), level, message, args, rpc_account.get()))
+        if self._task is None:
+            self._drain()
+        elif len(self._records) == 1:
+            self._wakeup.set()
+
+    def _drain(self):
+        if not self._records:
+            return
+        records = list(self._records)
+        self._records.clear()
+        for sink in self.sinks:
+            sink.write(records)
+
+    async def start(self):
+        if self._task is None:
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """停止后台任务并写出剩余的日志"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._drain()
+
+    def close(self):
+        self._drain()
+        for sink in self.sinks:
+            sink.close()
+
+    async def _run(self):
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            # 等一小段时间让更多日志攒进同一批
+            await asyncio.sleep(self.flush_interval)
+            self._drain()
@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+"""
+RPC调用统计
+按JSON-RPC方法统计调用次数、延迟分布和错误码，并通过 contextvars 把每次调用
+归到发起它的账户和阶段 (预检/估算/发送/确认...)，运行中可随时取快照，退出时写入汇总文件
+"""
+
+import bisect
+import contextlib
+import json
+import os
+import time
+from collections import Counter
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+# 当前调用归属的阶段和账户，asyncio任务创建时会复制一份，各任务之间互不影响
+rpc_phase: ContextVar[str] = ContextVar("rpc_phase", default="other")
+rpc_account: ContextVar[Optional[str]] = ContextVar("rpc_account", default=None)
+
+# 延迟直方图的桶上限 (毫秒)，最后一个桶收集所有更慢的请求
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, float("inf"))
+
+
+@contextlib.contextmanager
+def rpc_context(phase: Optional[str] = None, account: Optional[str] = None):
+    """在 with 块内发出的RPC调用 (包括块内创建的后台任务) 记到指定的阶段/账户"""
+    tokens = []
+    if phase is not None:
+        tokens.append((rpc_phase, rpc_phase.set(phase)))
+    if account is not None:
+        tokens.append((rpc_account, rpc_account.set(account)))
+    try:
+        yield
+    finally:
+        for var, token in reversed(tokens):
+            var.reset(token)
+
+
+class LatencyHistogram:
+    """固定桶的延迟直方图，分位数取所在桶的上限"""
+
+    def __init__(self):
+        self.counts = [0] * len(LATENCY_BUCKETS_MS)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds: float):
+        ms = seconds * 1000
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS_MS, ms)] += 1
+        self.count += 1
+        self.total += ms
+        self.max = max(self.max, ms)
+
+    def percentile(self, pct: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = pct / 100 * self.count
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS_MS, self.counts):
+            seen += count
+            if seen >= rank and count:
+                return min(bound, self.max)
+        return self.max
+
+    def snapshot(self) -> dict:
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total / self.count, 1) if self.count else 0.0,
+            "p50_ms": round(self.percentile(50), 1),
+            "p99_ms": round(self.percentile(99), 1),
+            "max_ms": round(self.max, 1),
+            "buckets": {
+                ("+inf" if bound == float("inf") else f"<={bound:g}"): count
+                for bound, count in zip(LATENCY_BUCKETS_MS, self.counts) if count
+            },
+        }
+
+
+class _Usage:
+    """一个阶段或账户的调用次数、错误数和累计耗时"""
+
+    __slots__ = ("calls", "errors", "seconds")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.seconds = 0.0
+
+    def add(self, seconds: float, ok: bool):
+        self.calls += 1
+        self.seconds += seconds
+        if not ok:
+            self.errors += 1
+
+    def snapshot(self) -> dict:
+        return {"calls": self.calls, "errors": self.errors, "seconds": round(self.seconds, 3)}
+
+
+class RPCMetrics:
+    """RPC调用统计，由 PooledAsyncHTTPProvider 在每次请求结束时记录"""
+
+    def __init__(self):
+        self.started_at = time.time()
+        self.http_requests = 0
+        self.latency: Dict[str, LatencyHistogram] = {}
+        self.errors: Dict[str, Counter] = {}
+        self.phases: Dict[str, _Usage] = {}
+        self.accounts: Dict[str, _Usage] = {}
+
+    def record(self, methods: Iterable[str], seconds: float, error_codes: Iterable[Optional[str]]):
+        """
+        记录一次HTTP请求: 批量请求里的每个方法各记一次，延迟都按整个请求计算
+
+        error_codes 与 methods 一一对应，成功为 None
+        """
+        self.http_requests += 1
+        phase = rpc_phase.get()
+        account = rpc_account.get()
+        for method, code in zip(methods, error_codes):
+            histogram = self.latency.get(method)
+            if histogram is None:
+                histogram = self.latency[method] = LatencyHistogram()
+                self.errors[method] = Counter()
+            histogram.add(seconds)
+            if code is not None:
+                self.errors[method][code] += 1
+
+            self.phases.setdefault(phase, _Usage()).add(seconds, code is None)
+            if account is not None:
+                self.accounts.setdefault(account, _Usage()).add(seconds, code is None)
+
+    @property
+    def total_calls(self) -> int:
+        return sum(h.count for h in self.latency.values())
+
+    @property
+    def total_errors(self) -> int:
+        return sum(sum(c.values()) for c in self.errors.values())
+
+    def methods(self) -> List[str]:
+        """按调用次数从多到少排列的方法名"""
+        return sorted(self.latency, key=lambda m: self.latency[m].count, reverse=True)
+
+    def snapshot(self, top_accounts: int = 10) -> dict:
+        """当前统计的快照，可在运行中随时调用"""
+        busiest = sorted(self.accounts.items(), key=lambda item: item[1].calls, reverse=True)[:top_accounts]
+        return {
+            "elapsed_seconds": round(time.time() - self.started_at, 3),
+            "http_requests": self.http_requests,
+            "calls": self.total_calls,
+            "errors": self.total_errors,
+            "methods": {
+                method: {**self.latency[method].snapshot(), "errors": dict(self.errors[method])}
+                for method in self.methods()
+            },
+            "phases": {phase: usage.snapshot() for phase, usage in self.phases.items()},
+            "accounts": len(self.accounts),
+            "busiest_accounts": {address: usage.snapshot() for address, usage in busiest},
+        }
+
+    def summary_line(self) -> str:
+        """一行文字的实时概况: 总调用、错误和调用最多的几个方法"""
+        top = ", ".join(f"{method} {self.latency[method].count}" for method in self.methods()[:3])
+        return f"{self.total_calls} 次调用 / {self.http_requests} 个HTTP请求, 错误 {self.total_errors}" + \
+            (f" ({top})" if top else "")
+
+    def write_summary(self, path: str):
+        """把快照写成JSON文件 (先写临时文件再替换，中途退出不会留下半个文件)"""
+        path = Path(path)
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_text(json.dumps(self.snapshot(), ensure_ascii=False, indent=2), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+
+def error_code(response: Any) -> Optional[str]:
+    """从单个JSON-RPC响应里取出错误码，没有错误时返回 None"""
+    if isinstance(response, dict):
+        error = response.get("error")
+        if isinstance(error, dict):
+            return str(error.get("code"))
+        if error is not None:
+            return "error"
+    return None
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""
+Multicall3 聚合预检
+一次 eth_call 调用 Multicall3.aggregate3，同时取回一批地址的原生币余额 (getEthBalance)
+和各个徽章合约的 balanceOf，N 个钱包只需要 N/batch_size 次RPC
+"""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Dict, List, Sequence, Tuple
+
+from web3 import AsyncWeb3, Web3
+
+# Multicall3 在几乎所有EVM链上都部署在同一个地址
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+AGGREGATE3_SELECTOR = Web3.keccak(text="aggregate3((address,bool,bytes)[])")[:4]
+GET_ETH_BALANCE_SELECTOR = Web3.keccak(text="getEthBalance(address)")[:4]
+BALANCE_OF_SELECTOR = Web3.keccak(text="balanceOf(address)")[:4]
+
+
+@dataclass
+class WalletHoldings:
+    """单个钱包的原生币余额和各徽章合约的持有数"""
+    address: str
+    balance_wei: int
+    token_balances: Dict[str, int]
+
+
+def _word(value: int) -> bytes:
+    return value.to_bytes(32, "big")
+
+
+def encode_aggregate3(calls: List[Tuple[str, bytes]]) -> bytes:
+    """
+    编码 aggregate3 调用，每个子调用都允许失败
+
+    调用形状固定，直接按ABI布局拼接字节，比通用的 eth_abi.encode 快一个数量级
+    """
+    heads, tails, offset = [], [], 32 * len(calls)
+    for target, data in calls:
+        padding = -len(data) % 32
+        tail = bytes(12) + bytes.fromhex(target[2:]) + _word(1) + _word(0x60) + _word(len(data)) + data + bytes(padding)
+        heads.append(_word(offset))
+        tails.append(tail)
+        offset += len(tail)
+    return AGGREGATE3_SELECTOR + _word(0x20) + _word(len(calls)) + b"".join(heads) + b"".join(tails)
+
+
+def decode_aggregate3(data: bytes) -> List[Tuple[bool, bytes]]:
+    """解码 aggregate3 返回的 (bool success, bytes returnData)[]"""
+    base = int.from_bytes(data[0:32], "big")
+    count = int.from_bytes(data[base:base + 32], "big")
+    start = base + 32
+    results = []
+    for i in range(count):
+        item = start + int.from_bytes(data[start + 32 * i:start + 32 * (i + 1)], "big")
+        success = data[item + 31] == 1
+        position = item + int.from_bytes(data[item + 32:item + 64], "big")
+        length = int.from_bytes(data[position:position + 32], "big")
+        results.append((success, data[position + 32:position + 32 + length]))
+    return results
+
+
+def _address_arg(address: str) -> bytes:
+    return bytes(12) + bytes.fromhex(address[2:])
+
+
+async def _holdings_chunk(w3: AsyncWeb3, addresses: List[str], tokens: Sequence[str],
+                          multicall: str) -> Dict[str, WalletHoldings]:
+    calls = []
+    for address in addresses:
+        calls.append((multicall, GET_ETH_BALANCE_SELECTOR + _address_arg(address)))
+        for token in tokens:
+            calls.append((token, BALANCE_OF_SELECTOR + _address_arg(address)))
+
+    # 直接发原始请求，跳过web3对eth_call的交易格式校验 (会额外请求 eth_chainId)
+    response = await w3.provider.make_request(
+        "eth_call", [{"to": multicall, "data": "0x" + encode_aggregate3(calls).hex()}, "latest"]
+    )
+    if "result" not in response:
+        raise ValueError(response.get("error", response))
+    outcomes = decode_aggregate3(bytes.fromhex(response["result"][2:]))
+
+    results = {}
+    stride = 1 + len(tokens)
+    for i, address in enumerate(addresses):
+        group = outcomes[i * stride:(i + 1) * stride]
+        if not all(ok and len(data) >= 32 for ok, data in group):
+            # 单个子调用失败时跳过，由JSON-RPC批量预检回退
+            continue
+        results[address] = WalletHoldings(
+            address=address,
+            balance_wei=int.from_bytes(group[0][1][:32], "big"),
+            token_balances={token: int.from_bytes(data[:32], "big") for token, (_, data) in zip(tokens, group[1:])}
+        )
+    return results
+
+
+async def multicall_holdings(w3: AsyncWeb3, addresses: List[str], tokens: Sequence[str], batch_size: int = 500,
+                             concurrency: int = 4, multicall: str = MULTICALL3_ADDRESS) -> Dict[str, WalletHoldings]:
+    """
+    通过 Multicall3 批量获取所有地址的余额和各 token 合约的 balanceOf
+
+    batch_size 是每次eth_call覆盖的地址数。链上没有部署 Multicall3 时返回空字典;
+    失败的批次同样不会抛出，对应地址不在结果里，调用方应回退到 eth_getBalance
+    """
+    multicall = Web3.to_checksum_address(multicall)
+    tokens = [Web3.to_checksum_address(token) for token in tokens]
+    try:
+        if not await w3.eth.get_code(multicall):
+            return {}
+    except Exception:
+        return {}
+
+    semaphore = asyncio.Semaphore(concurrency)
+    unique = list(dict.fromkeys(addresses))
+
+    async def run(chunk: List[str]):
+        async with semaphore:
+            try:
+                return await _holdings_chunk(w3, chunk, tokens, multicall)
+            except Exception:
+                return {}
+
+    outcomes = await asyncio.gather(*(run(unique[i:i + batch_size]) for i in range(0, len(unique), batch_size)))
+
+    holdings = {}
+    for chunk_results in outcomes:
+        holdings.update(chunk_results)
+    return holdings
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""
+本地nonce管理
+每个地址只从链上读取一次pending nonce，之后在本地递增分配，
+同一钱包可以连续发送多笔交易而不必等待上一笔确认
+"""
+
+import asyncio
+from typing import Dict, Set
+
+from web3 import AsyncWeb3
+
+# 节点返回这些错误时说明本地nonce与链上状态不一致，需要重新同步
+NONCE_ERROR_MARKERS = (
+    "nonce too low",
+    "nonce too high",
+    "nonce gap",
+    "invalid nonce",
+    "replacement transaction underpriced",
+)
+
+
+def is_nonce_error(error: Exception) -> bool:
+    message = str(error).lower()
+    return any(marker in message for marker in NONCE_ERROR_MARKERS)
+
+
+class NonceManager:
+    """按地址分配nonce，可由批量预检结果播种"""
+
+    def __init__(self, w3: AsyncWeb3):
+        self.w3 = w3
+        self._next: Dict[str, int] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        # 中间nonce被释放后出现空洞的地址，下次分配前重新同步
+        self._stale: Set[str] = set()
+
+    def _lock(self, address: str) -> asyncio.Lock:
+        lock = self._locks.get(address)
+        if lock is None:
+            lock = self._locks[address] = asyncio.Lock()
+        return lock
+
+    def seed(self, address: str, nonce: int):
+        """用预检得到的pending nonce初始化，已有本地状态时不覆盖"""
+        self._next.setdefault(address.lower(), nonce)
+
+    async def _fetch(self, address: str) -> int:
+        return await self.w3.eth.get_transaction_count(AsyncWeb3.to_checksum_address(address), "pending")
+
+    async def allocate(self, address: str) -> int:
+        """分配下一个nonce"""
+        key = address.lower()
+        async with self._lock(key):
+            if key not in self._next or key in self._stale:
+                self._next[key] = await self._fetch(key)
+                self._stale.discard(key)
+            nonce = self._next[key]
+            self._next[key] = nonce + 1
+            return nonce
+
+    async def resync(self, address: str) -> int:
+        """出现nonce错误后与链上pending nonce重新同步"""
+        key = address.lower()
+        async with self._lock(key):
+            self._next[key] = await self._fetch(key)
+            self._stale.discard(key)
+            return self._next[key]
+
+    def reserve(self, address: str, nonce: int):
+        """标记一个已经签进交易 (但链上还看不到) 的nonce，之后的分配从它后面开始"""
+        key = address.lower()
+        self._next[key] = max(self._next.get(key, 0), nonce + 1)
+
+    def release(self, address: str, nonce: int):
+        """交易没有发出去时归还nonce"""
+        key = address.lower()
+        if self._next.get(key) == nonce + 1:
+            self._next[key] = nonce
+        else:
+            self._stale.add(key)
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+"""
+JSON-RPC 批量预检
+把所有钱包的 eth_getBalance / eth_getTransactionCount 打包成批量请求，
+一个HTTP请求覆盖 batch_size 个地址，顺带取一次 eth_gasPrice。
+已经通过 Multicall3 取到余额的地址只查询nonce
+"""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from web3 import AsyncWeb3
+
+
+@dataclass
+class AccountPreflight:
+    """单个钱包的预检结果"""
+    address: str
+    balance_wei: int
+    nonce: int
+
+
+def _chunks(items: List[str], size: int):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+async def _preflight_chunk(w3: AsyncWeb3, addresses: List[str], with_gas_price: bool,
+                          balances: Dict[str, int]) -> Tuple[Dict[str, AccountPreflight], Optional[int]]:
+    requests = []
+    # 每个地址在响应列表里的位置 (余额下标或None, nonce下标)
+    positions = []
+    for address in addresses:
+        balance_index = None
+        if address not in balances:
+            balance_index = len(requests)
+            requests.append(("eth_getBalance", [address, "latest"]))
+        positions.append((balance_index, len(requests)))
+        requests.append(("eth_getTransactionCount", [address, "pending"]))
+    if with_gas_price:
+        requests.append(("eth_gasPrice", []))
+
+    responses = await w3.provider.make_batch_request(requests)
+    if not isinstance(responses, list):
+        # 节点对整个批次返回了一个错误对象
+        raise ValueError(responses.get("error", responses))
+
+    results = {}
+    for address, (balance_index, nonce_index) in zip(addresses, positions):
+        nonce = responses[nonce_index]
+        balance = responses[balance_index] if balance_index is not None else {"result": hex(balances[address])}
+        if "result" not in balance or "result" not in nonce:
+            # 单个地址出错时跳过，由mint流程回退到逐个查询
+            continue
+        results[address] = AccountPreflight(
+            address=address,
+            balance_wei=int(balance["result"], 16),
+            nonce=int(nonce["result"], 16)
+        )
+
+    gas_price = None
+    if with_gas_price and "result" in responses[-1]:
+        gas_price = int(responses[-1]["result"], 16)
+    return results, gas_price
+
+
+async def batch_preflight(w3: AsyncWeb3, addresses: List[str], batch_size: int = 200, concurrency: int = 4,
+                          balances: Optional[Dict[str, int]] = None,
+                          with_gas_price: bool = True) -> Tuple[Dict[str, AccountPreflight], Optional[int]]:
+    """
+    批量获取所有地址的余额和pending nonce
+
+    balances 里已有的地址不再请求 eth_getBalance。返回 ({地址: AccountPreflight}, gas_price)。
+    失败的批次不会抛出，对应地址不在结果里，调用方应回退到逐个RPC查询
+    """
+    balances = balances or {}
+    semaphore = asyncio.Semaphore(concurrency)
+    unique = list(dict.fromkeys(addresses))
+
+    async def run(index: int, chunk: List[str]):
+        async with semaphore:
+            try:
+                return await _preflight_chunk(w3, chunk, with_gas_price and index == 0, balances)
+            except Exception:
+                return {}, None
+
+    outcomes = await asyncio.gather(*(run(i, chunk) for i, chunk in enumerate(_chunks(unique, batch_size))))
+
+    accounts = {}
+    gas_price = None
+    for chunk_results, chunk_gas_price in outcomes:
+        accounts.update(chunk_results)
+        gas_price = gas_price or chunk_gas_price
+    return accounts, gas_price
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""
+预签名交易文件
+开售前把每个钱包的 claim 交易 (nonce、gas、gas价格都已确定) 签好写进文件，
+开售时由单独的广播进程读出来直接发送。
+
+格式: 第一行是JSON头 (格式版本、链ID、生成时间、交易数)，之后每行一笔交易:
+    合约地址 钱包地址 槽位 nonce 原始交易hex
+交易哈希由原始交易计算，不单独保存
+"""
+
+import json
+import os
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, List, Tuple
+
+from web3 import Web3
+
+FORMAT = "pharos-presigned/1"
+
+
+@dataclass(frozen=True)
+class PresignedTx:
+    contract: str
+    address: str
+    slot: int
+    nonce: int
+    raw_tx: str
+
+    @property
+    def tx_hash(self) -> str:
+        return Web3.to_hex(Web3.keccak(hexstr=self.raw_tx))
+
+
+def write_presigned(path: str, chain_id: int, txs: Iterable[PresignedTx]) -> int:
+    """写入预签名文件 (先写临时文件再替换)，返回交易数"""
+    txs = list(txs)
+    header = {"format": FORMAT, "chain_id": chain_id, "created_at": datetime.now().isoformat(), "count": len(txs)}
+    lines = [json.dumps(header)]
+    lines.extend(f"{tx.contract} {tx.address} {tx.slot} {tx.nonce} {tx.raw_tx}" for tx in txs)
+
+    path = Path(path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    os.replace(tmp_path, path)
+    return len(txs)
+
+
+def read_presigned(path: str) -> Tuple[dict, List[PresignedTx]]:
+    """读取预签名文件，返回 (文件头, 交易列表)"""
+    with open(path, "r", encoding="utf-8") as f:
+        header = json.loads(f.readline())
+        if header.get("format") != FORMAT:
+            raise ValueError(f"不支持的预签名文件格式: {header.get('format')}")
+        txs = []
+        for line in f:
+            if not line.strip():
+                continue
+            contract, address, slot, nonce, raw_tx = line.split()
+            txs.append(PresignedTx(contract, address, int(slot), int(nonce), raw_tx))
+    if len(txs) != header.get("count"):
+        raise ValueError(f"预签名文件不完整: 头部记录 {header.get('count')} 笔, 实际 {len(txs)} 笔")
+    return header, txs
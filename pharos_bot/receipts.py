@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+"""
+区块驱动的收据监听器
+一个后台任务跟随新区块，只为出现在新区块里的待确认交易批量拉取收据，
+RPC负载随区块数增长而不是随待确认交易数增长
+"""
+
+import asyncio
+from typing import Dict, List, Optional, Set
+
+from hexbytes import HexBytes
+from web3 import AsyncWeb3, Web3
+from web3.datastructures import AttributeDict
+
+_RECEIPT_INT_FIELDS = (
+    "blockNumber", "transactionIndex", "cumulativeGasUsed", "gasUsed", "effectiveGasPrice", "status", "type"
+)
+_RECEIPT_BYTES_FIELDS = ("blockHash", "transactionHash", "logsBloom")
+_LOG_INT_FIELDS = ("blockNumber", "transactionIndex", "logIndex")
+_LOG_BYTES_FIELDS = ("blockHash", "transactionHash", "data")
+
+
+def _normalize_hash(tx_hash) -> str:
+    if isinstance(tx_hash, (bytes, bytearray)):
+        return "0x" + bytes(tx_hash).hex()
+    tx_hash = tx_hash.lower()
+    return tx_hash if tx_hash.startswith("0x") else "0x" + tx_hash
+
+
+def _format_log(raw: dict) -> AttributeDict:
+    log = dict(raw)
+    for key in _LOG_INT_FIELDS:
+        if log.get(key) is not None:
+            log[key] = int(log[key], 16)
+    for key in _LOG_BYTES_FIELDS:
+        if log.get(key) is not None:
+            log[key] = HexBytes(log[key])
+    log["address"] = Web3.to_checksum_address(log["address"])
+    log["topics"] = [HexBytes(topic) for topic in log.get("topics", [])]
+    return AttributeDict(log)
+
+
+def format_receipt(raw: dict) -> AttributeDict:
+    """把原始JSON收据转换成与 w3.eth.get_transaction_receipt 相同形状的 AttributeDict"""
+    receipt = dict(raw)
+    for key in _RECEIPT_INT_FIELDS:
+        if receipt.get(key) is not None:
+            receipt[key] = int(receipt[key], 16)
+    for key in _RECEIPT_BYTES_FIELDS:
+        if receipt.get(key) is not None:
+            receipt[key] = HexBytes(receipt[key])
+    for key in ("from", "to", "contractAddress"):
+        if receipt.get(key):
+            receipt[key] = Web3.to_checksum_address(receipt[key])
+    receipt["logs"] = [_format_log(log) for log in receipt.get("logs", [])]
+    return AttributeDict(receipt)
+
+
+# ---- mint结果解析规则 (DropConfig.receipt_parser) ----
+
+TRANSFER_TOPIC = Web3.keccak(text="Transfer(address,address,uint256)")
+TOKENS_CLAIMED_TOPIC = Web3.keccak(text="TokensClaimed(uint256,address,address,uint256,uint256)")
+
+
+def _topic_address(topic: bytes) -> str:
+    return "0x" + bytes(topic)[-20:].hex()
+
+
+def _contract_logs(receipt: AttributeDict, contract: str, topic: bytes, min_topics: int):
+    contract = contract.lower()
+    for log in receipt.logs:
+        topics = log.topics
+        if len(topics) >= min_topics and bytes(topics[0]) == topic and log.address.lower() == contract:
+            yield log
+
+
+def transfer_token_id(receipt: AttributeDict, receiver: str, contract: str) -> Optional[int]:
+    """ERC-721 Transfer(0x0 -> receiver) 事件里的tokenId，没有找到返回None"""
+    for log in _contract_logs(receipt, contract, TRANSFER_TOPIC, 4):
+        if not any(bytes(log.topics[1])) and _topic_address(log.topics[2]) == receiver.lower():
+            return int.from_bytes(log.topics[3], "big")
+    return None
+
+
+def tokens_claimed_token_id(receipt: AttributeDict, receiver: str, contract: str) -> Optional[int]:
+    """Drop合约 TokensClaimed 事件里的 startTokenId，没有找到返回None"""
+    for log in _contract_logs(receipt, contract, TOKENS_CLAIMED_TOPIC, 4):
+        if _topic_address(log.topics[3]) == receiver.lower() and len(log.data) >= 32:
+            return int.from_bytes(log.data[:32], "big")
+    return None
+
+
+class ReceiptWatcher:
+    """所有待确认mint共享的收据监听器"""
+
+    def __init__(self, w3: AsyncWeb3, poll_interval: float = 0.5, sweep_every: int = 10, batch_size: int = 100):
+        self.w3 = w3
+        self.poll_interval = poll_interval
+        # 每隔 sweep_every 个区块对全部待确认交易兜底查一次收据
+        self.sweep_every = sweep_every
+        self.batch_size = batch_size
+
+        self._pending: Dict[str, asyncio.Future] = {}
+        # 注册后还没检查过的交易，可能已被打包进监听器处理过的区块
+        self._fresh: Set[str] = set()
+        self._last_block: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    @property
+    def head(self) -> Optional[int]:
+        """监听器已经处理到的区块号"""
+        return self._last_block
+
+    async def start(self):
+        if self._task is None:
+            self._last_block = await self.w3.eth.block_number
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        for future in self._pending.values():
+            if not future.done():
+                future.cancel()
+        self._pending.clear()
+
+    def watch(self, tx_hash) -> asyncio.Future:
+        """登记一笔交易，返回收据到达时完成的future"""
+        key = _normalize_hash(tx_hash)
+        future = self._pending.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._pending[key] = future
+            self._fresh.add(key)
+        return future
+
+    def forget(self, tx_hash):
+        key = _normalize_hash(tx_hash)
+        self._pending.pop(key, None)
+        self._fresh.discard(key)
+
+    async def wait(self, tx_hash, timeout: Optional[float] = None) -> AttributeDict:
+        """等待交易收据，超时抛出 asyncio.TimeoutError"""
+        future = self.watch(tx_hash)
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            self.forget(tx_hash)
+            raise
+
+    # ---- 后台任务 ----
+
+    async def _run(self):
+        while True:
+            try:
+                if self._pending:
+                    await self._poll()
+                else:
+                    # 空闲时也跟上链头: 否则空闲很久之后刚发出的交易会以旧的 head 为起点，
+                    # 第一次轮询就看到一大段"未打包"的区块，被误判为卡住而提价替换
+                    self._last_block = max(self._last_block, await self.w3.eth.block_number)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                # 单次轮询失败不影响监听器，下个周期重试
+                pass
+            await asyncio.sleep(self.poll_interval)
+
+    async def _poll(self):
+        head = await self.w3.eth.block_number
+        if head <= self._last_block:
+            return
+
+        new_blocks = range(self._last_block + 1, head + 1)
+        candidates = set(self._fresh)
+        self._fresh.clear()
+
+        # 只有刚登记的交易时直接查收据即可，不必回扫空闲期间的区块
+        waiting = set(self._pending) - candidates
+        if waiting and any(number % self.sweep_every == 0 for number in new_blocks):
+            candidates.update(self._pending)
+        elif waiting:
+            for tx_hashes in await self._block_transactions(list(new_blocks)):
+                candidates.update(h for h in tx_hashes if h in self._pending)
+
+        await self._fetch_receipts([h for h in candidates if h in self._pending])
+        self._last_block = head
+
+    async def _batch(self, requests: List[tuple]) -> List[dict]:
+        responses = await self.w3.provider.make_batch_request(requests)
+        if not isinstance(responses, list):
+            raise ValueError(responses.get("error", responses))
+        return responses
+
+    async def _block_transactions(self, numbers: List[int]) -> List[List[str]]:
+        results = []
+        for i in range(0, len(numbers), self.batch_size):
+            chunk = numbers[i:i + self.batch_size]
+            responses = await self._batch([("eth_getBlockByNumber", [hex(n), False]) for n in chunk])
+            for response in responses:
+                block = response.get("result") or {}
+                results.append([_normalize_hash(h) for h in block.get("transactions", [])])
+        return results
+
+    async def _fetch_receipts(self, tx_hashes: List[str]):
+        for i in range(0, len(tx_hashes), self.batch_size):
+            chunk = tx_hashes[i:i + self.batch_size]
+            responses = await self._batch([("eth_getTransactionReceipt", [h]) for h in chunk])
+            for tx_hash, response in zip(chunk, responses):
+                raw = response.get("result")
+                if not raw:
+                    continue
+                future = self._pending.pop(tx_hash, None)
+                if future is not None and not future.done():
+                    future.set_result(format_receipt(raw))
@@ -0,0 +1,365 @@
+# -*- coding: utf-8 -*-
+"""
+多节点RPC池
+按滚动延迟和错误率给每个节点打分，读请求发往最快的健康节点，
+幂等请求失败时换节点重试，错误率过高的节点暂时剔除；
+每个节点一个按 AIMD 自适应速率的令牌桶，所有请求 (包括后台轮询) 都要先取令牌
+"""
+
+import asyncio
+import random
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+from aiohttp import ClientError, ClientSession, ClientTimeout
+from web3.providers.async_base import AsyncJSONBaseProvider
+
+from pharos_bot.metrics import RPCMetrics, error_code
+
+# 广播交易不在其他节点重试，避免重复提交产生混乱的错误
+NON_RETRYABLE_METHODS = {"eth_sendRawTransaction", "eth_sendTransaction"}
+
+# 表示节点过载/限流的JSON-RPC错误码，读请求遇到时换节点重试
+RETRYABLE_RPC_CODES = {-32005, 429}
+# -32603 是通用的内部错误，很多节点的 eth_call/eth_estimateGas revert 也返回它，
+# 只有错误信息表明节点过载时才换节点重试并降速
+INTERNAL_ERROR_CODE = -32603
+OVERLOAD_MARKERS = ("rate limit", "too many requests", "overload", "busy", "capacity", "timeout", "timed out",
+                    "try again")
+# -32005 也用于 eth_getLogs 的区块范围/结果数超限，这类错误换节点重试也不会成功，交给调用方缩小范围
+RESULT_LIMIT_MARKERS = ("block range", "range is too", "range too", "query returned more than", "response size")
+
+
+def is_overload_error(error: dict) -> bool:
+    """JSON-RPC错误对象是否表示节点过载/限流"""
+    code = error.get("code")
+    message = str(error.get("message", "")).lower()
+    if code == INTERNAL_ERROR_CODE:
+        return any(marker in message for marker in OVERLOAD_MARKERS)
+    return code in RETRYABLE_RPC_CODES and not any(marker in message for marker in RESULT_LIMIT_MARKERS)
+
+
+class NodeUnavailable(Exception):
+    """节点返回了HTTP错误状态 (429/5xx 等)"""
+
+    def __init__(self, url: str, status: int):
+        super().__init__(f"{url} 返回HTTP {status}")
+        self.url = url
+        self.status = status
+
+
+class AdaptiveRateLimiter:
+    """
+    AIMD令牌桶: 请求被限速 (令牌不够) 且节点一直正常时提速 -- 第一次过载之前每秒翻倍 (慢启动)，
+    之后每秒加 increase 个请求/秒；节点返回429/5xx/超时或延迟明显变高时速率乘以 decrease，
+    两次降速之间至少间隔 cooldown 秒
+    """
+
+    def __init__(self, rate: float = 100, min_rate: float = 1, max_rate: float = 500,
+                 increase: float = 10, decrease: float = 0.5, cooldown: float = 1.0,
+                 latency_factor: float = 4, latency_floor: float = 0.25):
+        self.rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.cooldown = cooldown
+        # 延迟超过 max(最低延迟 * latency_factor, latency_floor) 秒视为节点开始过载
+        self.latency_factor = latency_factor
+        self.latency_floor = latency_floor
+
+        self.tokens = 1.0
+        # 慢启动阈值: 速率低于它时按倍数增长
+        self.threshold = max_rate
+        self.min_latency: Optional[float] = None
+        self.throttled = 0
+        self._updated = time.monotonic()
+        self._last_wait = 0.0
+        self._last_decrease = 0.0
+
+    @property
+    def burst(self) -> float:
+        # 最多攒 0.5 秒的令牌，空闲后不会一下子把节点打满
+        return max(1.0, self.rate / 2)
+
+    def _refill(self, now: float):
+        self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def wait_time(self) -> float:
+        """现在取令牌需要等待的秒数"""
+        self._refill(time.monotonic())
+        return 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+
+    async def acquire(self):
+        # 先扣令牌再等待，同时等待的请求按到达顺序排队
+        now = time.monotonic()
+        self._refill(now)
+        self.tokens -= 1
+        if self.tokens < 0:
+            self.throttled += 1
+            self._last_wait = now
+            await asyncio.sleep(-self.tokens / self.rate)
+
+    def on_success(self, latency: Optional[float] = None):
+        if latency is not None:
+            self.min_latency = latency if self.min_latency is None else min(self.min_latency, latency)
+            if latency > max(self.min_latency * self.latency_factor, self.latency_floor):
+                self.on_congestion()
+                return
+        if time.monotonic() - self._last_wait < 1.0:
+            # 只有速率确实成为瓶颈时才加速: 每个请求加1 (每秒约翻倍) 或 increase / rate (每秒约加 increase)
+            step = 1 if self.rate < self.threshold else self.increase / self.rate
+            self.rate = min(self.max_rate, self.rate + step)
+
+    def on_congestion(self):
+        now = time.monotonic()
+        if now - self._last_decrease < self.cooldown:
+            return
+        self._last_decrease = now
+        self.rate = max(self.min_rate, self.rate * self.decrease)
+        self.threshold = self.rate
+        self.tokens = min(self.tokens, self.burst)
+
+
+class EndpointStats:
+    """单个节点的滚动统计"""
+
+    def __init__(self, url: str, window: int = 20, alpha: float = 0.3,
+                 limiter: Optional[AdaptiveRateLimiter] = None):
+        self.url = url
+        self.limiter = limiter
+        self.alpha = alpha
+        self.latency: Optional[float] = None
+        self.outcomes: Deque[bool] = deque(maxlen=window)
+        self.ejected_until = 0.0
+        self.in_flight = 0
+        self.requests = 0
+        self.errors = 0
+
+    @property
+    def error_rate(self) -> float:
+        if not self.outcomes:
+            return 0.0
+        return self.outcomes.count(False) / len(self.outcomes)
+
+    @property
+    def healthy(self) -> bool:
+        return time.monotonic() >= self.ejected_until
+
+    def score(self) -> float:
+        # 还没有延迟样本的节点得分最低，保证每个节点都会被试探到
+        latency = self.latency if self.latency is not None else 0.0
+        score = latency * (1 + 3 * self.error_rate) * (1 + 0.05 * self.in_flight)
+        # 令牌用完的节点加上排队时间，请求自然分流到还有余量的节点
+        if self.limiter is not None:
+            score += self.limiter.wait_time()
+        return score
+
+    def record(self, ok: bool, latency: Optional[float] = None, batch: bool = False):
+        self.requests += 1
+        self.outcomes.append(ok)
+        if not ok:
+            self.errors += 1
+            if self.limiter is not None:
+                self.limiter.on_congestion()
+        if ok and latency is not None:
+            self.latency = latency if self.latency is None else self.alpha * latency + (1 - self.alpha) * self.latency
+            if self.limiter is not None:
+                # 批量请求本来就慢，不作为过载信号
+                self.limiter.on_success(None if batch else latency)
+
+    def eject(self, seconds: float):
+        self.ejected_until = time.monotonic() + seconds
+        self.outcomes.clear()
+        self.latency = None
+
+    def snapshot(self) -> dict:
+        return {
+            "url": self.url,
+            "latency_ms": round(self.latency * 1000, 1) if self.latency is not None else None,
+            "error_rate": round(self.error_rate, 3),
+            "healthy": self.healthy,
+            "requests": self.requests,
+            "errors": self.errors,
+            "rate_limit": round(self.limiter.rate, 1) if self.limiter is not None else None,
+            "throttled": self.limiter.throttled if self.limiter is not None else 0,
+        }
+
+
+class PooledAsyncHTTPProvider(AsyncJSONBaseProvider):
+    """AsyncWeb3 的多节点HTTP provider，所有节点共用一个aiohttp会话"""
+
+    def __init__(self, endpoints: List[str], session: Optional[ClientSession] = None,
+                 request_timeout: float = 30, max_attempts: int = 3, eject_seconds: float = 30,
+                 error_threshold: float = 0.5, min_samples: int = 5, explore_ratio: float = 0.05,
+                 metrics: Optional[RPCMetrics] = None, rate_limit: Optional[dict] = None, **kwargs: Any):
+        if not endpoints:
+            raise ValueError("至少需要一个RPC节点")
+        super().__init__(**kwargs)
+        # rate_limit 是传给 AdaptiveRateLimiter 的参数，None 表示使用默认值，传 {"enabled": False} 关闭限速
+        rate_limit = dict(rate_limit or {})
+        limited = rate_limit.pop("enabled", True)
+        self.endpoints = [
+            EndpointStats(url, limiter=AdaptiveRateLimiter(**rate_limit) if limited else None)
+            for url in dict.fromkeys(endpoints)
+        ]
+        self.request_timeout = request_timeout
+        self.max_attempts = max_attempts
+        self.eject_seconds = eject_seconds
+        self.error_threshold = error_threshold
+        self.min_samples = min_samples
+        # 小比例请求随机发往其他健康节点，保持它们的延迟数据不过期
+        self.explore_ratio = explore_ratio
+        # 按方法/阶段/账户统计调用，None 表示不统计
+        self.metrics = metrics
+
+        self._session = session
+        self._owns_session = session is None
+
+    def __str__(self) -> str:
+        return f"RPC pool {[e.url for e in self.endpoints]}"
+
+    @property
+    def endpoint_uri(self) -> str:
+        return self.ranked()[0].url
+
+    def ranked(self) -> List[EndpointStats]:
+        """健康节点按得分排序在前，剔除中的节点按恢复时间排在后面"""
+        healthy = sorted((e for e in self.endpoints if e.healthy), key=lambda e: e.score())
+        ejected = sorted((e for e in self.endpoints if not e.healthy), key=lambda e: e.ejected_until)
+        if len(healthy) > 1 and random.random() < self.explore_ratio:
+            healthy.insert(0, healthy.pop(random.randrange(1, len(healthy))))
+        return healthy + ejected
+
+    def snapshot(self) -> List[dict]:
+        return [e.snapshot() for e in self.endpoints]
+
+    async def _get_session(self) -> ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = ClientSession()
+            self._owns_session = True
+        return self._session
+
+    def _record_failure(self, endpoint: EndpointStats):
+        endpoint.record(False)
+        if len(endpoint.outcomes) >= self.min_samples and endpoint.error_rate >= self.error_threshold:
+            endpoint.eject(self.eject_seconds)
+
+    async def _post(self, endpoint: EndpointStats, data: bytes) -> bytes:
+        session = await self._get_session()
+        endpoint.in_flight += 1
+        try:
+            async with session.post(
+                endpoint.url,
+                data=data,
+                headers={"Content-Type": "application/json"},
+                timeout=ClientTimeout(total=self.request_timeout)
+            ) as response:
+                if response.status == 429 or response.status >= 500:
+                    raise NodeUnavailable(endpoint.url, response.status)
+                response.raise_for_status()
+                return await response.read()
+        finally:
+            endpoint.in_flight -= 1
+
+    @staticmethod
+    def _retryable_error(response: Any) -> bool:
+        if isinstance(response, dict):
+            error = response.get("error")
+            return isinstance(error, dict) and is_overload_error(error)
+        return False
+
+    async def _send(self, methods: List[str], data: bytes) -> Any:
+        if self.metrics is None:
+            return await self._send_with_retry(methods, data)
+
+        # 统计调用方看到的耗时，包括换节点重试
+        start = time.monotonic()
+        try:
+            response = await self._send_with_retry(methods, data)
+        except Exception as e:
+            code = f"http_{e.status}" if isinstance(e, NodeUnavailable) else type(e).__name__
+            self.metrics.record(methods, time.monotonic() - start, [code] * len(methods))
+            raise
+        if isinstance(response, list):
+            codes = [error_code(item) for item in sorted(response, key=lambda item: item.get("id", 0))]
+        else:
+            codes = [error_code(response)] * len(methods)
+        self.metrics.record(methods, time.monotonic() - start, codes)
+        return response
+
+    @staticmethod
+    def _next_endpoint(ranked: List[EndpointStats], attempt: int, endpoint: EndpointStats,
+                       throttled: bool) -> Optional[EndpointStats]:
+        """
+        下一次尝试的节点: 优先换节点; 没有其他节点时，被限流 (429/-32005) 的请求留在同一节点重试，
+        限速器已经降速，重新取令牌本身就是退避 (没有限速器时不重试)
+        """
+        if attempt + 1 < len(ranked):
+            return ranked[attempt + 1]
+        if throttled and endpoint.limiter is not None:
+            return endpoint
+        return None
+
+    async def _send_with_retry(self, methods: List[str], data: bytes) -> Any:
+        retry = not any(method in NON_RETRYABLE_METHODS for method in methods)
+        attempts = self.max_attempts if retry else 1
+        ranked = self.ranked()
+
+        endpoint = ranked[0]
+        last_error: Optional[Exception] = None
+        for attempt in range(attempts):
+            if endpoint.limiter is not None:
+                await endpoint.limiter.acquire()
+            start = time.monotonic()
+            try:
+                response = self.decode_rpc_response(await self._post(endpoint, data))
+            except (ClientError, asyncio.TimeoutError, NodeUnavailable, ValueError) as e:
+                self._record_failure(endpoint)
+                last_error = e
+                throttled = isinstance(e, NodeUnavailable) and e.status == 429
+                next_endpoint = self._next_endpoint(ranked, attempt, endpoint, throttled)
+            else:
+                next_endpoint = None
+                if retry and attempt < attempts - 1 and self._retryable_error(response):
+                    next_endpoint = self._next_endpoint(ranked, attempt, endpoint, True)
+                if next_endpoint is None:
+                    endpoint.record(True, time.monotonic() - start, batch=len(methods) > 1)
+                    return response
+                self._record_failure(endpoint)
+            if next_endpoint is None:
+                break
+            endpoint = next_endpoint
+
+        raise last_error or NodeUnavailable(endpoint.url, 0)
+
+    async def warm_up(self, connections: int = 4):
+        """对每个节点并发发几个 eth_blockNumber，提前建立TCP/TLS连接并刷新延迟数据 (不经过限速)"""
+        data = self.encode_rpc_request("eth_blockNumber", [])
+
+        async def ping(endpoint: EndpointStats):
+            start = time.monotonic()
+            try:
+                await self._post(endpoint, data)
+            except (ClientError, asyncio.TimeoutError, NodeUnavailable):
+                self._record_failure(endpoint)
+                return
+            endpoint.record(True, time.monotonic() - start)
+
+        await asyncio.gather(*(ping(endpoint) for endpoint in self.endpoints for _ in range(connections)))
+
+    async def make_request(self, method, params) -> Dict[str, Any]:
+        return await self._send([method], self.encode_rpc_request(method, params))
+
+    async def make_batch_request(self, requests):
+        response = await self._send([method for method, _ in requests], self.encode_batch_rpc_request(requests))
+        if not isinstance(response, list):
+            # 整个批次出错时节点只返回一个错误对象
+            return response
+        return sorted(response, key=lambda item: item.get("id", 0))
+
+    async def disconnect(self):
+        if self._owns_session and self._session is not None and not self._session.closed:
+            await self._session.close()
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""
+分片运行
+按地址哈希把私钥集合确定性地分成 n 片，每个进程/机器只处理第 i 片，各自写结果文件，最后合并。
+同一个地址在任何机器上都落在同一片，分片数不变时重复运行的分配结果也不变
+"""
+
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from web3 import Web3
+
+RESULTS_FORMAT = "pharos-shard-results/1"
+
+
+def parse_shard(text: str) -> Tuple[int, int]:
+    """解析 "i/n" (i 从0开始)"""
+    index, _, count = (text or "0/1").partition("/")
+    index, count = int(index), int(count or 1)
+    if count < 1 or not 0 <= index < count:
+        raise ValueError(f"无效的分片: {text} (格式 i/n, 0 <= i < n)")
+    return index, count
+
+
+def shard_of(address: str, count: int) -> int:
+    """地址所属的分片: keccak(地址) 的前8字节对分片数取模"""
+    digest = Web3.keccak(hexstr=address)
+    return int.from_bytes(digest[:8], "big") % count
+
+
+def select_shard(private_keys: List[str], addresses: List[Optional[str]],
+                 index: int, count: int) -> List[str]:
+    """挑出属于第 index 片的私钥，无效私钥 (地址为None) 归第0片，由它报告错误"""
+    if count == 1:
+        return list(private_keys)
+    return [
+        private_key for private_key, address in zip(private_keys, addresses)
+        if (shard_of(address, count) if address else 0) == index
+    ]
+
+
+def shard_suffix(index: int, count: int) -> str:
+    return f".shard-{index}-of-{count}"
+
+
+def with_suffix(path: str, suffix: str) -> str:
+    """在扩展名前插入后缀: mint_journal.jsonl -> mint_journal.shard-0-of-4.jsonl"""
+    path = Path(path)
+    return str(path.with_name(path.stem + suffix + path.suffix))
+
+
+def write_shard_results(path: str, index: int, count: int, results: List[dict], **meta) -> Path:
+    """写入一个分片的结果文件 (先写临时文件再替换)"""
+    data = {"format": RESULTS_FORMAT, "shard": [index, count], "finished_at": datetime.now().isoformat()}
+    data.update(meta)
+    data["results"] = results
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(json.dumps(data, ensure_ascii=False, indent=1), encoding="utf-8")
+    os.replace(tmp_path, path)
+    return path
+
+
+def merge_shard_results(paths: Iterable[str]) -> dict:
+    """
+    合并各分片的结果文件，返回 {shards, missing, results, summary}
+
+    同一分片出现多次时以 finished_at 较晚的为准; missing 是没有结果文件的分片号
+    """
+    shards: Dict[int, dict] = {}
+    count = None
+    for path in paths:
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        if data.get("format") != RESULTS_FORMAT:
+            raise ValueError(f"不支持的结果文件格式: {path}")
+        index, shard_count = data["shard"]
+        if count is None:
+            count = shard_count
+        elif shard_count != count:
+            raise ValueError(f"分片数不一致: {path} 是 {shard_count} 片, 其他文件是 {count} 片")
+        current = shards.get(index)
+        if current is None or data["finished_at"] > current["finished_at"]:
+            shards[index] = data
+
+    results = [result for index in sorted(shards) for result in shards[index]["results"]]
+    summary: Dict[str, Dict[str, int]] = {}
+    for result in results:
+        stats = summary.setdefault(result["drop"], {"total": 0, "success": 0})
+        stats["total"] += 1
+        stats["success"] += int(result["success"])
+    return {
+        "shards": count or 0,
+        "missing": [index for index in range(count or 0) if index not in shards],
+        "seconds": max((data.get("seconds", 0) for data in shards.values()), default=0),
+        "results": results,
+        "summary": summary,
+    }
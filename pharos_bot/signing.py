@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""
+进程池签名
+secp256k1签名和keccak都是CPU密集型操作，RPC并发之后会成为瓶颈。
+签名请求先在事件循环里攒成块，再交给进程池并行处理，返回原始交易字节
+"""
+
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+import rlp
+from eth_account import Account
+from web3 import Web3
+
+
+def pool_context():
+    """
+    工作进程的启动方式: 进程池在事件循环和aiohttp会话 (及其DNS解析线程) 之后才创建，
+    fork 一个多线程进程可能死锁，所以改用 forkserver，不支持的平台用 spawn
+    """
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+def sign_chunk(jobs: List[Tuple[dict, str]]) -> List[bytes]:
+    """在工作进程中签名一批交易 (模块级函数，便于进程间pickle)"""
+    return [bytes(Account.sign_transaction(transaction, key).raw_transaction) for transaction, key in jobs]
+
+
+def decode_transaction(raw_transaction: str) -> dict:
+    """
+    把本项目签出的 legacy (EIP-155) 原始交易还原成可以重新签名的交易字段 (不含from)，
+    用于恢复上次运行留下的交易后继续提价替换; 其他类型的交易抛出 ValueError
+    """
+    raw = Web3.to_bytes(hexstr=raw_transaction)
+    if not raw or raw[0] < 0xc0:
+        raise ValueError("不是legacy交易")
+    nonce, gas_price, gas, to, value, data, v, _, _ = rlp.decode(raw)
+    v = int.from_bytes(v, "big")
+    if v < 35:
+        raise ValueError("交易没有EIP-155链ID")
+    return {
+        "to": Web3.to_checksum_address(to),
+        "data": Web3.to_hex(data),
+        "value": int.from_bytes(value, "big"),
+        "gas": int.from_bytes(gas, "big"),
+        "gasPrice": int.from_bytes(gas_price, "big"),
+        "chainId": (v - 35) // 2,
+        "nonce": int.from_bytes(nonce, "big"),
+    }
+
+
+class BatchSigner:
+    """
+    攒批的进程池签名器
+
+    workers<=1 时直接在当前进程签名，避免单核机器上的进程间开销
+    """
+
+    def __init__(self, workers: Optional[int] = None, chunk_size: int = 64, linger: float = 0.005):
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self.chunk_size = chunk_size
+        # 等待更多签名请求凑批的最长时间(秒)
+        self.linger = linger
+
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pending: List[Tuple[dict, str, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=pool_context())
+        return self._executor
+
+    @property
+    def pool(self) -> Optional[ProcessPoolExecutor]:
+        """供其他CPU密集任务 (如推导私钥地址) 复用的进程池; workers<=1 时为None，调用方直接在当前进程计算"""
+        return self.executor if self.workers > 1 else None
+
+    async def sign(self, transaction: dict, private_key: str) -> bytes:
+        """签名单笔交易，返回原始交易字节"""
+        if self.workers <= 1:
+            return sign_chunk([(transaction, private_key)])[0]
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((dict(transaction), private_key, future))
+        if len(self._pending) >= self.chunk_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.linger, self._flush)
+        return await future
+
+    async def sign_many(self, jobs: List[Tuple[dict, str]]) -> List[bytes]:
+        """一次性签名大量交易，按 chunk_size 分块分发到各个进程"""
+        if self.workers <= 1:
+            return sign_chunk(jobs)
+        loop = asyncio.get_running_loop()
+        chunks = [jobs[i:i + self.chunk_size] for i in range(0, len(jobs), self.chunk_size)]
+        results = await asyncio.gather(*(loop.run_in_executor(self.executor, sign_chunk, chunk) for chunk in chunks))
+        return [raw for chunk in results for raw in chunk]
+
+    def _flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        loop = asyncio.get_running_loop()
+        task = loop.run_in_executor(self.executor, sign_chunk, [(tx, key) for tx, key, _ in batch])
+
+        def deliver(done: asyncio.Future):
+            error = asyncio.CancelledError() if done.cancelled() else done.exception()
+            for index, (_, _, future) in enumerate(batch):
+                if future.done():
+                    continue
+                if error is not None:
+                    future.set_exception(error)
+                else:
+                    future.set_result(done.result()[index])
+
+        task.add_done_callback(deliver)
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""
+批量原生币转账
+资金钱包给多个钱包补充余额、或多个钱包把余额归集到一个地址时共用:
+本地连续分配nonce、进程池批量签名、JSON-RPC批量广播，再由共享的收据监听器统一等待确认
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, List, Optional, Tuple
+
+from web3 import AsyncWeb3, Web3
+
+from pharos_bot.nonces import NonceManager, is_nonce_error
+from pharos_bot.receipts import ReceiptWatcher
+from pharos_bot.signing import BatchSigner
+
+# 向普通地址转账的固定gas用量
+TRANSFER_GAS = 21000
+
+# eth_sendRawTransaction 的结果分类
+ACCEPTED = "accepted"  # 节点接受，或节点已经有这笔交易 (already known)
+NONCE_USED = "nonce_used"  # nonce已被使用: 可能就是这笔交易已经上链，也可能被其他交易占用
+REJECTED = "rejected"
+
+
+def broadcast_outcome(error: Any) -> Tuple[str, str]:
+    """
+    给 eth_sendRawTransaction 的结果分类，返回 (分类, 错误信息)
+
+    error 可以是批量响应里的 error 字段 (JSON-RPC错误对象)、单个请求抛出的异常或None
+    """
+    if isinstance(error, dict):
+        message = str(error.get("message", error))
+    else:
+        message = str(error or "")
+    if not message or "known" in message.lower():
+        return ACCEPTED, message
+    if is_nonce_error(Exception(message)):
+        return NONCE_USED, message
+    return REJECTED, message
+
+
+@dataclass
+class Transfer:
+    """一笔转账及其结果"""
+    sender: str
+    private_key: str = field(repr=False)
+    to: str
+    value: int
+    nonce: Optional[int] = None
+    tx_hash: Optional[str] = None
+    # 节点拒绝、等待超时或执行失败的原因
+    error: Optional[str] = None
+    confirmed: bool = False
+
+
+async def send_transfers(w3: AsyncWeb3, signer: BatchSigner, nonce_manager: NonceManager, watcher: ReceiptWatcher,
+                         transfers: List[Transfer], gas_price: int, chain_id: int,
+                         batch_size: int = 100, timeout: float = 120) -> List[Transfer]:
+    """
+    签名、广播并等待一批转账，结果写回每个 Transfer
+
+    同一发送方的多笔转账使用连续nonce一次全部发出; 某一笔被节点拒绝时释放它的nonce，
+    它后面的同一发送方交易会因为nonce空洞卡住直到超时，所以拒绝时只记录错误，不重试
+    """
+    jobs = []
+    for transfer in transfers:
+        transfer.nonce = await nonce_manager.allocate(transfer.sender)
+        jobs.append(({
+            "from": transfer.sender,
+            "to": transfer.to,
+            "value": transfer.value,
+            "gas": TRANSFER_GAS,
+            "gasPrice": gas_price,
+            "chainId": chain_id,
+            "nonce": transfer.nonce,
+        }, transfer.private_key))
+    raw_transactions = await signer.sign_many(jobs)
+    for transfer, raw_transaction in zip(transfers, raw_transactions):
+        transfer.tx_hash = Web3.to_hex(Web3.keccak(raw_transaction))
+
+    batches = [list(zip(transfers, raw_transactions))[i:i + batch_size] for i in range(0, len(transfers), batch_size)]
+    responses = await asyncio.gather(*(
+        w3.provider.make_batch_request([("eth_sendRawTransaction", [Web3.to_hex(raw)]) for _, raw in batch])
+        for batch in batches
+    ), return_exceptions=True)
+
+    accepted = []
+    for batch, response in zip(batches, responses):
+        if isinstance(response, BaseException) or not isinstance(response, list):
+            error = str(response) if isinstance(response, BaseException) else str(response.get("error"))
+            for transfer, _ in batch:
+                transfer.error = f"广播失败: {error}"
+            continue
+        for (transfer, _), item in zip(batch, response):
+            outcome, message = broadcast_outcome(item.get("error"))
+            if outcome == ACCEPTED:
+                accepted.append(transfer)
+            else:
+                transfer.error = f"广播失败: {message}"
+                nonce_manager.release(transfer.sender, transfer.nonce)
+
+    async def confirm(transfer: Transfer):
+        try:
+            receipt = await watcher.wait(transfer.tx_hash, timeout=timeout)
+        except asyncio.TimeoutError:
+            transfer.error = f"确认超时: {transfer.tx_hash}"
+            return
+        transfer.confirmed = receipt.status == 1
+        if not transfer.confirmed:
+            transfer.error = f"交易失败: {transfer.tx_hash}"
+
+    await asyncio.gather(*(confirm(transfer) for transfer in accepted))
+    return transfers
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""
+定时开始
+按目标区块号或链上时间戳等待开售: 离目标较远时稀疏地只查 eth_blockNumber，
+快到时按 poll_interval 紧密跟踪新区块，提前 prewarm_seconds 秒执行预热回调 (建立连接等)。
+
+区块号模式在当前区块到达目标的前一个区块时返回，让第一批交易赶上目标区块；
+时间戳模式按区块头推算链上时钟，链上时间到达目标时返回 -- 区块时间戳只精确到秒，
+提前发出的交易可能被打包进时间戳还没到的区块而revert，所以宁可晚一点也不提前
+"""
+
+import asyncio
+import time
+from datetime import datetime
+from typing import Awaitable, Callable, Optional
+
+from web3 import AsyncWeb3
+
+
+class StartTrigger:
+    """
+    block: 交易最早应被打包进的区块号 (当前区块到达 block-1 时触发)
+    timestamp: 领取条件生效的链上时间戳 (推算的链上时间到达它时触发)
+    """
+
+    def __init__(self, w3: AsyncWeb3, block: Optional[int] = None, timestamp: Optional[int] = None,
+                 poll_interval: float = 0.05, max_sleep: float = 5.0, prewarm_seconds: float = 5.0,
+                 sample_blocks: int = 50):
+        if (block is None) == (timestamp is None):
+            raise ValueError("需要且只能指定目标区块号或目标时间戳中的一个")
+        self.w3 = w3
+        self.block = block
+        self.timestamp = timestamp
+        self.poll_interval = poll_interval
+        self.max_sleep = max_sleep
+        self.prewarm_seconds = prewarm_seconds
+        self.sample_blocks = sample_blocks
+
+        # 最近看到的区块号和估算的出块间隔
+        self.head_number = 0
+        self.block_time = 1.0
+        # 本地时钟减链上时间: 取每次拿到区块头时 (本地时间 - 区块时间戳) 的最小值，
+        # 区块时间戳向下取整且有网络延迟，所以这个值只会偏大，推算的链上时间只会偏晚
+        self.clock_skew: Optional[float] = None
+
+    def _observe(self, head):
+        skew = time.time() - head["timestamp"]
+        self.clock_skew = skew if self.clock_skew is None else min(self.clock_skew, skew)
+
+    async def _sample(self):
+        """读取最新区块头，并用前 sample_blocks 个区块的时间差估算出块间隔"""
+        head = await self.w3.eth.get_block("latest")
+        self._observe(head)
+        self.head_number = head["number"]
+        span = min(self.sample_blocks, self.head_number)
+        if span > 0:
+            old = await self.w3.eth.get_block(self.head_number - span)
+            self.block_time = max(0.05, (head["timestamp"] - old["timestamp"]) / span)
+
+    def remaining(self) -> float:
+        """预计距离触发还有多少秒，<=0 表示应当立即触发"""
+        if self.block is not None:
+            return (self.block - 1 - self.head_number) * self.block_time
+        return self.timestamp - (time.time() - self.clock_skew)
+
+    async def _refresh(self, precise: bool):
+        """
+        更新当前区块; 时间戳模式下接近目标时 (precise) 每个新区块取一次完整区块头校准链上时钟，
+        平时只查区块号
+        """
+        number = await self.w3.eth.block_number
+        if number == self.head_number:
+            return
+        self.head_number = number
+        if self.timestamp is not None and precise:
+            self._observe(await self.w3.eth.get_block(number))
+
+    async def wait(self, prewarm: Optional[Callable[[], Awaitable]] = None,
+                   on_progress: Optional[Callable[[int, float], None]] = None,
+                   progress_every: float = 10.0) -> int:
+        """
+        等到触发点，返回触发时看到的区块号
+
+        prewarm 在预计触发前 prewarm_seconds 秒执行一次；on_progress(区块号, 剩余秒数) 每 progress_every 秒回调一次
+        """
+        await self._sample()
+        warmed = prewarm is None
+        last_progress = 0.0
+        while True:
+            remaining = self.remaining()
+            if remaining <= 0:
+                return self.head_number
+
+            if not warmed and remaining <= self.prewarm_seconds:
+                warmed = True
+                await prewarm()
+                continue
+
+            now = time.monotonic()
+            if on_progress is not None and now - last_progress >= progress_every:
+                last_progress = now
+                on_progress(self.head_number, remaining)
+
+            # 离目标超过两个区块时按剩余时间稀疏轮询，之后每 poll_interval 秒查一次
+            near = remaining <= 2 * self.block_time
+            if near:
+                delay = self.poll_interval
+            else:
+                delay = min(self.max_sleep, remaining - 2 * self.block_time)
+                if not warmed:
+                    delay = min(delay, max(self.poll_interval, remaining - self.prewarm_seconds))
+            await asyncio.sleep(max(self.poll_interval, delay))
+            await self._refresh(precise=near)
+
+
+def parse_start_target(text: str):
+    """
+    解析开始条件，返回 (区块号, 时间戳)，其中最多一个不为None:
+    纯数字小于10亿视为区块号，否则视为Unix时间戳；也可以写本地时间如 "2026-10-20 20:00"
+    """
+    text = (text or "").strip()
+    if not text:
+        return None, None
+    if text.isdigit():
+        value = int(text)
+        return (value, None) if value < 1_000_000_000 else (None, value)
+    return None, int(datetime.fromisoformat(text).timestamp())